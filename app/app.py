@@ -8,6 +8,7 @@ from app.states.analytics_state import AnalyticsState
 from app.states.reports_state import ReportsState
 from app.states.post_assessment_state import PostAssessmentState
 from app.states.historical_state import HistoricalState
+from app.utils import migrations, precompute
 
 
 def branding_section() -> rx.Component:
@@ -109,6 +110,8 @@ app = rx.App(
         ),
     ],
 )
+app.register_lifespan_task(migrations.run_on_startup)
+app.register_lifespan_task(precompute.run_nightly)
 app.add_page(landing_page, route="/")
 
 
@@ -524,7 +524,8 @@ def analytics_content_ui() -> rx.Component:
                 class_name="mb-4",
             ),
             rx.cond(
-                AnalyticsState.is_generating_recommendations,
+                AnalyticsState.is_generating_recommendations
+                & (AnalyticsState.ai_recommendations.length() == 0),
                 rx.el.div(
                     rx.el.div(
                         rx.el.div(
@@ -1,7 +1,52 @@
 import reflex as rx
-from app.states.dashboard_state import DashboardState
+from app.states.dashboard_state import (
+    AUTOSAVE_FORM_ID,
+    AUTOSAVE_IDLE_MS,
+    FIELD_STATES,
+    DashboardState,
+    EmployabilityLensState,
+    FormalAssessmentState,
+    GlobalEngagementLensState,
+    LearningExperienceLensState,
+    ResearchLensState,
+    SustainabilityLensState,
+)
 from app.states.hei_state import HEIState
 from app.components.design_system import DS
+from app.utils import scoring
+from app.utils.scoring_js import build_scoring_script
+
+
+def score_value(key: str) -> rx.Component:
+    """Empty span that the client scoring module fills with a live score."""
+    return rx.el.span(custom_attrs={"data-score": key})
+
+
+def score_bar(key: str, max_points: float, class_name: str) -> rx.Component:
+    """Progress bar whose width the client scoring module keeps at score / max."""
+    return rx.el.div(
+        class_name=class_name,
+        custom_attrs={"data-score-bar": key, "data-score-max": str(max_points)},
+    )
+
+
+def formal_total_weighted_score() -> rx.Var:
+    """Weighted formal-path total, evaluated in the browser from the lens inputs."""
+    lens_inputs = (
+        FormalAssessmentState.formal_research_score,
+        FormalAssessmentState.formal_employability_score,
+        FormalAssessmentState.formal_global_engagement_score,
+        FormalAssessmentState.formal_learning_experience_score,
+        FormalAssessmentState.formal_sustainability_score,
+    )
+    weighted = sum(
+        (
+            value.to(int) * int(round(weight * 100))
+            for value, weight in zip(lens_inputs, scoring.LENS_WEIGHTS)
+        ),
+        rx.Var.create(0),
+    )
+    return weighted / 100
 
 
 def numeric_input_metric(
@@ -9,9 +54,12 @@ def numeric_input_metric(
     value: rx.Var,
     points: rx.Var,
     max_points: int,
-    on_change: rx.event.EventType,
+    on_change: rx.event.EventType | None = None,
 ) -> rx.Component:
-    """Numeric text input for weighted metrics with real-time feedback and validation warnings."""
+    """Numeric text input for weighted metrics with real-time feedback and validation warnings.
+
+    Without on_change the input belongs to the autosave form and is sent in batches.
+    """
     field_key_map = {
         "Academic Reputation": "academic_reputation",
         "Domestic Nominations": "domestic_nominations",
@@ -30,6 +78,11 @@ def numeric_input_metric(
     field_key = field_key_map.get(label, "")
     error_msg = DashboardState.validation_errors[field_key]
     has_error = error_msg != ""
+    input_props = (
+        {"on_change": on_change.debounce(300)}
+        if on_change is not None
+        else {"name": field_key, "form": AUTOSAVE_FORM_ID}
+    )
     return rx.el.div(
         rx.el.div(
             rx.el.label(
@@ -49,7 +102,6 @@ def numeric_input_metric(
             rx.el.div(
                 rx.el.input(
                     type="number",
-                    on_change=on_change.debounce(300),
                     min=0,
                     max=100,
                     placeholder="0-100",
@@ -59,6 +111,7 @@ def numeric_input_metric(
                         f"w-full px-4 py-2.5 bg-{DS.NEUTRAL_LIGHT} border border-{DS.BORDER} rounded-xl focus:ring-4 focus:ring-blue-100 focus:border-{DS.PRIMARY} outline-none transition-all text-center text-lg font-bold text-slate-900",
                     ),
                     default_value=rx.cond(value == 0, "", value.to_string()),
+                    **input_props,
                 ),
                 class_name="relative",
             ),
@@ -81,7 +134,7 @@ def numeric_input_metric(
 
 
 def text_metric_card(
-    label: str, placeholder: str, value: rx.Var, on_change: rx.event.EventType
+    label: str, placeholder: str, value: rx.Var, name: str
 ) -> rx.Component:
     """Styled text input card used for qualitative/tracked metrics (0% weight)."""
     return rx.el.div(
@@ -103,7 +156,8 @@ def text_metric_card(
                 type="text",
                 placeholder=placeholder,
                 default_value=value,
-                on_change=on_change.debounce(300),
+                name=name,
+                form=AUTOSAVE_FORM_ID,
                 class_name="w-full text-center text-base font-bold text-slate-800 bg-slate-50 border border-slate-200 rounded-lg py-2.5 focus:border-blue-500 focus:ring-4 focus:ring-blue-100 outline-none transition-all shadow-inner hover:border-slate-300",
             ),
             class_name="relative",
@@ -129,23 +183,23 @@ def file_upload_section(
     """Reusable file upload section with auto-upload and progress indicator."""
     progress_var = rx.match(
         upload_id,
-        ("upload_research", DashboardState.upload_progress_research),
-        ("upload_employability", DashboardState.upload_progress_employability),
-        ("upload_global_engagement", DashboardState.upload_progress_global_engagement),
+        ("upload_research", ResearchLensState.upload_progress_research),
+        ("upload_employability", EmployabilityLensState.upload_progress_employability),
+        ("upload_global_engagement", GlobalEngagementLensState.upload_progress_global_engagement),
         (
             "upload_learning_experience",
-            DashboardState.upload_progress_learning_experience,
+            LearningExperienceLensState.upload_progress_learning_experience,
         ),
-        ("upload_sustainability", DashboardState.upload_progress_sustainability),
+        ("upload_sustainability", SustainabilityLensState.upload_progress_sustainability),
         0,
     )
     count_var = rx.match(
         upload_id,
-        ("upload_research", DashboardState.upload_count_research),
-        ("upload_employability", DashboardState.upload_count_employability),
-        ("upload_global_engagement", DashboardState.upload_count_global_engagement),
-        ("upload_learning_experience", DashboardState.upload_count_learning_experience),
-        ("upload_sustainability", DashboardState.upload_count_sustainability),
+        ("upload_research", ResearchLensState.upload_count_research),
+        ("upload_employability", EmployabilityLensState.upload_count_employability),
+        ("upload_global_engagement", GlobalEngagementLensState.upload_count_global_engagement),
+        ("upload_learning_experience", LearningExperienceLensState.upload_count_learning_experience),
+        ("upload_sustainability", SustainabilityLensState.upload_count_sustainability),
         "",
     )
     return rx.el.div(
@@ -263,15 +317,17 @@ def progress_tracker() -> rx.Component:
                 class_name="text-sm font-medium text-gray-700 mb-1",
             ),
             rx.el.div(
-                f"{DashboardState.progress}%",
+                score_value("progress"),
+                "%",
                 class_name="text-sm font-bold text-emerald-600",
             ),
             class_name="flex justify-between items-center",
         ),
         rx.el.div(
-            rx.el.div(
+            score_bar(
+                "progress",
+                100,
                 class_name="bg-emerald-500 h-2.5 rounded-full transition-all duration-500 ease-in-out",
-                style={"width": f"{DashboardState.progress}%"},
             ),
             class_name="w-full bg-gray-200 rounded-full h-2.5",
         ),
@@ -640,6 +696,21 @@ def bottom_action_bar() -> rx.Component:
                                 class_name="text-xs font-bold text-emerald-500",
                             ),
                         ),
+                        rx.cond(
+                            DashboardState.autosave_error != "",
+                            rx.el.span(
+                                DashboardState.autosave_error,
+                                class_name="text-[10px] text-red-500",
+                            ),
+                            rx.cond(
+                                DashboardState.last_autosaved != "",
+                                rx.el.span(
+                                    "Autosaved ",
+                                    DashboardState.last_autosaved,
+                                    class_name="text-[10px] text-gray-400",
+                                ),
+                            ),
+                        ),
                         class_name="flex flex-col mr-8 shrink-0",
                     ),
                     progress_tracker(),
@@ -662,7 +733,9 @@ def bottom_action_bar() -> rx.Component:
                                 class_name="flex items-center",
                             ),
                         ),
-                        on_click=DashboardState.save_progress,
+                        on_click=rx.call_script(
+                            _FORM_VALUES_SCRIPT, callback=DashboardState.save_progress
+                        ),
                         disabled=DashboardState.is_saving
                         | DashboardState.has_validation_errors,
                         class_name=rx.cond(
@@ -693,6 +766,59 @@ def bottom_action_bar() -> rx.Component:
     )
 
 
+_FORM_VALUES_SCRIPT = (
+    f'Object.fromEntries(new FormData(document.getElementById("{AUTOSAVE_FORM_ID}")))'
+)
+
+_AUTOSAVE_SCRIPT = """
+if (!window.__assessmentAutosave) {
+  window.__assessmentAutosave = true;
+  let timer = null;
+  const flush = () => {
+    const form = document.getElementById("FORM_ID");
+    if (timer !== null && form) {
+      clearTimeout(timer);
+      timer = null;
+      form.requestSubmit();
+    }
+  };
+  document.addEventListener("input", (event) => {
+    const form = event.target.form;
+    if (!form || form.id !== "FORM_ID") return;
+    clearTimeout(timer);
+    timer = setTimeout(flush, IDLE_MS);
+  });
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") flush();
+  });
+}
+""".replace("FORM_ID", AUTOSAVE_FORM_ID).replace("IDLE_MS", str(AUTOSAVE_IDLE_MS))
+
+
+def autosave_form() -> rx.Component:
+    """Hidden form that owns the assessment inputs through their form attribute.
+
+    The inputs are uncontrolled and a client script submits the form once
+    typing has been idle, so the server gets one event per batch of edits.
+    data-values carries the last server values so the scoring module can
+    score fields that are not currently rendered.
+    """
+    server_values = rx.Var.create(
+        {code: getattr(FIELD_STATES[code], code) for code in scoring.INPUT_CODES}
+    )
+    return rx.fragment(
+        rx.el.form(
+            id=AUTOSAVE_FORM_ID,
+            on_submit=DashboardState.apply_form_edits,
+            reset_on_submit=False,
+            class_name="hidden",
+            custom_attrs={"data-values": server_values.to_string()},
+        ),
+        rx.script(_AUTOSAVE_SCRIPT),
+        rx.script(build_scoring_script(AUTOSAVE_FORM_ID)),
+    )
+
+
 def data_entry_forms() -> rx.Component:
     """Main data entry area split by thematic sections using a 2-column layout."""
     return rx.el.div(
@@ -728,7 +854,7 @@ def data_entry_forms() -> rx.Component:
                             ),
                             rx.el.div(
                                 rx.el.span(
-                                    DashboardState.academic_reputation_points,
+                                    score_value("academic_reputation"),
                                     class_name=f"text-lg font-black text-{DS.PRIMARY}",
                                 ),
                                 rx.el.span(
@@ -742,17 +868,15 @@ def data_entry_forms() -> rx.Component:
                         rx.el.div(
                             numeric_input_metric(
                                 label="International Nominations",
-                                value=DashboardState.international_nominations,
-                                points=DashboardState.international_nominations_points,
+                                value=ResearchLensState.international_nominations,
+                                points=score_value("international_nominations"),
                                 max_points=25.5,
-                                on_change=DashboardState.set_international_nominations,
                             ),
                             numeric_input_metric(
                                 label="Domestic Nominations",
-                                value=DashboardState.domestic_nominations,
-                                points=DashboardState.domestic_nominations_points,
+                                value=ResearchLensState.domestic_nominations,
+                                points=score_value("domestic_nominations"),
                                 max_points=4.5,
-                                on_change=DashboardState.set_domestic_nominations,
                             ),
                             class_name="grid grid-cols-1 sm:grid-cols-2 gap-4",
                         ),
@@ -760,10 +884,9 @@ def data_entry_forms() -> rx.Component:
                     ),
                     numeric_input_metric(
                         label="Citations per Faculty",
-                        value=DashboardState.citations_per_faculty,
-                        points=DashboardState.citations_per_faculty_points,
+                        value=ResearchLensState.citations_per_faculty,
+                        points=score_value("citations_per_faculty"),
                         max_points=20,
-                        on_change=DashboardState.set_citations_per_faculty,
                     ),
                     rx.el.div(
                         rx.el.div(
@@ -772,17 +895,17 @@ def data_entry_forms() -> rx.Component:
                                 class_name="text-sm font-semibold text-gray-500 uppercase tracking-wider",
                             ),
                             rx.el.p(
-                                f"{DashboardState.research_section_total} / 50 pts",
+                                score_value("research_score"),
+                                " / 50 pts",
                                 class_name="text-xl font-black text-gray-900",
                             ),
                             class_name="flex flex-col",
                         ),
                         rx.el.div(
-                            rx.el.div(
+                            score_bar(
+                                "research_score",
+                                50,
                                 class_name="bg-blue-600 h-2 rounded-full transition-all duration-300",
-                                style={
-                                    "width": f"{DashboardState.research_section_total / 50 * 100}%"
-                                },
                             ),
                             class_name="w-full bg-gray-200 rounded-full h-2 mt-2",
                         ),
@@ -794,10 +917,10 @@ def data_entry_forms() -> rx.Component:
                     file_upload_section(
                         label="Research Evidence (Reports, Certifications)",
                         upload_id="upload_research",
-                        handle_upload_event=DashboardState.handle_research_upload,
-                        uploaded_files=DashboardState.uploaded_research_files,
-                        is_uploading=DashboardState.is_uploading_research,
-                        delete_event=DashboardState.delete_research_file,
+                        handle_upload_event=ResearchLensState.handle_research_upload,
+                        uploaded_files=ResearchLensState.uploaded_research_files,
+                        is_uploading=ResearchLensState.is_uploading_research,
+                        delete_event=ResearchLensState.delete_research_file,
                     ),
                     class_name="p-5 bg-gray-50 rounded-2xl border border-gray-100 shadow-sm",
                 ),
@@ -837,7 +960,7 @@ def data_entry_forms() -> rx.Component:
                             ),
                             rx.el.div(
                                 rx.el.span(
-                                    DashboardState.employer_reputation_points,
+                                    score_value("employer_reputation"),
                                     class_name=f"text-lg font-black text-{DS.PRIMARY}",
                                 ),
                                 rx.el.span(
@@ -851,17 +974,15 @@ def data_entry_forms() -> rx.Component:
                         rx.el.div(
                             numeric_input_metric(
                                 label="Employer Domestic Nominations",
-                                value=DashboardState.employer_domestic_nominations,
-                                points=DashboardState.employer_domestic_nominations_points,
+                                value=EmployabilityLensState.employer_domestic_nominations,
+                                points=score_value("employer_domestic_nominations"),
                                 max_points=7.5,
-                                on_change=DashboardState.set_employer_domestic_nominations,
                             ),
                             numeric_input_metric(
                                 label="Employer International Nominations",
-                                value=DashboardState.employer_international_nominations,
-                                points=DashboardState.employer_international_nominations_points,
+                                value=EmployabilityLensState.employer_international_nominations,
+                                points=score_value("employer_international_nominations"),
                                 max_points=7.5,
-                                on_change=DashboardState.set_employer_international_nominations,
                             ),
                             class_name="grid grid-cols-1 sm:grid-cols-2 gap-4",
                         ),
@@ -869,10 +990,9 @@ def data_entry_forms() -> rx.Component:
                     ),
                     numeric_input_metric(
                         label="Employment Outcomes",
-                        value=DashboardState.employment_outcomes,
-                        points=DashboardState.employment_outcomes_points,
+                        value=EmployabilityLensState.employment_outcomes,
+                        points=score_value("employment_outcomes"),
                         max_points=5,
-                        on_change=DashboardState.set_employment_outcomes,
                     ),
                     rx.el.div(
                         rx.el.div(
@@ -881,17 +1001,17 @@ def data_entry_forms() -> rx.Component:
                                 class_name="text-sm font-semibold text-gray-500 uppercase tracking-wider",
                             ),
                             rx.el.p(
-                                f"{DashboardState.employability_section_total} / 20 pts",
+                                score_value("employability_score"),
+                                " / 20 pts",
                                 class_name="text-xl font-black text-gray-900",
                             ),
                             class_name="flex flex-col",
                         ),
                         rx.el.div(
-                            rx.el.div(
+                            score_bar(
+                                "employability_score",
+                                20,
                                 class_name="bg-blue-600 h-2 rounded-full transition-all duration-300",
-                                style={
-                                    "width": f"{DashboardState.employability_section_total / 20 * 100}%"
-                                },
                             ),
                             class_name="w-full bg-gray-200 rounded-full h-2 mt-2",
                         ),
@@ -903,10 +1023,10 @@ def data_entry_forms() -> rx.Component:
                     file_upload_section(
                         label="Employability Evidence (Survey Data, Testimonials)",
                         upload_id="upload_employability",
-                        handle_upload_event=DashboardState.handle_employability_upload,
-                        uploaded_files=DashboardState.uploaded_employability_files,
-                        is_uploading=DashboardState.is_uploading_employability,
-                        delete_event=DashboardState.delete_employability_file,
+                        handle_upload_event=EmployabilityLensState.handle_employability_upload,
+                        uploaded_files=EmployabilityLensState.uploaded_employability_files,
+                        is_uploading=EmployabilityLensState.is_uploading_employability,
+                        delete_event=EmployabilityLensState.delete_employability_file,
                     ),
                     class_name="p-5 bg-gray-50 rounded-2xl border border-gray-100 shadow-sm",
                 ),
@@ -933,30 +1053,27 @@ def data_entry_forms() -> rx.Component:
                 rx.el.div(
                     numeric_input_metric(
                         label="International Research Network",
-                        value=DashboardState.international_research_network,
-                        points=DashboardState.international_research_network_points,
+                        value=GlobalEngagementLensState.international_research_network,
+                        points=score_value("international_research_network"),
                         max_points=5,
-                        on_change=DashboardState.set_international_research_network,
                     ),
                     numeric_input_metric(
                         label="International Faculty Ratio",
-                        value=DashboardState.international_faculty_ratio,
-                        points=DashboardState.international_faculty_ratio_points,
+                        value=GlobalEngagementLensState.international_faculty_ratio,
+                        points=score_value("international_faculty_ratio"),
                         max_points=5,
-                        on_change=DashboardState.set_international_faculty_ratio,
                     ),
                     numeric_input_metric(
                         label="International Student Ratio",
-                        value=DashboardState.international_student_ratio,
-                        points=DashboardState.international_student_ratio_points,
+                        value=GlobalEngagementLensState.international_student_ratio,
+                        points=score_value("international_student_ratio"),
                         max_points=5,
-                        on_change=DashboardState.set_international_student_ratio,
                     ),
                     text_metric_card(
                         "International Student Diversity",
                         "e.g. 45 countries (Count and Origin)",
-                        DashboardState.international_student_diversity,
-                        DashboardState.set_international_student_diversity,
+                        GlobalEngagementLensState.international_student_diversity,
+                        "international_student_diversity",
                     ),
                     rx.el.div(
                         rx.el.div(
@@ -965,17 +1082,17 @@ def data_entry_forms() -> rx.Component:
                                 class_name="text-sm font-semibold text-gray-500 uppercase tracking-wider",
                             ),
                             rx.el.p(
-                                f"{DashboardState.global_engagement_section_total} / 15 pts",
+                                score_value("global_engagement_score"),
+                                " / 15 pts",
                                 class_name="text-xl font-black text-gray-900",
                             ),
                             class_name="flex flex-col",
                         ),
                         rx.el.div(
-                            rx.el.div(
+                            score_bar(
+                                "global_engagement_score",
+                                15,
                                 class_name="bg-blue-600 h-2 rounded-full transition-all duration-300",
-                                style={
-                                    "width": f"{DashboardState.global_engagement_section_total / 15 * 100}%"
-                                },
                             ),
                             class_name="w-full bg-gray-200 rounded-full h-2 mt-2",
                         ),
@@ -987,10 +1104,10 @@ def data_entry_forms() -> rx.Component:
                     file_upload_section(
                         label="Global Engagement Evidence (Partnerships, Agreements)",
                         upload_id="upload_global_engagement",
-                        handle_upload_event=DashboardState.handle_global_engagement_upload,
-                        uploaded_files=DashboardState.uploaded_global_engagement_files,
-                        is_uploading=DashboardState.is_uploading_global_engagement,
-                        delete_event=DashboardState.delete_global_engagement_file,
+                        handle_upload_event=GlobalEngagementLensState.handle_global_engagement_upload,
+                        uploaded_files=GlobalEngagementLensState.uploaded_global_engagement_files,
+                        is_uploading=GlobalEngagementLensState.is_uploading_global_engagement,
+                        delete_event=GlobalEngagementLensState.delete_global_engagement_file,
                     ),
                     class_name="p-5 bg-gray-50 rounded-2xl border border-gray-100 shadow-sm",
                 ),
@@ -1017,10 +1134,9 @@ def data_entry_forms() -> rx.Component:
                 rx.el.div(
                     numeric_input_metric(
                         label="Faculty-Student Ratio",
-                        value=DashboardState.faculty_student_ratio,
-                        points=DashboardState.faculty_student_ratio_points,
+                        value=LearningExperienceLensState.faculty_student_ratio,
+                        points=score_value("faculty_student_ratio"),
                         max_points=10,
-                        on_change=DashboardState.set_faculty_student_ratio,
                     ),
                     rx.el.div(
                         rx.el.div(
@@ -1029,17 +1145,17 @@ def data_entry_forms() -> rx.Component:
                                 class_name="text-sm font-semibold text-gray-500 uppercase tracking-wider",
                             ),
                             rx.el.p(
-                                f"{DashboardState.learning_experience_section_total} / 10 pts",
+                                score_value("learning_experience_score"),
+                                " / 10 pts",
                                 class_name="text-xl font-black text-gray-900",
                             ),
                             class_name="flex flex-col",
                         ),
                         rx.el.div(
-                            rx.el.div(
+                            score_bar(
+                                "learning_experience_score",
+                                10,
                                 class_name="bg-blue-600 h-2 rounded-full transition-all duration-300",
-                                style={
-                                    "width": f"{DashboardState.learning_experience_section_total / 10 * 100}%"
-                                },
                             ),
                             class_name="w-full bg-gray-200 rounded-full h-2 mt-2",
                         ),
@@ -1051,10 +1167,10 @@ def data_entry_forms() -> rx.Component:
                     file_upload_section(
                         label="Learning Experience Evidence (Class Size Reports, Faculty Data)",
                         upload_id="upload_learning_experience",
-                        handle_upload_event=DashboardState.handle_learning_experience_upload,
-                        uploaded_files=DashboardState.uploaded_learning_experience_files,
-                        is_uploading=DashboardState.is_uploading_learning_experience,
-                        delete_event=DashboardState.delete_learning_experience_file,
+                        handle_upload_event=LearningExperienceLensState.handle_learning_experience_upload,
+                        uploaded_files=LearningExperienceLensState.uploaded_learning_experience_files,
+                        is_uploading=LearningExperienceLensState.is_uploading_learning_experience,
+                        delete_event=LearningExperienceLensState.delete_learning_experience_file,
                     ),
                     class_name="p-5 bg-gray-50 rounded-2xl border border-gray-100 shadow-sm",
                 ),
@@ -1080,10 +1196,9 @@ def data_entry_forms() -> rx.Component:
                 rx.el.div(
                     numeric_input_metric(
                         label="Sustainability Metrics Score",
-                        value=DashboardState.sustainability_metrics,
-                        points=DashboardState.sustainability_metrics_points,
+                        value=SustainabilityLensState.sustainability_metrics,
+                        points=score_value("sustainability_metrics"),
                         max_points=5,
-                        on_change=DashboardState.set_sustainability_metrics,
                     ),
                     rx.el.div(
                         rx.el.div(
@@ -1092,17 +1207,17 @@ def data_entry_forms() -> rx.Component:
                                 class_name="text-sm font-semibold text-gray-500 uppercase tracking-wider",
                             ),
                             rx.el.p(
-                                f"{DashboardState.sustainability_section_total} / 5 pts",
+                                score_value("sustainability_score"),
+                                " / 5 pts",
                                 class_name="text-xl font-black text-gray-900",
                             ),
                             class_name="flex flex-col",
                         ),
                         rx.el.div(
-                            rx.el.div(
+                            score_bar(
+                                "sustainability_score",
+                                5,
                                 class_name="bg-blue-600 h-2 rounded-full transition-all duration-300",
-                                style={
-                                    "width": f"{DashboardState.sustainability_section_total / 5 * 100}%"
-                                },
                             ),
                             class_name="w-full bg-gray-200 rounded-full h-2 mt-2",
                         ),
@@ -1114,10 +1229,10 @@ def data_entry_forms() -> rx.Component:
                     file_upload_section(
                         label="Sustainability Evidence (ESG Reports, Environmental Certifications)",
                         upload_id="upload_sustainability",
-                        handle_upload_event=DashboardState.handle_sustainability_upload,
-                        uploaded_files=DashboardState.uploaded_sustainability_files,
-                        is_uploading=DashboardState.is_uploading_sustainability,
-                        delete_event=DashboardState.delete_sustainability_file,
+                        handle_upload_event=SustainabilityLensState.handle_sustainability_upload,
+                        uploaded_files=SustainabilityLensState.uploaded_sustainability_files,
+                        is_uploading=SustainabilityLensState.is_uploading_sustainability,
+                        delete_event=SustainabilityLensState.delete_sustainability_file,
                     ),
                     class_name="p-5 bg-gray-50 rounded-2xl border border-gray-100 shadow-sm",
                 ),
@@ -1136,17 +1251,17 @@ def dashboard_stat_cards() -> rx.Component:
     return rx.el.div(
         ds_stat_card(
             title="Completion Rate",
-            value=f"{DashboardState.progress}%",
+            value=rx.fragment(score_value("progress"), "%"),
             icon="circle_check",
             color_variant="success",
         ),
         ds_stat_card(
             title="Evidence Files",
-            value=DashboardState.uploaded_research_files.length()
-            + DashboardState.uploaded_employability_files.length()
-            + DashboardState.uploaded_global_engagement_files.length()
-            + DashboardState.uploaded_learning_experience_files.length()
-            + DashboardState.uploaded_sustainability_files.length(),
+            value=ResearchLensState.uploaded_research_files.length()
+            + EmployabilityLensState.uploaded_employability_files.length()
+            + GlobalEngagementLensState.uploaded_global_engagement_files.length()
+            + LearningExperienceLensState.uploaded_learning_experience_files.length()
+            + SustainabilityLensState.uploaded_sustainability_files.length(),
             icon="file-check-2",
             color_variant="primary",
         ),
@@ -1219,7 +1334,8 @@ def formal_assessment_form() -> rx.Component:
                         class_name="text-[10px] font-bold text-slate-400 uppercase tracking-widest mb-1",
                     ),
                     rx.el.p(
-                        f"{DashboardState.formal_total_weighted_score} / 100",
+                        formal_total_weighted_score(),
+                        " / 100",
                         class_name="text-3xl font-black text-blue-600",
                     ),
                     class_name="bg-blue-50 px-6 py-4 rounded-2xl border border-blue-100 text-right",
@@ -1231,98 +1347,98 @@ def formal_assessment_form() -> rx.Component:
             rx.el.div(
                 numeric_input_metric(
                     "Research & Discovery (50%)",
-                    DashboardState.formal_research_score,
-                    rx.Var.create(DashboardState.formal_research_score.to(float) * 0.5),
+                    FormalAssessmentState.formal_research_score,
+                    rx.Var.create(FormalAssessmentState.formal_research_score.to(float) * 0.5),
                     50,
-                    DashboardState.set_formal_research_score,
+                    FormalAssessmentState.set_formal_research_score,
                 ),
                 file_upload_section(
                     "Research Evidence",
                     "upload_formal_research",
-                    DashboardState.handle_formal_research_upload,
-                    DashboardState.uploaded_formal_research_files,
-                    DashboardState.is_uploading_formal_research,
-                    DashboardState.delete_formal_research_file,
+                    FormalAssessmentState.handle_formal_research_upload,
+                    FormalAssessmentState.uploaded_formal_research_files,
+                    FormalAssessmentState.is_uploading_formal_research,
+                    FormalAssessmentState.delete_formal_research_file,
                 ),
                 class_name="space-y-4",
             ),
             rx.el.div(
                 numeric_input_metric(
                     "Employability & Outcomes (20%)",
-                    DashboardState.formal_employability_score,
+                    FormalAssessmentState.formal_employability_score,
                     rx.Var.create(
-                        DashboardState.formal_employability_score.to(float) * 0.2
+                        FormalAssessmentState.formal_employability_score.to(float) * 0.2
                     ),
                     20,
-                    DashboardState.set_formal_employability_score,
+                    FormalAssessmentState.set_formal_employability_score,
                 ),
                 file_upload_section(
                     "Employability Evidence",
                     "upload_formal_employability",
-                    DashboardState.handle_formal_employability_upload,
-                    DashboardState.uploaded_formal_employability_files,
-                    DashboardState.is_uploading_formal_employability,
-                    DashboardState.delete_formal_employability_file,
+                    FormalAssessmentState.handle_formal_employability_upload,
+                    FormalAssessmentState.uploaded_formal_employability_files,
+                    FormalAssessmentState.is_uploading_formal_employability,
+                    FormalAssessmentState.delete_formal_employability_file,
                 ),
                 class_name="space-y-4",
             ),
             rx.el.div(
                 numeric_input_metric(
                     "Global Engagement (15%)",
-                    DashboardState.formal_global_engagement_score,
+                    FormalAssessmentState.formal_global_engagement_score,
                     rx.Var.create(
-                        DashboardState.formal_global_engagement_score.to(float) * 0.15
+                        FormalAssessmentState.formal_global_engagement_score.to(float) * 0.15
                     ),
                     15,
-                    DashboardState.set_formal_global_engagement_score,
+                    FormalAssessmentState.set_formal_global_engagement_score,
                 ),
                 file_upload_section(
                     "Global Engagement Evidence",
                     "upload_formal_global",
-                    DashboardState.handle_formal_global_upload,
-                    DashboardState.uploaded_formal_global_files,
-                    DashboardState.is_uploading_formal_global,
-                    DashboardState.delete_formal_global_file,
+                    FormalAssessmentState.handle_formal_global_upload,
+                    FormalAssessmentState.uploaded_formal_global_files,
+                    FormalAssessmentState.is_uploading_formal_global,
+                    FormalAssessmentState.delete_formal_global_file,
                 ),
                 class_name="space-y-4",
             ),
             rx.el.div(
                 numeric_input_metric(
                     "Learning Experience (10%)",
-                    DashboardState.formal_learning_experience_score,
+                    FormalAssessmentState.formal_learning_experience_score,
                     rx.Var.create(
-                        DashboardState.formal_learning_experience_score.to(float) * 0.1
+                        FormalAssessmentState.formal_learning_experience_score.to(float) * 0.1
                     ),
                     10,
-                    DashboardState.set_formal_learning_experience_score,
+                    FormalAssessmentState.set_formal_learning_experience_score,
                 ),
                 file_upload_section(
                     "Learning Experience Evidence",
                     "upload_formal_learning",
-                    DashboardState.handle_formal_learning_upload,
-                    DashboardState.uploaded_formal_learning_files,
-                    DashboardState.is_uploading_formal_learning,
-                    DashboardState.delete_formal_learning_file,
+                    FormalAssessmentState.handle_formal_learning_upload,
+                    FormalAssessmentState.uploaded_formal_learning_files,
+                    FormalAssessmentState.is_uploading_formal_learning,
+                    FormalAssessmentState.delete_formal_learning_file,
                 ),
                 class_name="space-y-4",
             ),
             rx.el.div(
                 numeric_input_metric(
                     "Sustainability (5%)",
-                    DashboardState.formal_sustainability_score,
+                    FormalAssessmentState.formal_sustainability_score,
                     rx.Var.create(
-                        DashboardState.formal_sustainability_score.to(float) * 0.05
+                        FormalAssessmentState.formal_sustainability_score.to(float) * 0.05
                     ),
                     5,
-                    DashboardState.set_formal_sustainability_score,
+                    FormalAssessmentState.set_formal_sustainability_score,
                 ),
                 file_upload_section(
                     "Sustainability Evidence",
                     "upload_formal_sustainability",
-                    DashboardState.handle_formal_sustainability_upload,
-                    DashboardState.uploaded_formal_sustainability_files,
-                    DashboardState.is_uploading_formal_sustainability,
-                    DashboardState.delete_formal_sustainability_file,
+                    FormalAssessmentState.handle_formal_sustainability_upload,
+                    FormalAssessmentState.uploaded_formal_sustainability_files,
+                    FormalAssessmentState.is_uploading_formal_sustainability,
+                    FormalAssessmentState.delete_formal_sustainability_file,
                 ),
                 class_name="space-y-4",
             ),
@@ -1337,6 +1453,7 @@ def dashboard_content() -> rx.Component:
     from app.components.design_system import ds_skeleton_card
 
     return rx.el.div(
+        autosave_form(),
         initial_assessment_modal(),
         dashboard_header(),
         rx.cond(
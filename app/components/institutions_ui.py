@@ -545,7 +545,7 @@ def institutions_dashboard_ui() -> rx.Component:
                     ),
                     rx.el.input(
                         placeholder="Search institutions by name or address...",
-                        on_change=InstitutionsState.set_search_query,
+                        on_change=InstitutionsState.set_search_query.debounce(150),
                         class_name="pl-10 pr-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500 outline-none text-sm w-full md:w-80",
                         default_value=InstitutionsState.search_query,
                     ),
@@ -565,8 +565,20 @@ def institutions_dashboard_ui() -> rx.Component:
                         rx.el.thead(
                             rx.el.tr(
                                 rx.el.th(
-                                    "Institution Name",
-                                    class_name="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider",
+                                    rx.el.button(
+                                        "Institution Name",
+                                        rx.icon(
+                                            tag=rx.cond(
+                                                InstitutionsState.sort_desc,
+                                                "arrow-down",
+                                                "arrow-up",
+                                            ).to(str),
+                                            class_name="h-3 w-3 ml-1",
+                                        ),
+                                        on_click=InstitutionsState.toggle_sort_direction,
+                                        class_name="inline-flex items-center uppercase tracking-wider hover:text-gray-700",
+                                    ),
+                                    class_name="px-6 py-3 text-left text-xs font-medium text-gray-500",
                                 ),
                                 rx.el.th(
                                     "Address",
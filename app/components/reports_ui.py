@@ -204,6 +204,25 @@ def report_table_row(report: ReportItem) -> rx.Component:
     )
 
 
+def sortable_header(label: str, key: str, align: str) -> rx.Component:
+    return rx.el.th(
+        rx.el.button(
+            label,
+            rx.icon(
+                tag=rx.cond(
+                    ReportsState.sort_key == key,
+                    rx.cond(ReportsState.sort_desc, "arrow-down", "arrow-up"),
+                    "arrow-up-down",
+                ).to(str),
+                class_name="h-3 w-3 ml-1",
+            ),
+            on_click=ReportsState.toggle_sort(key),
+            class_name="inline-flex items-center uppercase tracking-wider hover:text-gray-700",
+        ),
+        class_name=f"px-6 py-3 text-{align} text-xs font-medium text-gray-500",
+    )
+
+
 def report_recommendation_card(rec: dict) -> rx.Component:
     """Card component for AI recommendations in reports."""
     return rx.el.div(
@@ -277,7 +296,8 @@ def ai_analysis_section() -> rx.Component:
         rx.cond(
             ReportsState.selected_report_id != "",
             rx.cond(
-                ReportsState.is_generating_report_recommendations,
+                ReportsState.is_generating_report_recommendations
+                & (ReportsState.selected_report_recommendations.length() == 0),
                 rx.el.div(
                     rx.el.div(
                         class_name="animate-spin rounded-full h-8 w-8 border-b-2 border-purple-600 mx-auto"
@@ -711,7 +731,7 @@ def reports_dashboard_ui() -> rx.Component:
             rx.el.div(
                 rx.el.input(
                     placeholder="Search reports by institution name...",
-                    on_change=ReportsState.set_search_query,
+                    on_change=ReportsState.set_search_query.debounce(150),
                     class_name="w-full px-4 py-2 border border-gray-300 rounded-lg text-sm focus:outline-none focus:ring-2 focus:ring-blue-500",
                     default_value=ReportsState.search_query,
                 ),
@@ -721,19 +741,15 @@ def reports_dashboard_ui() -> rx.Component:
                 ReportsState.is_loading,
                 ds_skeleton_table(),
                 rx.cond(
-                    ReportsState.filtered_reports.length() > 0,
+                    ReportsState.reports.length() > 0,
                     rx.el.div(
                         rx.el.div(
                             rx.el.table(
                                 rx.el.thead(
                                     rx.el.tr(
-                                        rx.el.th(
-                                            "Institution",
-                                            class_name="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider",
-                                        ),
-                                        rx.el.th(
-                                            "Overall Score",
-                                            class_name="px-6 py-3 text-center text-xs font-medium text-gray-500 uppercase tracking-wider",
+                                        sortable_header("Institution", "name", "left"),
+                                        sortable_header(
+                                            "Overall Score", "overall_score", "center"
                                         ),
                                         rx.el.th(
                                             "Dimension Scores",
@@ -771,7 +787,7 @@ def reports_dashboard_ui() -> rx.Component:
                                             ),
                                         ),
                                         rx.foreach(
-                                            ReportsState.paginated_reports,
+                                            ReportsState.reports,
                                             lambda report: report_table_row(
                                                 report=report, key=report["id"]
                                             ),
@@ -1,27 +1,18 @@
 import reflex as rx
 from sqlalchemy import text
 from app.states.hei_state import HEIState
+from app.utils import scoring
+from app.utils.scoring import to_float
+from app.utils.computed_scores import RANKING_YEAR, fetch_computed_scores
+from app.utils.score_aggregates import fetch_indicator_averages
+from app.utils import ai_gateway
+from app.utils import recommendations as recommendations_store
 import logging
-import json
-import re
-import os
 import asyncio
-import time
 
-AI_RECOMMENDATIONS_CACHE = {}
-CACHE_TTL = 1800
-try:
-    from google import genai
-    from google.genai import types
-
-    GOOGLE_AI_API_KEY = os.getenv("GOOGLE_API_KEY")
-    GOOGLE_AI_AVAILABLE = bool(GOOGLE_AI_API_KEY)
-except ImportError as e:
-    logging.exception(f"google-genai package not installed: {e}")
-    GOOGLE_AI_AVAILABLE = False
-except Exception as e:
-    logging.exception(f"Error configuring Google AI: {e}")
-    GOOGLE_AI_AVAILABLE = False
+AI_RECOMMENDATIONS_MODEL = recommendations_store.ANALYTICS_MODEL
+# The comparison chart's faculty:student target, not the scoring benchmark.
+FACULTY_STUDENT_TARGET = 8.0
 
 
 class AnalyticsState(rx.State):
@@ -52,89 +43,15 @@ class AnalyticsState(rx.State):
     year_over_year_changes: dict[str, float] = {}
 
     async def _calculate_ncr_averages(self) -> dict[str, float]:
-        """Queries all scores for 2025 and calculates real NCR averages per indicator with caching."""
-        from app.utils.db_utils import cached_query
-
-        get_cache, set_cache = cached_query("ncr_averages_2025", ttl=86400)
-        cached_data = get_cache()
-        if cached_data:
-            return cached_data
+        """Reads the exact 2025 NCR averages per indicator from the trigger-maintained totals."""
         async with rx.asession() as session:
-            result = await session.execute(
-                text("""
-                SELECT 
-                    i.code, 
-                    AVG(CAST(NULLIF(regexp_replace(s.value, '[^0-9.]', '', 'g'), '') AS DOUBLE PRECISION)) as average
-                FROM institution_scores s
-                JOIN ranking_indicators i ON s.indicator_id = i.id
-                WHERE s.ranking_year = 2025
-                GROUP BY i.code
-                """)
-            )
-            rows = result.all()
-            data = {
-                row[0]: round(row[1], 2) if row[1] is not None else 0.0 for row in rows
-            }
-            set_cache(data)
-            return data
-
-    def _clean_json_response(self, text: str) -> str:
-        """Sanitizes AI response text to ensure it is valid parseable JSON.
-        Implements robust repair logic for common LLM output issues like truncated responses,
-        missing commas, trailing commas, and unescaped characters.
-        """
-        if not text:
-            return ""
-        text = re.sub("(?:json)?\\n?", "", text)
-        text = re.sub("", "", text).strip()
-        start = text.find("{")
-        end = text.rfind("}")
-        if start != -1:
-            if end == -1 or end < start:
-                text = text[start:]
-                open_brackets = text.count("[") - text.count("]")
-                open_braces = text.count("{") - text.count("}")
-                text += "]" * max(0, open_brackets) + "}" * max(0, open_braces)
-            else:
-                text = text[start : end + 1]
-        text = re.sub("'([^']+)'\\s*:", '"\\1":', text)
-        text = re.sub(":\\s*'([^']*)'(\\s*[,}\\]])", ': "\\1"\\2', text)
-        text = re.sub(",\\s*([}\\]])", "\\1", text)
-        text = re.sub('(")\\s*\\n\\s*(")', "\\1,\\n\\2", text)
-        text = re.sub('(\\d|true|false|null)\\s*\\n\\s*"', '\\1,\\n"', text)
-        text = re.sub("[\\x00-\\x1f\\x7f-\\x9f]", " ", text)
-        text = text.strip()
-        if not text.startswith("{"):
-            text = "{" + text
-        if not text.endswith("}"):
-            text = text + "}"
-        return text
-
-    def _is_valid_ai_response(self, text: str) -> bool:
-        """Validates that the response contains meaningful content and required keys."""
-        if not text or len(text) < 20:
-            return False
-        if '"": ""' in text or '"": null' in text:
-            return False
-        required_keys = ["recommendations", "title", "description", "category"]
-        for key in required_keys:
-            if f'"{key}"' not in text:
-                return False
-        return True
-
-    def _parse_float(self, value: str) -> float:
-        try:
-            clean = "".join((c for c in value if c.isdigit() or c == "."))
-            return float(clean) if clean else 0.0
-        except ValueError as e:
-            logging.exception(f"Error parsing float: {e}")
-            return 0.0
+            return await fetch_indicator_averages(session, RANKING_YEAR)
 
     async def _fetch_scores(self, inst_id: int):
         async with rx.asession() as session:
             result = await session.execute(
                 text("""
-                SELECT i.code, s.value, s.review_status
+                SELECT i.code, s.value_numeric, s.value, s.review_status
                 FROM institution_scores s
                 JOIN ranking_indicators i ON s.indicator_id = i.id
                 WHERE s.institution_id = :inst_id AND s.ranking_year = 2025
@@ -143,6 +60,10 @@ class AnalyticsState(rx.State):
             )
             return result.all()
 
+    async def _fetch_computed_scores(self, inst_id: int) -> dict | None:
+        async with rx.asession() as session:
+            return await fetch_computed_scores(session, inst_id)
+
     @rx.event(background=True)
     async def on_load(self):
         """Optimized: Uses asyncio.gather for parallel database operations and batched state updates."""
@@ -182,76 +103,55 @@ class AnalyticsState(rx.State):
                             self.is_loading = False
                             return
                 institution_id = int(hei_state.selected_hei["id"])
-            scores_data, ncr_avgs = await asyncio.gather(
-                self._fetch_scores(institution_id), self._calculate_ncr_averages()
+            scores_data, ncr_avgs, computed = await asyncio.gather(
+                self._fetch_scores(institution_id),
+                self._calculate_ncr_averages(),
+                self._fetch_computed_scores(institution_id),
             )
-            score_map = {row[0]: self._parse_float(row[1]) for row in scores_data}
-            review_status = scores_data[0][2] if scores_data else "Pending"
+            score_map = {
+                row[0]: row[1] if row[1] is not None else to_float(row[2])
+                for row in scores_data
+            }
+            review_status = scores_data[0][3] if scores_data else "Pending"
             int_nominations = score_map.get("international_nominations", 0.0)
             dom_nominations = score_map.get("domestic_nominations", 0.0)
-            academic_rep = int_nominations * 0.85 + dom_nominations * 0.15
-            citations = score_map.get("citations_per_faculty", 0.0)
             emp_domestic = score_map.get("employer_domestic_nominations", 0.0)
             emp_international = score_map.get("employer_international_nominations", 0.0)
-            emp_rep = emp_domestic * 0.5 + emp_international * 0.5
-            emp_outcomes = score_map.get("employment_outcomes", 0.0)
-            int_research_net = score_map.get("international_research_network", 0.0)
-            int_faculty_ratio = score_map.get("international_faculty_ratio", 0.0)
-            int_student_ratio = score_map.get("international_student_ratio", 0.0)
-            faculty_student_ratio = score_map.get("faculty_student_ratio", 0.0)
-            sustainability = score_map.get("sustainability_metrics", 0.0)
-            b_academic_rep = 100.0
-            b_citations = 100.0
-            b_emp_rep = 100.0
-            b_emp_outcomes = 100.0
-            b_int_research_net = 100.0
-            b_int_faculty_ratio = 25.0
-            b_int_student_ratio = 25.0
-            b_faculty_student_ratio = 8.0
-            b_sustainability = 100.0
-            s_academic_rep = (
-                min(100, academic_rep / b_academic_rep * 100) if b_academic_rep else 0
-            )
-            s_citations = min(100, citations / b_citations * 100) if b_citations else 0
-            s_emp_rep = min(100, emp_rep / b_emp_rep * 100) if b_emp_rep else 0
-            s_emp_outcomes = (
-                min(100, emp_outcomes / b_emp_outcomes * 100) if b_emp_outcomes else 0
-            )
-            s_int_research_net = (
-                min(100, int_research_net / b_int_research_net * 100)
-                if b_int_research_net
-                else 0
-            )
-            s_int_faculty_ratio = (
-                min(100, int_faculty_ratio / b_int_faculty_ratio * 100)
-                if b_int_faculty_ratio
-                else 0
-            )
-            s_int_student_ratio = (
-                min(100, int_student_ratio / b_int_student_ratio * 100)
-                if b_int_student_ratio
-                else 0
-            )
-            s_faculty_student = min(100, faculty_student_ratio)
-            s_sustainability = (
-                min(100, sustainability / b_sustainability * 100)
-                if b_sustainability
-                else 0
-            )
-            research_score = int(s_academic_rep * 0.6 + s_citations * 0.4)
-            employability_score = int(s_emp_rep * 0.75 + s_emp_outcomes * 0.25)
-            global_engagement_score = int(
-                (s_int_research_net + s_int_faculty_ratio + s_int_student_ratio) / 3
-            )
-            learning_experience_score = int(s_faculty_student)
-            sustainability_score = int(s_sustainability)
-            overall_score = int(
-                research_score * 0.5
-                + employability_score * 0.2
-                + global_engagement_score * 0.15
-                + learning_experience_score * 0.1
-                + sustainability_score * 0.05
-            )
+            matrix = scoring.build_matrix([score_map])
+            (
+                academic_rep,
+                citations,
+                emp_rep,
+                emp_outcomes,
+                int_research_net,
+                int_faculty_ratio,
+                int_student_ratio,
+                faculty_student_ratio,
+                sustainability,
+            ) = (float(v) for v in matrix[0])
+            s_academic_rep = float(scoring.normalize(matrix)[0][0])
+            if computed is None:
+                computed = {
+                    key: int(values[0])
+                    for key, values in scoring.score_matrix(matrix).items()
+                }
+            research_score = computed["research_score"]
+            employability_score = computed["employability_score"]
+            global_engagement_score = computed["global_engagement_score"]
+            learning_experience_score = computed["learning_experience_score"]
+            sustainability_score = computed["sustainability_score"]
+            overall_score = computed["overall_score"]
+            (
+                b_academic_rep,
+                b_citations,
+                b_emp_rep,
+                b_emp_outcomes,
+                b_int_research_net,
+                b_int_faculty_ratio,
+                b_int_student_ratio,
+                _,
+                b_sustainability,
+            ) = (float(b) for b in scoring.BENCHMARKS)
             async with rx.asession() as session:
                 hist_result = await session.execute(
                     text("""
@@ -304,13 +204,13 @@ class AnalyticsState(rx.State):
                         "metric": "Intl. Nominations",
                         "You": int_nominations,
                         "NCR Avg": ncr_avgs.get("international_nominations", 0.0),
-                        "Target": 100.0,
+                        "Target": b_academic_rep,
                     },
                     {
                         "metric": "Dom. Nominations",
                         "You": dom_nominations,
                         "NCR Avg": ncr_avgs.get("domestic_nominations", 0.0),
-                        "Target": 100.0,
+                        "Target": b_academic_rep,
                     },
                     {
                         "metric": "Citations/Faculty",
@@ -324,7 +224,7 @@ class AnalyticsState(rx.State):
                         "metric": "Emp. Domestic",
                         "You": emp_domestic,
                         "NCR Avg": ncr_avgs.get("employer_domestic_nominations", 0.0),
-                        "Target": 100.0,
+                        "Target": b_emp_rep,
                     },
                     {
                         "metric": "Emp. International",
@@ -332,13 +232,13 @@ class AnalyticsState(rx.State):
                         "NCR Avg": ncr_avgs.get(
                             "employer_international_nominations", 0.0
                         ),
-                        "Target": 100.0,
+                        "Target": b_emp_rep,
                     },
                     {
                         "metric": "Emp. Outcomes",
                         "You": emp_outcomes,
                         "NCR Avg": ncr_avgs.get("employment_outcomes", 0.0),
-                        "Target": 100.0,
+                        "Target": b_emp_outcomes,
                     },
                 ]
                 self.global_engagement_comparison_data = [
@@ -366,7 +266,7 @@ class AnalyticsState(rx.State):
                         "metric": "Faculty:Student",
                         "You": faculty_student_ratio,
                         "NCR Avg": ncr_avgs.get("faculty_student_ratio", 0.0),
-                        "Target": b_faculty_student_ratio,
+                        "Target": FACULTY_STUDENT_TARGET,
                     }
                 ]
                 self.sustainability_comparison_data = [
@@ -408,10 +308,9 @@ class AnalyticsState(rx.State):
         )
 
     @rx.event
-    def clear_ai_cache(self):
+    async def clear_ai_cache(self):
         """Manually clears the recommendations cache to force refresh with fixed logic."""
-        global AI_RECOMMENDATIONS_CACHE
-        AI_RECOMMENDATIONS_CACHE = {}
+        await recommendations_store.clear_stored(recommendations_store.ANALYTICS_KIND)
 
     @rx.event(background=True)
     async def generate_ai_recommendations(
@@ -439,183 +338,78 @@ class AnalyticsState(rx.State):
             inst_id = (
                 hei_state.selected_hei["id"] if hei_state.selected_hei else "unknown"
             )
-        now = time.time()
-        if inst_id in AI_RECOMMENDATIONS_CACHE:
-            cache_entry = AI_RECOMMENDATIONS_CACHE[inst_id]
-            is_expired = now - cache_entry["timestamp"] > CACHE_TTL
-            is_invalid = (
-                not cache_entry.get("recommendations")
-                or len(cache_entry["recommendations"]) == 0
-            )
+        scores = {
+            "overall_score": overall_score,
+            "research_score": research_score,
+            "employability_score": employability_score,
+            "global_engagement_score": global_engagement_score,
+            "learning_experience_score": learning_experience_score,
+            "sustainability_score": sustainability_score,
+        }
+        fingerprint = recommendations_store.analytics_fingerprint(scores)
+        cached_recommendations = await recommendations_store.get_stored(fingerprint)
+        if cached_recommendations is not None:
+            is_invalid = len(cached_recommendations) == 0
             if not is_invalid:
-                first_rec = cache_entry["recommendations"][0]
+                first_rec = cached_recommendations[0]
                 desc = first_rec.get("description", "")
                 if len(desc) > 40 and " " not in desc:
                     is_invalid = True
-            if not is_expired and (not is_invalid):
+            if not is_invalid:
                 logging.info(f"Using valid cached AI recommendations for {inst_id}")
                 async with self:
-                    self.ai_recommendations = cache_entry["recommendations"]
+                    self.ai_recommendations = cached_recommendations
                     self.is_generating_recommendations = False
                 return
             else:
-                logging.warning(
-                    f"Cache for {inst_id} is {('expired' if is_expired else 'invalid')}. Refreshing..."
-                )
-        if not GOOGLE_AI_AVAILABLE:
+                logging.warning(f"Cache for {inst_id} is invalid. Refreshing...")
+        if not ai_gateway.AI_AVAILABLE:
             async with self:
                 self.is_generating_recommendations = False
             return
         try:
-            performance_summary = f"\nPerformance Summary:\n- Overall Readiness Score: {overall_score}/100\n- Research & Discovery: {research_score}/100\n- Employability & Outcomes: {employability_score}/100\n- Global Engagement: {global_engagement_score}/100\n- Learning Experience: {learning_experience_score}/100\n- Sustainability: {sustainability_score}/100\n"
-            weak_areas = []
-            if research_score < 70:
-                weak_areas.append("Research & Discovery")
-            if employability_score < 70:
-                weak_areas.append("Employability & Outcomes")
-            if global_engagement_score < 70:
-                weak_areas.append("Global Engagement")
-            if learning_experience_score < 70:
-                weak_areas.append("Learning Experience")
-            if sustainability_score < 70:
-                weak_areas.append("Sustainability")
-            prompt = f"""You are an expert higher education consultant. \n\nAnalyze the following performance data for a Higher Education Institution and provide 3-4 strategic, actionable recommendations to improve their institutional readiness.\n\n{performance_summary}\n\nAreas needing improvement: {(", ".join(weak_areas) if weak_areas else "All areas are performing well")}\n\nProvide recommendations in JSON format with this structure:\n{{\n  "recommendations": [\n    {{\n      "title": "Short, actionable title (max 8 words)",\n      "description": "Detailed recommendation explaining specific actions to improve performance in this area.",\n      "category": "Research & Discovery|Employability|Global Engagement|Learning Experience|Sustainability|Overall",\n      "priority": "High|Medium|Low"\n    }}\n  ]\n}}\n\nReturn ONLY valid JSON, no additional text."""
-            client = genai.Client(api_key=GOOGLE_AI_API_KEY)
-            max_retries = 5
-            response_text = ""
-            for attempt in range(max_retries):
-                try:
-                    response = await client.aio.models.generate_content(
-                        model="gemini-2.0-flash",
-                        contents=prompt,
-                        config=types.GenerateContentConfig(
-                            response_mime_type="application/json"
-                        ),
+            prompt = recommendations_store.analytics_prompt(scores)
+            async with self:
+                self.ai_recommendations = []
+            recommendations = []
+            try:
+                async for rec in ai_gateway.stream_json_items(
+                    prompt,
+                    recommendations_store.RECOMMENDATIONS_SCHEMA,
+                    model=AI_RECOMMENDATIONS_MODEL,
+                ):
+                    recommendations.append(
+                        recommendations_store.decorate_recommendation(rec)
                     )
-                    if response and response.text:
-                        response_text = response.text
-                        break
-                    else:
-                        logging.warning(
-                            f"Attempt {attempt + 1}: Google AI returned empty response or no text."
-                        )
-                except Exception as e:
-                    error_str = str(e)
-                    is_retriable = (
-                        "429" in error_str
-                        or "RESOURCE_EXHAUSTED" in error_str
-                        or "503" in error_str
-                        or ("UNAVAILABLE" in error_str)
+                    async with self:
+                        self.ai_recommendations = list(recommendations)
+            except ai_gateway.AIGenerationError as e:
+                if not recommendations:
+                    logging.warning(
+                        f"AI recommendations unavailable, using fallback: {e}"
                     )
-                    if is_retriable:
-                        if attempt == max_retries - 1:
-                            logging.info(
-                                "Google AI quota exhausted after all retries. Falling back to rule-based recommendations."
-                            )
-                            break
-                        wait_time = 2.0 * 2**attempt
-                        retry_match = re.search("retry in (\\d+(\\.\\d+)?)s", error_str)
-                        if retry_match:
-                            wait_time = float(retry_match.group(1)) + 1.0
-                        wait_time = min(wait_time, 60.0)
-                        logging.warning(
-                            f"Google AI error (Rate limit or Unavailable). Retrying in {wait_time:.2f}s (Attempt {attempt + 1}/{max_retries})"
+                    async with self:
+                        self.ai_recommendations = self._get_fallback_recommendations(
+                            research_score,
+                            employability_score,
+                            global_engagement_score,
+                            learning_experience_score,
+                            sustainability_score,
                         )
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        logging.exception(
-                            f"Error generating content from Google AI: {e}"
-                        )
-                        break
-            if not response_text or not response_text.strip():
-                logging.warning("Google AI returned an empty response.")
-                async with self:
-                    self.ai_recommendations = self._get_fallback_recommendations(
-                        research_score,
-                        employability_score,
-                        global_engagement_score,
-                        learning_experience_score,
-                        sustainability_score,
-                    )
-                    self.is_generating_recommendations = False
-                return
-            response_text = self._clean_json_response(response_text)
-            try:
-                recommendations_data = json.loads(response_text)
-            except json.JSONDecodeError as parse_err:
-                logging.exception(
-                    f"AI response parsing failed, using fallback: {str(parse_err)[:50]}"
-                )
+                        self.is_generating_recommendations = False
+                    return
+                logging.warning(f"AI recommendations stream cut short: {e}")
                 async with self:
-                    self.ai_recommendations = self._get_fallback_recommendations(
-                        research_score,
-                        employability_score,
-                        global_engagement_score,
-                        learning_experience_score,
-                        sustainability_score,
-                    )
-                    self.is_generating_recommendations = False
-                return
-            if not self._is_valid_ai_response(response_text):
-                logging.warning(
-                    f"AI response validation failed. Cleaned text snippet: {response_text[:100]}..."
-                )
-                async with self:
-                    self.ai_recommendations = self._get_fallback_recommendations(
-                        research_score,
-                        employability_score,
-                        global_engagement_score,
-                        learning_experience_score,
-                        sustainability_score,
-                    )
                     self.is_generating_recommendations = False
                 return
-            recommendations = []
-            for rec in recommendations_data.get("recommendations", []):
-                category = rec.get("category", "Overall")
-                if "Research" in category:
-                    icon = "microscope"
-                    color_class = "text-purple-600"
-                    bg_class = "bg-purple-50 border-purple-100"
-                elif "Employability" in category:
-                    icon = "briefcase"
-                    color_class = "text-emerald-600"
-                    bg_class = "bg-emerald-50 border-emerald-100"
-                elif "Global" in category:
-                    icon = "globe"
-                    color_class = "text-blue-600"
-                    bg_class = "bg-blue-50 border-blue-100"
-                elif "Learning" in category:
-                    icon = "graduation-cap"
-                    color_class = "text-indigo-600"
-                    bg_class = "bg-indigo-50 border-indigo-100"
-                elif "Sustainability" in category:
-                    icon = "leaf"
-                    color_class = "text-green-600"
-                    bg_class = "bg-green-50 border-green-100"
-                else:
-                    icon = "lightbulb"
-                    color_class = "text-amber-600"
-                    bg_class = "bg-amber-50 border-amber-100"
-                recommendations.append(
-                    {
-                        "title": rec.get("title", "Strategic Recommendation"),
-                        "description": rec.get("description", ""),
-                        "category": category,
-                        "priority": rec.get("priority", "Medium"),
-                        "icon": icon,
-                        "color_class": color_class,
-                        "bg_class": bg_class,
-                    }
-                )
-            AI_RECOMMENDATIONS_CACHE[inst_id] = {
-                "timestamp": time.time(),
-                "recommendations": recommendations,
-            }
             async with self:
-                self.ai_recommendations = recommendations
                 self.is_generating_recommendations = False
+            await recommendations_store.store(
+                fingerprint,
+                recommendations_store.ANALYTICS_KIND,
+                AI_RECOMMENDATIONS_MODEL,
+                recommendations,
+            )
         except Exception as e:
             logging.exception(f"Error generating AI recommendations: {e}")
             async with self:
@@ -1,75 +1,137 @@
 import reflex as rx
 import asyncio
+import datetime
 import json
 import logging
 from sqlalchemy import text
 from app.states.hei_state import HEIState
+from app.utils import events, scoring
+from app.utils.numeric_scores import numeric_value
+from app.utils.indicators import get_indicator_ids
+from app.utils.computed_scores import refresh_computed_scores
+
+
+AUTOSAVE_FORM_ID = "assessment_form"
+AUTOSAVE_IDLE_MS = 500
+AUTOSAVE_INTERVAL_SECONDS = 5
+INDICATOR_LABELS = {
+    "academic_reputation": "Academic Reputation",
+    "domestic_nominations": "Domestic Nominations",
+    "international_nominations": "International Nominations",
+    "citations_per_faculty": "Citations per Faculty",
+    "employer_reputation": "Employer Reputation",
+    "employer_domestic_nominations": "Employer Domestic Nominations",
+    "employer_international_nominations": "Employer International Nominations",
+    "employment_outcomes": "Employment Outcomes",
+    "international_research_network": "International Research Network",
+    "international_faculty_ratio": "International Faculty Ratio",
+    "international_student_ratio": "International Student Ratio",
+    "international_student_diversity": "International Student Diversity",
+    "faculty_student_ratio": "Faculty-Student Ratio",
+    "sustainability_metrics": "Sustainability Metrics",
+}
+
+
+def _score_rows(values: dict) -> list[tuple[str, int | str, list[str]]]:
+    """(indicator code, value, evidence files) for every persisted indicator."""
+    calc_academic_rep = int(
+        scoring.composite_value(
+            "academic_reputation",
+            {
+                "international_nominations": values["international_nominations"],
+                "domestic_nominations": values["domestic_nominations"],
+            },
+        )
+    )
+    calc_employer_rep = int(
+        scoring.composite_value(
+            "employer_reputation",
+            {
+                "employer_domestic_nominations": values["employer_domestic_nominations"],
+                "employer_international_nominations": values[
+                    "employer_international_nominations"
+                ],
+            },
+        )
+    )
+    return [
+        (
+            "academic_reputation",
+            calc_academic_rep,
+            values["uploaded_research_files"],
+        ),
+        ("domestic_nominations", values["domestic_nominations"], []),
+        ("international_nominations", values["international_nominations"], []),
+        ("citations_per_faculty", values["citations_per_faculty"], []),
+        (
+            "employer_reputation",
+            calc_employer_rep,
+            values["uploaded_employability_files"],
+        ),
+        (
+            "employer_domestic_nominations",
+            values["employer_domestic_nominations"],
+            [],
+        ),
+        (
+            "employer_international_nominations",
+            values["employer_international_nominations"],
+            [],
+        ),
+        ("employment_outcomes", values["employment_outcomes"], []),
+        (
+            "international_research_network",
+            values["international_research_network"],
+            values["uploaded_global_engagement_files"],
+        ),
+        ("international_faculty_ratio", values["international_faculty_ratio"], []),
+        ("international_student_ratio", values["international_student_ratio"], []),
+        (
+            "international_student_diversity",
+            values["international_student_diversity"],
+            [],
+        ),
+        (
+            "faculty_student_ratio",
+            values["faculty_student_ratio"],
+            values["uploaded_learning_experience_files"],
+        ),
+        (
+            "sustainability_metrics",
+            values["sustainability_metrics"],
+            values["uploaded_sustainability_files"],
+        ),
+    ]
+
+
+def _snapshot(values: dict, codes) -> dict[str, list[str]]:
+    """Persisted form [value, evidence JSON] of the given indicators' rows."""
+    return {
+        code: [str(value), json.dumps(files)]
+        for code, value, files in _score_rows(values)
+        if code in codes
+    }
 
 
 class DashboardState(rx.State):
-    """Manages data entry for the ranking readiness assessment.
-    It tracks individual indicator scores and their associated evidence files.
+    """Coordinates the ranking readiness assessment.
+
+    Indicator scores, evidence files and upload progress live in one substate
+    per lens (see FIELD_STATES), so an edit or upload in one lens only sends
+    that lens's vars over the websocket. This state keeps what the whole
+    dashboard shares: review status, validation, loading and saving.
     """
 
-    academic_reputation: int = 0
-    domestic_nominations: int = 0
-    international_nominations: int = 0
-    employer_domestic_nominations: int = 0
-    employer_international_nominations: int = 0
     review_status: str = ""
-    citations_per_faculty: int = 0
-    employer_reputation: int = 0
-    employment_outcomes: int = 0
-    international_research_network: int = 0
-    international_faculty_ratio: int = 0
-    international_student_ratio: int = 0
-    international_student_diversity: str = ""
-    faculty_student_ratio: int = 0
-    sustainability_metrics: int = 0
-    formal_research_score: int = 0
-    formal_employability_score: int = 0
-    formal_global_engagement_score: int = 0
-    formal_learning_experience_score: int = 0
-    formal_sustainability_score: int = 0
     show_initial_question: bool = False
     has_formal_assessment: bool = False
-    uploaded_formal_research_files: list[str] = []
-    uploaded_formal_employability_files: list[str] = []
-    uploaded_formal_global_files: list[str] = []
-    uploaded_formal_learning_files: list[str] = []
-    uploaded_formal_sustainability_files: list[str] = []
-    is_uploading_formal_research: bool = False
-    is_uploading_formal_employability: bool = False
-    is_uploading_formal_global: bool = False
-    is_uploading_formal_learning: bool = False
-    is_uploading_formal_sustainability: bool = False
-    upload_progress_formal_research: int = 0
-    upload_progress_formal_employability: int = 0
-    upload_progress_formal_global: int = 0
-    upload_progress_formal_learning: int = 0
-    upload_progress_formal_sustainability: int = 0
-    uploaded_research_files: list[str] = []
-    uploaded_employability_files: list[str] = []
-    uploaded_global_engagement_files: list[str] = []
-    uploaded_learning_experience_files: list[str] = []
-    uploaded_sustainability_files: list[str] = []
     is_saving: bool = False
-    is_uploading_research: bool = False
-    is_uploading_employability: bool = False
-    is_uploading_global_engagement: bool = False
-    is_uploading_learning_experience: bool = False
-    is_uploading_sustainability: bool = False
-    upload_progress_research: int = 0
-    upload_progress_employability: int = 0
-    upload_progress_global_engagement: int = 0
-    upload_progress_learning_experience: int = 0
-    upload_progress_sustainability: int = 0
-    upload_count_research: str = ""
-    upload_count_employability: str = ""
-    upload_count_global_engagement: str = ""
-    upload_count_learning_experience: str = ""
-    upload_count_sustainability: str = ""
     save_successful: bool = False
+    last_autosaved: str = ""
+    autosave_error: str = ""
+    _loaded_snapshot: dict[str, list[str]] = {}
+    _autosave_dirty: bool = False
+    _autosave_running: bool = False
     is_loading: bool = False
     validation_errors: dict[str, str] = {
         "academic_reputation": "",
@@ -95,277 +157,412 @@ class DashboardState(rx.State):
                 return True
         return False
 
-    @rx.var(cache=True)
-    def domestic_nominations_points(self) -> float:
-        return round(float(self.domestic_nominations) * 0.15 * 0.3, 1)
-
-    @rx.var(cache=True)
-    def international_nominations_points(self) -> float:
-        return round(float(self.international_nominations) * 0.85 * 0.3, 1)
-
-    @rx.var(cache=True)
-    def academic_reputation_points(self) -> float:
-        domestic_contribution = float(self.domestic_nominations) * 0.15
-        international_contribution = float(self.international_nominations) * 0.85
-        combined_score = domestic_contribution + international_contribution
-        return round(combined_score * 0.3, 1)
-
-    @rx.var(cache=True)
-    def citations_per_faculty_points(self) -> float:
-        return round(float(self.citations_per_faculty) * 0.2, 1)
-
-    @rx.var(cache=True)
-    def research_section_total(self) -> float:
-        return round(
-            self.academic_reputation_points + self.citations_per_faculty_points, 1
-        )
-
-    @rx.var(cache=True)
-    def employer_domestic_nominations_points(self) -> float:
-        return round(float(self.employer_domestic_nominations) * 0.5 * 0.15, 1)
-
-    @rx.var(cache=True)
-    def employer_international_nominations_points(self) -> float:
-        return round(float(self.employer_international_nominations) * 0.5 * 0.15, 1)
-
-    @rx.var(cache=True)
-    def employer_reputation_points(self) -> float:
-        domestic_contribution = float(self.employer_domestic_nominations) * 0.5
-        international_contribution = (
-            float(self.employer_international_nominations) * 0.5
-        )
-        combined_score = domestic_contribution + international_contribution
-        return round(combined_score * 0.15, 1)
-
-    @rx.var(cache=True)
-    def employment_outcomes_points(self) -> float:
-        return round(float(self.employment_outcomes) * 0.05, 1)
-
-    @rx.var(cache=True)
-    def employability_section_total(self) -> float:
-        return round(
-            self.employer_reputation_points + self.employment_outcomes_points, 1
-        )
-
-    @rx.var(cache=True)
-    def international_research_network_points(self) -> float:
-        return round(float(self.international_research_network) * 0.05, 1)
-
-    @rx.var(cache=True)
-    def international_faculty_ratio_points(self) -> float:
-        return round(float(self.international_faculty_ratio) * 0.05, 1)
-
-    @rx.var(cache=True)
-    def international_student_ratio_points(self) -> float:
-        return round(float(self.international_student_ratio) * 0.05, 1)
-
-    @rx.var(cache=True)
-    def global_engagement_section_total(self) -> float:
-        return round(
-            self.international_research_network_points
-            + self.international_faculty_ratio_points
-            + self.international_student_ratio_points,
-            1,
-        )
-
-    @rx.var(cache=True)
-    def faculty_student_ratio_points(self) -> float:
-        return round(float(self.faculty_student_ratio) * 0.1, 1)
-
-    @rx.var(cache=True)
-    def learning_experience_section_total(self) -> float:
-        return self.faculty_student_ratio_points
-
-    @rx.var(cache=True)
-    def sustainability_metrics_points(self) -> float:
-        return round(float(self.sustainability_metrics) * 0.05, 1)
-
-    @rx.var(cache=True)
-    def sustainability_section_total(self) -> float:
-        return self.sustainability_metrics_points
-
-    @rx.var(cache=True)
-    def formal_total_weighted_score(self) -> float:
-        """Calculate total weighted score for formal assessment path."""
-        return round(
-            float(self.formal_research_score) * 0.5
-            + float(self.formal_employability_score) * 0.2
-            + float(self.formal_global_engagement_score) * 0.15
-            + float(self.formal_learning_experience_score) * 0.1
-            + float(self.formal_sustainability_score) * 0.05,
-            2,
-        )
-
-    @rx.var(cache=True)
-    def progress(self) -> int:
-        """Calculate completion progress based on filled fields."""
-        metrics = [
-            self.academic_reputation,
-            self.citations_per_faculty,
-            self.employer_reputation,
-            self.employment_outcomes,
-            self.international_research_network,
-            self.international_faculty_ratio,
-            self.international_student_ratio,
-            self.faculty_student_ratio,
-            self.sustainability_metrics,
-        ]
-        filled_count = len([m for m in metrics if m > 0])
-        total_fields = 9
-        return int(filled_count / total_fields * 100)
+    def _set_validation_error(self, field_name: str, message: str):
+        """Only touches validation_errors when the message changes, keeping it out of deltas."""
+        if self.validation_errors.get(field_name) != message:
+            self.validation_errors[field_name] = message
 
     def _validate_and_clamp(self, field_name: str, value: str) -> int:
         """Helper to convert string to int, clamp values, and set validation errors."""
         try:
             if not value:
-                self.validation_errors[field_name] = ""
+                self._set_validation_error(field_name, "")
                 return 0
             num_float = float(value)
             num = int(num_float)
             if num_float < 0 or num_float > 100:
-                self.validation_errors[field_name] = "Value must be between 0 and 100"
+                self._set_validation_error(
+                    field_name, "Value must be between 0 and 100"
+                )
             else:
-                self.validation_errors[field_name] = ""
+                self._set_validation_error(field_name, "")
             return max(0, min(100, num))
         except (ValueError, TypeError) as e:
             logging.exception(f"Validation error for {field_name}: {e}")
-            self.validation_errors[field_name] = "Please enter a valid number"
+            self._set_validation_error(field_name, "Please enter a valid number")
             return 0
 
     @rx.event
-    def set_academic_reputation(self, value: str):
-        self.academic_reputation = self._validate_and_clamp(
-            "academic_reputation", value
-        )
-
-    @rx.event
-    def set_domestic_nominations(self, value: str):
-        self.domestic_nominations = self._validate_and_clamp(
-            "domestic_nominations", value
-        )
-
-    @rx.event
-    def set_international_nominations(self, value: str):
-        self.international_nominations = self._validate_and_clamp(
-            "international_nominations", value
-        )
-
-    @rx.event
-    def set_citations_per_faculty(self, value: str):
-        self.citations_per_faculty = self._validate_and_clamp(
-            "citations_per_faculty", value
-        )
-
-    @rx.event
-    def set_employer_reputation(self, value: str):
-        self.employer_reputation = self._validate_and_clamp(
-            "employer_reputation", value
-        )
-
-    @rx.event
-    def set_employer_domestic_nominations(self, value: str):
-        self.employer_domestic_nominations = self._validate_and_clamp(
-            "employer_domestic_nominations", value
-        )
-
-    @rx.event
-    def set_employer_international_nominations(self, value: str):
-        self.employer_international_nominations = self._validate_and_clamp(
-            "employer_international_nominations", value
-        )
-
-    @rx.event
-    def set_employment_outcomes(self, value: str):
-        self.employment_outcomes = self._validate_and_clamp(
-            "employment_outcomes", value
-        )
+    def set_formal_path(self, has_formal: bool):
+        self.has_formal_assessment = has_formal
+        self.show_initial_question = False
 
-    @rx.event
-    def set_international_research_network(self, value: str):
-        self.international_research_network = self._validate_and_clamp(
-            "international_research_network", value
-        )
+    async def _save_uploaded_file(
+        self, file: rx.UploadFile, category: str, inst_id: str
+    ) -> str | None:
+        """Save a single uploaded file. Returns the relative path."""
+        try:
+            relative_dir = f"institution_{inst_id}/{category}"
+            upload_dir = rx.get_upload_dir() / relative_dir
+            upload_dir.mkdir(parents=True, exist_ok=True)
+            import random, string
 
-    @rx.event
-    def set_international_faculty_ratio(self, value: str):
-        self.international_faculty_ratio = self._validate_and_clamp(
-            "international_faculty_ratio", value
-        )
+            unique_name = f"{''.join(random.choices(string.ascii_letters + string.digits, k=6))}_{file.name}"
+            upload_data = await file.read()
+            file_path = upload_dir / unique_name
+            with file_path.open("wb") as f:
+                f.write(upload_data)
+            return f"{relative_dir}/{unique_name}"
+        except Exception as e:
+            logging.exception(f"Error saving file: {e}")
+            return None
 
-    @rx.event
-    def set_international_student_ratio(self, value: str):
-        self.international_student_ratio = self._validate_and_clamp(
-            "international_student_ratio", value
-        )
+    @rx.event(background=True)
+    async def on_load(self):
+        """Load existing data for the selected institution using optimized batch queries."""
+        async with self:
+            self.is_loading = True
+            self._autosave_running = False
+            self._autosave_dirty = False
+            self.autosave_error = ""
+            hei_state = await self.get_state(HEIState)
+            if not hei_state.selected_hei:
+                self.is_loading = False
+                return
+            institution_id = int(hei_state.selected_hei["id"])
+        async with rx.asession() as session:
+            result = await session.execute(
+                text("""
+                SELECT 
+                    i.code, 
+                    s.value, 
+                    s.value_numeric, 
+                    s.evidence_files,
+                    s.review_status
+                FROM institution_scores s
+                JOIN ranking_indicators i ON s.indicator_id = i.id
+                WHERE s.institution_id = :inst_id AND s.ranking_year = 2025
+                """),
+                {"inst_id": institution_id},
+            )
+            rows = result.all()
+            updates = {
+                "review_status": "",
+                "academic_reputation": 0,
+                "uploaded_research_files": [],
+                "domestic_nominations": 0,
+                "international_nominations": 0,
+                "citations_per_faculty": 0,
+                "employer_reputation": 0,
+                "uploaded_employability_files": [],
+                "employer_domestic_nominations": 0,
+                "employer_international_nominations": 0,
+                "employment_outcomes": 0,
+                "international_research_network": 0,
+                "uploaded_global_engagement_files": [],
+                "international_faculty_ratio": 0,
+                "international_student_ratio": 0,
+                "international_student_diversity": "",
+                "faculty_student_ratio": 0,
+                "uploaded_learning_experience_files": [],
+                "sustainability_metrics": 0,
+                "uploaded_sustainability_files": [],
+            }
+            for code, value, value_num, evidence, r_status in rows:
+                if r_status:
+                    updates["review_status"] = r_status
+                if code in [
+                    "academic_reputation",
+                    "employer_reputation",
+                    "international_research_network",
+                    "faculty_student_ratio",
+                    "sustainability_metrics",
+                ]:
+                    files = json.loads(evidence) if evidence else []
+                    if code == "academic_reputation":
+                        updates["uploaded_research_files"] = files
+                    elif code == "employer_reputation":
+                        updates["uploaded_employability_files"] = files
+                    elif code == "international_research_network":
+                        updates["uploaded_global_engagement_files"] = files
+                    elif code == "faculty_student_ratio":
+                        updates["uploaded_learning_experience_files"] = files
+                    elif code == "sustainability_metrics":
+                        updates["uploaded_sustainability_files"] = files
+                if code == "international_student_diversity":
+                    updates["international_student_diversity"] = value
+                    continue
+                if value_num is not None:
+                    val = int(value_num)
+                else:
+                    try:
+                        val = int(float(value)) if value else 0
+                    except (ValueError, TypeError):
+                        val = 0
+                if code in updates:
+                    updates[code] = val
+            async with self:
+                self.review_status = updates.pop("review_status")
+                for key, val in updates.items():
+                    lens_state = await self.get_state(FIELD_STATES[key])
+                    if getattr(lens_state, key) != val:
+                        setattr(lens_state, key, val)
+                self._loaded_snapshot = _snapshot(updates, {row[0] for row in rows})
+                self.is_loading = False
 
-    @rx.event
-    def set_international_student_diversity(self, value: str):
-        self.international_student_diversity = value
+    async def _field_values(self) -> dict:
+        """Current value of every field of the lens substates, by field name."""
+        values = {}
+        for lens_cls in LENS_STATES:
+            lens_state = await self.get_state(lens_cls)
+            for field in LENS_FIELDS[lens_cls]:
+                values[field] = getattr(lens_state, field)
+        return values
 
     @rx.event
-    def set_faculty_student_ratio(self, value: str):
-        self.faculty_student_ratio = self._validate_and_clamp(
-            "faculty_student_ratio", value
-        )
+    async def apply_form_edits(self, form_data: dict):
+        """Applies one debounced batch of edits from the assessment form.
 
-    @rx.event
-    def set_sustainability_metrics(self, value: str):
-        self.sustainability_metrics = self._validate_and_clamp(
-            "sustainability_metrics", value
-        )
+        The inputs are uncontrolled, so typing costs no server traffic; the
+        client submits the whole form after AUTOSAVE_IDLE_MS without input.
+        Only the lens substates whose values changed are marked dirty.
+        """
+        if not await self._apply_edits(form_data):
+            return
+        return await self._autosave_events()
+
+    async def _apply_edits(self, form_data: dict) -> bool:
+        """Copies form values into the lens substates; returns whether any changed."""
+        changed = False
+        for field, raw in form_data.items():
+            if field == "international_student_diversity":
+                value = raw
+            elif field in self.validation_errors:
+                value = self._validate_and_clamp(field, raw)
+            else:
+                continue
+            lens_state = await self.get_state(FIELD_STATES[field])
+            if getattr(lens_state, field) != value:
+                setattr(lens_state, field, value)
+                changed = True
+        return changed
+
+    async def _autosave_events(self) -> list:
+        """Marks the assessment edited; returns the event starting autosave when idle."""
+        dashboard = await self.get_state(DashboardState)
+        dashboard._autosave_dirty = True
+        if dashboard._autosave_running:
+            return []
+        return [DashboardState.autosave_loop]
 
-    @rx.event
-    def set_formal_path(self, has_formal: bool):
-        self.has_formal_assessment = has_formal
-        self.show_initial_question = False
+    @rx.event(background=True)
+    async def autosave_loop(self):
+        """Flushes edited fields at most every AUTOSAVE_INTERVAL_SECONDS, then exits when idle."""
+        async with self:
+            if self._autosave_running:
+                return
+            self._autosave_running = True
+        try:
+            while True:
+                await asyncio.sleep(AUTOSAVE_INTERVAL_SECONDS)
+                async with self:
+                    if not self._autosave_dirty or self.has_validation_errors:
+                        self._autosave_running = False
+                        return
+                result = await self._persist_changes()
+                if result is not None:
+                    async with self:
+                        self.last_autosaved = datetime.datetime.now().strftime(
+                            "%H:%M:%S"
+                        )
+        except Exception as e:
+            logging.exception(f"Error autosaving assessment: {e}")
+            async with self:
+                self._autosave_running = False
+                self.autosave_error = (
+                    "Autosave failed at "
+                    f"{datetime.datetime.now().strftime('%H:%M:%S')}; "
+                    "save manually to keep your changes."
+                )
 
-    @rx.event
-    def set_formal_research_score(self, value: str):
-        self.formal_research_score = self._validate_and_clamp("formal_research", value)
+    async def _persist_changes(self) -> tuple[str, list[str]] | None:
+        """Writes the rows changed since the last load or save.
 
-    @rx.event
-    def set_formal_employability_score(self, value: str):
-        self.formal_employability_score = self._validate_and_clamp(
-            "formal_employability", value
-        )
+        Returns (review status, labels of what changed), or None when there was
+        nothing to write or no institution is selected. Autosave stays pending
+        until a write commits, or if the form changed while it was running.
+        """
+        async with self:
+            from app.states.auth_state import AuthState
 
-    @rx.event
-    def set_formal_global_engagement_score(self, value: str):
-        self.formal_global_engagement_score = self._validate_and_clamp(
-            "formal_global", value
-        )
+            hei_state = await self.get_state(HEIState)
+            auth_state = await self.get_state(AuthState)
+            if not hei_state.selected_hei:
+                self._autosave_dirty = False
+                return None
+            institution_id = int(hei_state.selected_hei["id"])
+            current_user_id = auth_state.authenticated_user_id
+            values = await self._field_values()
+            score_rows = _score_rows(values)
+            saved_rows = json.dumps(score_rows)
+            loaded_snapshot = dict(self._loaded_snapshot)
+            loaded_status = self.review_status
+            primary_indicators = [
+                values[field]
+                for field in (
+                    "international_nominations",
+                    "domestic_nominations",
+                    "citations_per_faculty",
+                    "employer_domestic_nominations",
+                    "employer_international_nominations",
+                    "employment_outcomes",
+                    "international_research_network",
+                    "international_faculty_ratio",
+                    "international_student_ratio",
+                    "faculty_student_ratio",
+                    "sustainability_metrics",
+                )
+            ]
+        filled_count = sum((1 for v in primary_indicators if v > 0))
+        review_status = "For Review" if filled_count >= 11 else "In Progress"
+        async with rx.asession() as session:
+            code_to_id = await get_indicator_ids(session)
+        changed_rows = []
+        changes = []
+        for code, value, files in score_rows:
+            if code not in code_to_id:
+                continue
+            stored = loaded_snapshot.get(code)
+            value_changed = stored is None or stored[0] != str(value)
+            files_changed = stored is None or stored[1] != json.dumps(files)
+            if not (value_changed or files_changed):
+                continue
+            changed_rows.append((code, value, files))
+            label = INDICATOR_LABELS.get(code, code)
+            if value_changed:
+                changes.append(label)
+            if files_changed and (stored is not None or files):
+                changes.append(f"{label} evidence")
+        if not changed_rows and review_status == loaded_status:
+            async with self:
+                await self._mark_saved(saved_rows)
+            return None
+        async with rx.asession() as session:
+            if changed_rows:
+                await session.execute(
+                    text("""
+                        INSERT INTO institution_scores (institution_id, indicator_id, user_id, value, value_numeric, evidence_files, ranking_year, review_status)
+                        SELECT CAST(:inst_id AS INTEGER), u.indicator_id, CAST(:user_id AS INTEGER),
+                               u.value, u.value_numeric, u.evidence_files, 2025, CAST(:status AS TEXT)
+                        FROM unnest(
+                            CAST(:ind_ids AS INTEGER[]),
+                            CAST(:vals AS TEXT[]),
+                            CAST(:nums AS DOUBLE PRECISION[]),
+                            CAST(:files AS TEXT[])
+                        ) AS u(indicator_id, value, value_numeric, evidence_files)
+                        ON CONFLICT (institution_id, indicator_id, ranking_year)
+                        DO UPDATE SET 
+                            value = EXCLUDED.value, 
+                            value_numeric = EXCLUDED.value_numeric, 
+                            evidence_files = EXCLUDED.evidence_files, 
+                            user_id = EXCLUDED.user_id,
+                            review_status = EXCLUDED.review_status,
+                            updated_at = CURRENT_TIMESTAMP
+                    """),
+                    {
+                        "inst_id": institution_id,
+                        "user_id": current_user_id,
+                        "status": review_status,
+                        "ind_ids": [code_to_id[code] for code, _, _ in changed_rows],
+                        "vals": [str(value) for _, value, _ in changed_rows],
+                        "nums": [
+                            numeric_value(code, value)
+                            for code, value, _ in changed_rows
+                        ],
+                        "files": [json.dumps(files) for _, _, files in changed_rows],
+                    },
+                )
+            if review_status != loaded_status:
+                await session.execute(
+                    text("""
+                        UPDATE institution_scores SET review_status = :status
+                        WHERE institution_id = :inst_id AND ranking_year = 2025
+                          AND review_status IS DISTINCT FROM :status
+                    """),
+                    {"inst_id": institution_id, "status": review_status},
+                )
+            await refresh_computed_scores(session, [institution_id])
+            await session.commit()
+        await events.scores_changed(institution_id)
+        async with self:
+            self._loaded_snapshot = {
+                **loaded_snapshot,
+                **{
+                    code: [str(value), json.dumps(files)]
+                    for code, value, files in changed_rows
+                },
+            }
+            self.review_status = review_status
+            await self._mark_saved(saved_rows)
+        return (review_status, changes)
 
-    @rx.event
-    def set_formal_learning_experience_score(self, value: str):
-        self.formal_learning_experience_score = self._validate_and_clamp(
-            "formal_learning", value
-        )
+    async def _mark_saved(self, saved_rows: str):
+        """Clears the autosave flag unless the form changed after saved_rows was read."""
+        if json.dumps(_score_rows(await self._field_values())) == saved_rows:
+            self._autosave_dirty = False
+        self.autosave_error = ""
 
-    @rx.event
-    def set_formal_sustainability_score(self, value: str):
-        self.formal_sustainability_score = self._validate_and_clamp(
-            "formal_sustainability", value
-        )
+    @rx.event(background=True)
+    async def save_progress(self, form_data: dict):
+        """Saves only the indicators changed since on_load and updates review status.
 
-    async def _save_uploaded_file(
-        self, file: rx.UploadFile, category: str, inst_id: str
-    ) -> str | None:
-        """Save a single uploaded file. Returns the relative path."""
+        form_data is the assessment form as of the click, so edits still waiting
+        on the autosave idle timer are applied before the write.
+        """
+        async with self:
+            await self._apply_edits(form_data)
+            if self.has_validation_errors:
+                yield rx.toast.error(
+                    "Please correct the validation errors before saving."
+                )
+                return
+            self.is_saving = True
+            hei_state = await self.get_state(HEIState)
+            has_selection = bool(hei_state.selected_hei)
+        if not has_selection:
+            async with self:
+                self.is_saving = False
+            yield rx.toast("No institution selected.")
+            return
         try:
-            relative_dir = f"institution_{inst_id}/{category}"
-            upload_dir = rx.get_upload_dir() / relative_dir
-            upload_dir.mkdir(parents=True, exist_ok=True)
-            import random, string
+            result = await self._persist_changes()
+        except Exception as e:
+            logging.exception(f"Error saving assessment: {e}")
+            async with self:
+                self.is_saving = False
+            yield rx.toast.error("Saving failed. Please try again.")
+            return
+        if result is None:
+            async with self:
+                self.is_saving = False
+            yield rx.toast(
+                "No changes to save.", duration=3000, position="bottom-right"
+            )
+            return
+        review_status, changes = result
+        async with self:
+            self.is_saving = False
+            self.save_successful = True
+            summary = ", ".join(changes) if changes else "review status only"
+            yield rx.toast(
+                f"Data synced successfully. Updated: {summary}. Status: {review_status}",
+                duration=3000,
+                position="bottom-right",
+                close_button=True,
+            )
 
-            unique_name = f"{''.join(random.choices(string.ascii_letters + string.digits, k=6))}_{file.name}"
-            upload_data = await file.read()
-            file_path = upload_dir / unique_name
-            with file_path.open("wb") as f:
-                f.write(upload_data)
-            return f"{relative_dir}/{unique_name}"
-        except Exception as e:
-            logging.exception(f"Error saving file: {e}")
-            return None
+
+class ResearchLensState(DashboardState):
+    """Research & Discovery indicators, evidence and uploads."""
+
+    academic_reputation: int = 0
+    domestic_nominations: int = 0
+    international_nominations: int = 0
+    citations_per_faculty: int = 0
+    uploaded_research_files: list[str] = []
+    is_uploading_research: bool = False
+    upload_progress_research: int = 0
+    upload_count_research: str = ""
 
     @rx.event
     async def handle_research_upload(self, files: list[rx.UploadFile]):
@@ -388,6 +585,28 @@ class DashboardState(rx.State):
         self.uploaded_research_files.extend(saved_files)
         self.is_uploading_research = False
         yield rx.clear_selected_files("upload_research")
+        if saved_files:
+            yield await self._autosave_events()
+
+    @rx.event
+    async def delete_research_file(self, filename: str):
+        self.uploaded_research_files = [
+            f for f in self.uploaded_research_files if f != filename
+        ]
+        return await self._autosave_events()
+
+
+class EmployabilityLensState(DashboardState):
+    """Employability & Outcomes indicators, evidence and uploads."""
+
+    employer_reputation: int = 0
+    employer_domestic_nominations: int = 0
+    employer_international_nominations: int = 0
+    employment_outcomes: int = 0
+    uploaded_employability_files: list[str] = []
+    is_uploading_employability: bool = False
+    upload_progress_employability: int = 0
+    upload_count_employability: str = ""
 
     @rx.event
     async def handle_employability_upload(self, files: list[rx.UploadFile]):
@@ -410,6 +629,28 @@ class DashboardState(rx.State):
         self.uploaded_employability_files.extend(saved_files)
         self.is_uploading_employability = False
         yield rx.clear_selected_files("upload_employability")
+        if saved_files:
+            yield await self._autosave_events()
+
+    @rx.event
+    async def delete_employability_file(self, filename: str):
+        self.uploaded_employability_files = [
+            f for f in self.uploaded_employability_files if f != filename
+        ]
+        return await self._autosave_events()
+
+
+class GlobalEngagementLensState(DashboardState):
+    """Global Engagement indicators, evidence and uploads."""
+
+    international_research_network: int = 0
+    international_faculty_ratio: int = 0
+    international_student_ratio: int = 0
+    international_student_diversity: str = ""
+    uploaded_global_engagement_files: list[str] = []
+    is_uploading_global_engagement: bool = False
+    upload_progress_global_engagement: int = 0
+    upload_count_global_engagement: str = ""
 
     @rx.event
     async def handle_global_engagement_upload(self, files: list[rx.UploadFile]):
@@ -434,6 +675,25 @@ class DashboardState(rx.State):
         self.uploaded_global_engagement_files.extend(saved_files)
         self.is_uploading_global_engagement = False
         yield rx.clear_selected_files("upload_global_engagement")
+        if saved_files:
+            yield await self._autosave_events()
+
+    @rx.event
+    async def delete_global_engagement_file(self, filename: str):
+        self.uploaded_global_engagement_files = [
+            f for f in self.uploaded_global_engagement_files if f != filename
+        ]
+        return await self._autosave_events()
+
+
+class LearningExperienceLensState(DashboardState):
+    """Learning Experience indicator, evidence and uploads."""
+
+    faculty_student_ratio: int = 0
+    uploaded_learning_experience_files: list[str] = []
+    is_uploading_learning_experience: bool = False
+    upload_progress_learning_experience: int = 0
+    upload_count_learning_experience: str = ""
 
     @rx.event
     async def handle_learning_experience_upload(self, files: list[rx.UploadFile]):
@@ -458,6 +718,25 @@ class DashboardState(rx.State):
         self.uploaded_learning_experience_files.extend(saved_files)
         self.is_uploading_learning_experience = False
         yield rx.clear_selected_files("upload_learning_experience")
+        if saved_files:
+            yield await self._autosave_events()
+
+    @rx.event
+    async def delete_learning_experience_file(self, filename: str):
+        self.uploaded_learning_experience_files = [
+            f for f in self.uploaded_learning_experience_files if f != filename
+        ]
+        return await self._autosave_events()
+
+
+class SustainabilityLensState(DashboardState):
+    """Sustainability indicator, evidence and uploads."""
+
+    sustainability_metrics: int = 0
+    uploaded_sustainability_files: list[str] = []
+    is_uploading_sustainability: bool = False
+    upload_progress_sustainability: int = 0
+    upload_count_sustainability: str = ""
 
     @rx.event
     async def handle_sustainability_upload(self, files: list[rx.UploadFile]):
@@ -480,36 +759,68 @@ class DashboardState(rx.State):
         self.uploaded_sustainability_files.extend(saved_files)
         self.is_uploading_sustainability = False
         yield rx.clear_selected_files("upload_sustainability")
+        if saved_files:
+            yield await self._autosave_events()
 
     @rx.event
-    def delete_research_file(self, filename: str):
-        self.uploaded_research_files = [
-            f for f in self.uploaded_research_files if f != filename
+    async def delete_sustainability_file(self, filename: str):
+        self.uploaded_sustainability_files = [
+            f for f in self.uploaded_sustainability_files if f != filename
         ]
+        return await self._autosave_events()
+
+
+class FormalAssessmentState(DashboardState):
+    """Scores and evidence entered on the formal-assessment path."""
+
+    formal_research_score: int = 0
+    formal_employability_score: int = 0
+    formal_global_engagement_score: int = 0
+    formal_learning_experience_score: int = 0
+    formal_sustainability_score: int = 0
+    uploaded_formal_research_files: list[str] = []
+    uploaded_formal_employability_files: list[str] = []
+    uploaded_formal_global_files: list[str] = []
+    uploaded_formal_learning_files: list[str] = []
+    uploaded_formal_sustainability_files: list[str] = []
+    is_uploading_formal_research: bool = False
+    is_uploading_formal_employability: bool = False
+    is_uploading_formal_global: bool = False
+    is_uploading_formal_learning: bool = False
+    is_uploading_formal_sustainability: bool = False
+    upload_progress_formal_research: int = 0
+    upload_progress_formal_employability: int = 0
+    upload_progress_formal_global: int = 0
+    upload_progress_formal_learning: int = 0
+    upload_progress_formal_sustainability: int = 0
 
     @rx.event
-    def delete_employability_file(self, filename: str):
-        self.uploaded_employability_files = [
-            f for f in self.uploaded_employability_files if f != filename
-        ]
+    def set_formal_research_score(self, value: str):
+        self.formal_research_score = self._validate_and_clamp("formal_research", value)
 
     @rx.event
-    def delete_global_engagement_file(self, filename: str):
-        self.uploaded_global_engagement_files = [
-            f for f in self.uploaded_global_engagement_files if f != filename
-        ]
+    def set_formal_employability_score(self, value: str):
+        self.formal_employability_score = self._validate_and_clamp(
+            "formal_employability", value
+        )
 
     @rx.event
-    def delete_learning_experience_file(self, filename: str):
-        self.uploaded_learning_experience_files = [
-            f for f in self.uploaded_learning_experience_files if f != filename
-        ]
+    def set_formal_global_engagement_score(self, value: str):
+        self.formal_global_engagement_score = self._validate_and_clamp(
+            "formal_global", value
+        )
 
     @rx.event
-    def delete_sustainability_file(self, filename: str):
-        self.uploaded_sustainability_files = [
-            f for f in self.uploaded_sustainability_files if f != filename
-        ]
+    def set_formal_learning_experience_score(self, value: str):
+        self.formal_learning_experience_score = self._validate_and_clamp(
+            "formal_learning", value
+        )
+
+    @rx.event
+    def set_formal_sustainability_score(self, value: str):
+        self.formal_sustainability_score = self._validate_and_clamp(
+            "formal_sustainability", value
+        )
 
     @rx.event
     async def handle_formal_research_upload(self, files: list[rx.UploadFile]):
@@ -654,311 +965,45 @@ class DashboardState(rx.State):
             f for f in self.uploaded_formal_sustainability_files if f != filename
         ]
 
-    @rx.event(background=True)
-    async def on_load(self):
-        """Load existing data for the selected institution using optimized batch queries."""
-        async with self:
-            self.is_loading = True
-            hei_state = await self.get_state(HEIState)
-            if not hei_state.selected_hei:
-                self.is_loading = False
-                return
-            institution_id = int(hei_state.selected_hei["id"])
-        async with rx.asession() as session:
-            static_task = self._ensure_static_data(session)
-            scores_task = session.execute(
-                text("""
-                SELECT 
-                    i.code, 
-                    s.value, 
-                    s.evidence_files,
-                    s.review_status
-                FROM institution_scores s
-                JOIN ranking_indicators i ON s.indicator_id = i.id
-                WHERE s.institution_id = :inst_id AND s.ranking_year = 2025
-                """),
-                {"inst_id": institution_id},
-            )
-            await static_task
-            rows = (await scores_task).all()
-            updates = {
-                "review_status": "",
-                "academic_reputation": 0,
-                "uploaded_research_files": [],
-                "domestic_nominations": 0,
-                "international_nominations": 0,
-                "citations_per_faculty": 0,
-                "employer_reputation": 0,
-                "uploaded_employability_files": [],
-                "employer_domestic_nominations": 0,
-                "employer_international_nominations": 0,
-                "employment_outcomes": 0,
-                "international_research_network": 0,
-                "uploaded_global_engagement_files": [],
-                "international_faculty_ratio": 0,
-                "international_student_ratio": 0,
-                "international_student_diversity": "",
-                "faculty_student_ratio": 0,
-                "uploaded_learning_experience_files": [],
-                "sustainability_metrics": 0,
-                "uploaded_sustainability_files": [],
-            }
-            for code, value, evidence, r_status in rows:
-                if r_status:
-                    updates["review_status"] = r_status
-                if code in [
-                    "academic_reputation",
-                    "employer_reputation",
-                    "international_research_network",
-                    "faculty_student_ratio",
-                    "sustainability_metrics",
-                ]:
-                    files = json.loads(evidence) if evidence else []
-                    if code == "academic_reputation":
-                        updates["uploaded_research_files"] = files
-                    elif code == "employer_reputation":
-                        updates["uploaded_employability_files"] = files
-                    elif code == "international_research_network":
-                        updates["uploaded_global_engagement_files"] = files
-                    elif code == "faculty_student_ratio":
-                        updates["uploaded_learning_experience_files"] = files
-                    elif code == "sustainability_metrics":
-                        updates["uploaded_sustainability_files"] = files
-                if code == "international_student_diversity":
-                    updates["international_student_diversity"] = value
-                    continue
-                try:
-                    val = int(float(value)) if value else 0
-                except (ValueError, TypeError):
-                    val = 0
-                if code in updates:
-                    updates[code] = val
-            async with self:
-                for key, val in updates.items():
-                    if hasattr(self, key):
-                        setattr(self, key, val)
-                self.is_loading = False
-
-    async def _ensure_static_data(self, session):
-        """Helper to populate static ranking framework data if missing."""
-        result = await session.execute(text("SELECT COUNT(*) FROM ranking_lenses"))
-        if result.scalar() > 0:
-            return
-        lenses = [
-            ("Research & Discovery", 50.0),
-            ("Employability & Outcomes", 20.0),
-            ("Global Engagement", 15.0),
-            ("Learning Experience", 10.0),
-            ("Sustainability", 5.0),
-        ]
-        lens_ids = {}
-        for name, weight in lenses:
-            res = await session.execute(
-                text(
-                    "INSERT INTO ranking_lenses (lens_name, total_weight_pct) VALUES (:name, :weight) RETURNING id"
-                ),
-                {"name": name, "weight": weight},
-            )
-            lens_ids[name] = res.scalar()
-        indicators = [
-            (
-                lens_ids["Research & Discovery"],
-                "Academic Reputation",
-                "academic_reputation",
-                30.0,
-            ),
-            (
-                lens_ids["Research & Discovery"],
-                "Citations per Faculty",
-                "citations_per_faculty",
-                20.0,
-            ),
-            (
-                lens_ids["Employability & Outcomes"],
-                "Employer Reputation",
-                "employer_reputation",
-                15.0,
-            ),
-            (
-                lens_ids["Employability & Outcomes"],
-                "Employment Outcomes",
-                "employment_outcomes",
-                5.0,
-            ),
-            (
-                lens_ids["Global Engagement"],
-                "International Research Network",
-                "international_research_network",
-                5.0,
-            ),
-            (
-                lens_ids["Global Engagement"],
-                "International Faculty Ratio",
-                "international_faculty_ratio",
-                5.0,
-            ),
-            (
-                lens_ids["Global Engagement"],
-                "International Student Ratio",
-                "international_student_ratio",
-                5.0,
-            ),
-            (
-                lens_ids["Global Engagement"],
-                "International Student Diversity",
-                "international_student_diversity",
-                0.0,
-            ),
-            (
-                lens_ids["Learning Experience"],
-                "Faculty-Student Ratio",
-                "faculty_student_ratio",
-                10.0,
-            ),
-            (
-                lens_ids["Sustainability"],
-                "Sustainability Metrics",
-                "sustainability_metrics",
-                5.0,
-            ),
-        ]
-        for lens_id, name, code, weight in indicators:
-            await session.execute(
-                text(
-                    "INSERT INTO ranking_indicators (lens_id, indicator_name, code, indicator_weight_pct) VALUES (:lid, :name, :code, :weight)"
-                ),
-                {"lid": lens_id, "name": name, "code": code, "weight": weight},
-            )
-        await session.commit()
-
-    @rx.event(background=True)
-    async def save_progress(self):
-        """Batch saves assessment scores and updates review status based on completion."""
-        async with self:
-            if self.has_validation_errors:
-                yield rx.toast.error(
-                    "Please correct the validation errors before saving."
-                )
-                return
-            self.is_saving = True
-            from app.states.auth_state import AuthState
 
-            hei_state = await self.get_state(HEIState)
-            auth_state = await self.get_state(AuthState)
-        if not hei_state.selected_hei:
-            async with self:
-                self.is_saving = False
-            yield rx.toast("No institution selected.")
-            return
-        institution_id = int(hei_state.selected_hei["id"])
-        current_user_id = auth_state.authenticated_user_id
-        primary_indicators = [
-            self.international_nominations,
-            self.domestic_nominations,
-            self.citations_per_faculty,
-            self.employer_domestic_nominations,
-            self.employer_international_nominations,
-            self.employment_outcomes,
-            self.international_research_network,
-            self.international_faculty_ratio,
-            self.international_student_ratio,
-            self.faculty_student_ratio,
-            self.sustainability_metrics,
-        ]
-        filled_count = sum((1 for v in primary_indicators if v > 0))
-        review_status = "For Review" if filled_count >= 11 else "In Progress"
-        async with rx.asession() as session:
-            ind_rows = await session.execute(
-                text("SELECT code, id FROM ranking_indicators")
-            )
-            code_to_id = {row[0]: row[1] for row in ind_rows.all()}
-            calc_academic_rep = int(
-                float(self.international_nominations) * 0.85
-                + float(self.domestic_nominations) * 0.15
-            )
-            calc_employer_rep = int(
-                float(self.employer_domestic_nominations) * 0.5
-                + float(self.employer_international_nominations) * 0.5
-            )
-            scores_batch = [
-                (
-                    "academic_reputation",
-                    calc_academic_rep,
-                    self.uploaded_research_files,
-                ),
-                ("domestic_nominations", self.domestic_nominations, []),
-                ("international_nominations", self.international_nominations, []),
-                ("citations_per_faculty", self.citations_per_faculty, []),
-                (
-                    "employer_reputation",
-                    calc_employer_rep,
-                    self.uploaded_employability_files,
-                ),
-                (
-                    "employer_domestic_nominations",
-                    self.employer_domestic_nominations,
-                    [],
-                ),
-                (
-                    "employer_international_nominations",
-                    self.employer_international_nominations,
-                    [],
-                ),
-                ("employment_outcomes", self.employment_outcomes, []),
-                (
-                    "international_research_network",
-                    self.international_research_network,
-                    self.uploaded_global_engagement_files,
-                ),
-                ("international_faculty_ratio", self.international_faculty_ratio, []),
-                ("international_student_ratio", self.international_student_ratio, []),
-                (
-                    "international_student_diversity",
-                    self.international_student_diversity,
-                    [],
-                ),
-                (
-                    "faculty_student_ratio",
-                    self.faculty_student_ratio,
-                    self.uploaded_learning_experience_files,
-                ),
-                (
-                    "sustainability_metrics",
-                    self.sustainability_metrics,
-                    self.uploaded_sustainability_files,
-                ),
-            ]
-            for code, value, files in scores_batch:
-                if code in code_to_id:
-                    await session.execute(
-                        text("""
-                            INSERT INTO institution_scores (institution_id, indicator_id, user_id, value, evidence_files, ranking_year, review_status)
-                            VALUES (:inst_id, :ind_id, :user_id, :val, :files, 2025, :status)
-                            ON CONFLICT (institution_id, indicator_id, ranking_year)
-                            DO UPDATE SET 
-                                value = EXCLUDED.value, 
-                                evidence_files = EXCLUDED.evidence_files, 
-                                user_id = EXCLUDED.user_id,
-                                review_status = EXCLUDED.review_status,
-                                updated_at = CURRENT_TIMESTAMP
-                        """),
-                        {
-                            "inst_id": institution_id,
-                            "ind_id": code_to_id[code],
-                            "user_id": current_user_id,
-                            "val": str(value),
-                            "files": json.dumps(files),
-                            "status": review_status,
-                        },
-                    )
-            await session.commit()
-        async with self:
-            self.review_status = review_status
-            self.is_saving = False
-            self.save_successful = True
-            yield rx.toast(
-                f"Data synced successfully. Status: {review_status}",
-                duration=3000,
-                position="bottom-right",
-                close_button=True,
-            )
\ No newline at end of file
+LENS_STATES = (
+    ResearchLensState,
+    EmployabilityLensState,
+    GlobalEngagementLensState,
+    LearningExperienceLensState,
+    SustainabilityLensState,
+)
+LENS_FIELDS = {
+    ResearchLensState: (
+        "academic_reputation",
+        "domestic_nominations",
+        "international_nominations",
+        "citations_per_faculty",
+        "uploaded_research_files",
+    ),
+    EmployabilityLensState: (
+        "employer_reputation",
+        "employer_domestic_nominations",
+        "employer_international_nominations",
+        "employment_outcomes",
+        "uploaded_employability_files",
+    ),
+    GlobalEngagementLensState: (
+        "international_research_network",
+        "international_faculty_ratio",
+        "international_student_ratio",
+        "international_student_diversity",
+        "uploaded_global_engagement_files",
+    ),
+    LearningExperienceLensState: (
+        "faculty_student_ratio",
+        "uploaded_learning_experience_files",
+    ),
+    SustainabilityLensState: (
+        "sustainability_metrics",
+        "uploaded_sustainability_files",
+    ),
+}
+FIELD_STATES = {
+    field: lens_cls for lens_cls, fields in LENS_FIELDS.items() for field in fields
+}
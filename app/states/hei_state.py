@@ -3,6 +3,14 @@ from typing import TypedDict, Optional
 import asyncio
 from sqlalchemy import text
 import logging
+from app.utils import events
+from app.utils.db_utils import get_cached_institutions, load_institutions
+from app.utils.institution_search import (
+    MIN_QUERY_LENGTH,
+    hei_from_row,
+    normalize_query,
+    search_institutions,
+)
 
 
 class HEI(TypedDict):
@@ -23,8 +31,6 @@ class HEIState(rx.State):
     hei_database: list[HEI] = []
     search_results: list[HEI] = []
     search_query: str = ""
-    _search_cache: dict[str, list[HEI]] = {}
-    _search_cache_max_size: int = 50
     _search_version: int = 0
     _last_search_query: str = ""
     selected_hei_id: str = ""
@@ -234,14 +240,20 @@ class HEIState(rx.State):
 
     @rx.var(cache=True)
     def filtered_database(self) -> list[HEI]:
-        if not self.search_query.strip():
+        """Every match of the search, which the selection table pages over.
+
+        Queries too short for the trigram search filter the loaded directory.
+        """
+        if not self.search_query:
             return self.hei_database
-        query = self.search_query.lower()
-        return [
-            hei
-            for hei in self.hei_database
-            if query in hei["name"].lower() or query in hei["address"].lower()
-        ]
+        if len(self.search_query) < MIN_QUERY_LENGTH:
+            query = self.search_query.lower()
+            return [
+                hei
+                for hei in self.hei_database
+                if query in hei["name"].lower() or query in hei["address"].lower()
+            ]
+        return self.search_results
 
     @rx.var(cache=True)
     def total_pages(self) -> int:
@@ -289,8 +301,9 @@ class HEIState(rx.State):
 
     @rx.event
     def set_search_query(self, query: str):
-        self.search_query = query.strip()
+        self.search_query = normalize_query(query)
         self.current_page = 1
+        return HEIState.perform_search
 
     @rx.event
     def clear_search(self):
@@ -298,66 +311,37 @@ class HEIState(rx.State):
         self.selected_hei = None
         self.selected_hei_id = ""
         self.search_results = []
+        self._last_search_query = ""
         self.is_dropdown_open = False
         self.ranking_framework = ""
 
     @rx.event(background=True)
     async def perform_search(self):
-        """Search institutions in the database based on query with caching and versioning."""
+        """Searches institutions in Postgres, dropping responses to superseded queries."""
         async with self:
-            sanitized_query = self.search_query.strip()
-            if not sanitized_query or len(sanitized_query) < 2:
+            sanitized_query = self.search_query
+            if len(sanitized_query) < MIN_QUERY_LENGTH:
+                self._search_version += 1
                 self.is_searching = False
                 self.search_results = []
+                self._last_search_query = ""
                 return
+            self._search_version += 1
             if sanitized_query == self._last_search_query:
-                return
-            if sanitized_query in self._search_cache:
-                self.search_results = self._search_cache[sanitized_query]
                 self.is_searching = False
-                self._last_search_query = sanitized_query
                 return
             self.is_searching = True
-            self._search_version += 1
             current_version = self._search_version
-        query_text = f"%{sanitized_query}%"
-        async with rx.asession() as session:
-            try:
-                result = await session.execute(
-                    text("""
-                        SELECT id, institution_name, street_address, city_municipality, 'Private', admin_name 
-                        FROM institutions 
-                        WHERE institution_name ILIKE :query 
-                        ORDER BY institution_name ASC
-                        LIMIT 8
-                    """),
-                    {"query": query_text},
-                )
-                rows = result.all()
-                results = [
-                    {
-                        "id": str(row[0]),
-                        "name": row[1],
-                        "address": f"{row[2]}, {row[3]}",
-                        "type": row[4],
-                        "street": row[2],
-                        "city": row[3],
-                        "admin_name": row[5] if row[5] else "Not Assigned",
-                    }
-                    for row in rows
-                ]
-            except Exception as e:
-                logging.exception(f"Search error: {e}")
-                results = []
+        try:
+            results = await search_institutions(sanitized_query)
+        except Exception as e:
+            logging.exception(f"Search error: {e}")
+            results = []
         async with self:
             if self._search_version == current_version:
                 self.search_results = results
                 self.is_searching = False
                 self._last_search_query = sanitized_query
-                self._search_cache[sanitized_query] = results
-                if len(self._search_cache) > self._search_cache_max_size:
-                    first_key = next(iter(self._search_cache))
-                    self._search_cache.pop(first_key)
 
     @rx.event
     def set_is_dropdown_open(self, value: bool):
@@ -422,41 +406,30 @@ class HEIState(rx.State):
     def set_reg_admin(self, value: str):
         self.reg_admin = value
 
+    async def _query_institutions(self) -> list[dict[str, str]]:
+        """Reads the institution directory used by the selection page."""
+        async with rx.asession() as session:
+            result = await session.execute(
+                text(
+                    "SELECT id, institution_name, street_address, city_municipality, 'Private', admin_name FROM institutions ORDER BY institution_name ASC"
+                )
+            )
+            return [hei_from_row(row) for row in result.all()]
+
     @rx.event(background=True)
     async def fetch_institutions(self):
         """Loads all institutions from the database with aggressive caching."""
-        from app.utils.db_utils import get_cached_institutions, set_cached_institutions
-
+        cached_data = await get_cached_institutions()
         async with self:
-            cached_data = get_cached_institutions()
             if cached_data:
                 self.hei_database = cached_data
                 self.is_fetching = False
                 return
             self.is_fetching = True
         try:
-            async with rx.asession() as session:
-                result = await session.execute(
-                    text(
-                        "SELECT id, institution_name, street_address, city_municipality, 'Private', admin_name FROM institutions ORDER BY institution_name ASC"
-                    )
-                )
-                rows = result.all()
-                data = [
-                    {
-                        "id": str(row[0]),
-                        "name": row[1],
-                        "address": f"{row[2]}, {row[3]}",
-                        "type": row[4],
-                        "street": row[2],
-                        "city": row[3],
-                        "admin_name": row[5] if row[5] else "Not Assigned",
-                    }
-                    for row in rows
-                ]
-                set_cached_institutions(data)
-                async with self:
-                    self.hei_database = data
+            data = await load_institutions(self._query_institutions)
+            async with self:
+                self.hei_database = data
         except Exception as e:
             logging.exception(f"Error fetching institutions: {e}")
         finally:
@@ -498,6 +471,7 @@ class HEIState(rx.State):
                 new_hei = result.first()
                 await session.commit()
                 if new_hei:
+                    await events.institution_changed(new_hei[0])
                     async with self:
                         self.selected_hei = {
                             "id": str(new_hei[0]),
@@ -2,22 +2,13 @@ import reflex as rx
 from typing import TypedDict, Any
 import json
 import logging
-import asyncio
-import os
-import re
 from sqlalchemy import text
 from app.states.hei_state import HEIState
 from app.states.historical_state import HistoricalState
+from app.utils import ai_gateway
+from app.utils import recommendations as recommendations_store
 
-try:
-    from google import genai
-    from google.genai import types
-
-    GOOGLE_AI_API_KEY = os.getenv("GOOGLE_API_KEY")
-    GOOGLE_AI_AVAILABLE = bool(GOOGLE_AI_API_KEY)
-except ImportError as e:
-    logging.exception(f"Google AI SDK not found: {e}")
-    GOOGLE_AI_AVAILABLE = False
+AI_INSIGHTS_MODEL = "gemini-2.0-flash"
 
 
 class HistoricalAnalyticsState(rx.State):
@@ -276,7 +267,7 @@ class HistoricalAnalyticsState(rx.State):
     async def generate_ai_insights(self):
         async with self:
             data = self.cached_trend_data
-        if not GOOGLE_AI_AVAILABLE:
+        if not ai_gateway.AI_AVAILABLE:
             async with self:
                 self.ai_insights = self._get_fallback_insights(data)
             return
@@ -286,57 +277,38 @@ class HistoricalAnalyticsState(rx.State):
             hei_name = (
                 hei.selected_hei["name"] if hei.selected_hei else "the institution"
             )
+        fingerprint = recommendations_store.fingerprint(
+            recommendations_store.HISTORICAL_KIND,
+            AI_INSIGHTS_MODEL,
+            data,
+            context=hei_name,
+        )
+        stored_insights = await recommendations_store.get_stored(fingerprint)
+        if stored_insights:
+            async with self:
+                self.ai_insights = stored_insights
+                self.is_generating_ai = False
+            return
         try:
             prompt = f"Analyze the historical performance of {hei_name} based on this data: {json.dumps(data)}. Provide 3 strategic insights regarding their improvement trends, volatility, and areas of consistent strength in a valid JSON list of objects with 'title' and 'description' keys. Return ONLY JSON."
-            client = genai.Client(api_key=GOOGLE_AI_API_KEY)
-            max_retries = 5
-            response_text = ""
-            for attempt in range(max_retries):
-                try:
-                    response = await client.aio.models.generate_content(
-                        model="gemini-2.0-flash",
-                        contents=prompt,
-                        config=types.GenerateContentConfig(
-                            response_mime_type="application/json"
-                        ),
-                    )
-                    if response and response.text:
-                        response_text = response.text
-                        break
-                except Exception as e:
-                    error_str = str(e)
-                    if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
-                        logging.warning(
-                            "Google AI quota exhausted immediately (429). Switching to fallback insights."
-                        )
-                        break
-                    is_retriable = "503" in error_str or "UNAVAILABLE" in error_str
-                    if is_retriable:
-                        if attempt == max_retries - 1:
-                            logging.info(
-                                "Google AI service unavailable after all retries. Using fallback insights."
-                            )
-                            break
-                        wait_time = 2.0 * 2**attempt
-                        retry_match = re.search("retry in (\\d+(\\.\\d+)?)s", error_str)
-                        if retry_match:
-                            wait_time = float(retry_match.group(1)) + 1.0
-                        wait_time = min(wait_time, 60.0)
-                        logging.warning(
-                            f"Google AI service error. Retrying in {wait_time:.2f}s (Attempt {attempt + 1}/{max_retries})"
-                        )
-                        await asyncio.sleep(wait_time)
-                    else:
-                        logging.exception(f"Non-retriable AI error: {e}")
-                        break
-            if not response_text:
-                logging.warning(
-                    "No response text received from AI. Generating fallback insights."
+            try:
+                insights = await ai_gateway.generate_json(
+                    prompt,
+                    recommendations_store.INSIGHTS_SCHEMA,
+                    model=AI_INSIGHTS_MODEL,
+                    retries=1,
                 )
+            except ai_gateway.AIGenerationError as e:
+                logging.warning(f"AI insights unavailable, using fallback: {e}")
                 async with self:
                     self.ai_insights = self._get_fallback_insights(data)
                 return
-            insights = json.loads(response_text)
+            await recommendations_store.store(
+                fingerprint,
+                recommendations_store.HISTORICAL_KIND,
+                AI_INSIGHTS_MODEL,
+                insights,
+            )
             async with self:
                 self.ai_insights = insights
         except Exception as e:
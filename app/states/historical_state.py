@@ -6,6 +6,7 @@ import asyncio
 from sqlalchemy import text
 from app.states.hei_state import HEIState
 from app.states.auth_state import AuthState
+from app.utils import scoring
 
 
 class HistoricalState(rx.State):
@@ -58,28 +59,20 @@ class HistoricalState(rx.State):
 
     @rx.var(cache=True)
     def selected_year_overall_score(self) -> int:
-        """Returns the actual weighted score calculation based on specific ranking methodology."""
-        research = (
-            float(self.academic_reputation) * 0.3
-            + float(self.citations_per_faculty) * 0.2
-        )
-        employability = (
-            float(self.employer_reputation) * 0.15
-            + float(self.employment_outcomes) * 0.05
-        )
-        global_engagement = (
-            (
-                float(self.international_research_network)
-                + float(self.international_faculty_ratio)
-                + float(self.international_student_ratio)
-            )
-            / 3.0
-            * 0.15
-        )
-        learning = float(self.faculty_student_ratio) * 0.1
-        sustainability = float(self.sustainability_metrics) * 0.05
-        total = research + employability + global_engagement + learning + sustainability
-        return int(round(total))
+        """Returns the overall score from the shared scoring engine."""
+        return scoring.score_one(
+            {
+                "academic_reputation": self.academic_reputation,
+                "citations_per_faculty": self.citations_per_faculty,
+                "employer_reputation": self.employer_reputation,
+                "employment_outcomes": self.employment_outcomes,
+                "international_research_network": self.international_research_network,
+                "international_faculty_ratio": self.international_faculty_ratio,
+                "international_student_ratio": self.international_student_ratio,
+                "faculty_student_ratio": self.faculty_student_ratio,
+                "sustainability_metrics": self.sustainability_metrics,
+            }
+        )["overall_score"]
 
     def _validate_indicator(self, key: str, value: str) -> int:
         """Internal helper to validate 0-100 range and update errors."""
@@ -496,28 +489,26 @@ class HistoricalState(rx.State):
             year = int(self.selected_year)
             acad_rep = float(self.academic_reputation)
             cit_fac = float(self.citations_per_faculty)
-            research_part = acad_rep * 0.3 + cit_fac * 0.2
             emp_rep = float(self.employer_reputation)
             emp_out = float(self.employment_outcomes)
-            employability_part = emp_rep * 0.15 + emp_out * 0.05
             irn = float(self.international_research_network)
             ifr = float(self.international_faculty_ratio)
             isr = float(self.international_student_ratio)
-            global_part = (irn + ifr + isr) / 3.0 * 0.15
             fsr = float(self.faculty_student_ratio)
-            learning_part = fsr * 0.1
             sust = float(self.sustainability_metrics)
-            sustainability_part = sust * 0.05
-            overall = (
-                research_part
-                + employability_part
-                + global_part
-                + learning_part
-                + sustainability_part
+            scores = scoring.score_one(
+                {
+                    "academic_reputation": acad_rep,
+                    "citations_per_faculty": cit_fac,
+                    "employer_reputation": emp_rep,
+                    "employment_outcomes": emp_out,
+                    "international_research_network": irn,
+                    "international_faculty_ratio": ifr,
+                    "international_student_ratio": isr,
+                    "faculty_student_ratio": fsr,
+                    "sustainability_metrics": sust,
+                }
             )
-            research_score_legacy = acad_rep * 0.6 + cit_fac * 0.4
-            emp_score_legacy = emp_rep * 0.75 + emp_out * 0.25
-            global_score_legacy = (irn + ifr + isr) / 3.0
             files_json = json.dumps(self.uploaded_files)
         async with rx.asession() as session:
             await session.execute(
@@ -567,19 +558,19 @@ class HistoricalState(rx.State):
                     "year": year,
                     "ar": acad_rep,
                     "cf": cit_fac,
-                    "rs": research_score_legacy,
+                    "rs": scores["research_score"],
                     "er": emp_rep,
                     "eo": emp_out,
-                    "es": emp_score_legacy,
+                    "es": scores["employability_score"],
                     "irn": irn,
                     "ifr": ifr,
                     "isr": isr,
-                    "gs": global_score_legacy,
+                    "gs": scores["global_engagement_score"],
                     "fsr": fsr,
-                    "ls": fsr,
+                    "ls": scores["learning_experience_score"],
                     "sm": sust,
-                    "ss": sust,
-                    "ov": overall,
+                    "ss": scores["sustainability_score"],
+                    "ov": scores["overall_score"],
                     "files": files_json,
                     "uid": user_id,
                 },
@@ -1,12 +1,28 @@
 import reflex as rx
 from app.states.hei_state import HEIState, HEI
-import asyncio
 import logging
 from sqlalchemy import text
+from app.utils import events, keyset
+from app.utils.institution_search import (
+    INSTITUTION_SORTS,
+    MIN_QUERY_LENGTH,
+    count_institutions,
+    fetch_institution_page,
+    normalize_query,
+)
 
 
 class InstitutionsState(rx.State):
     search_query: str = ""
+    paginated_heis: list[HEI] = []
+    directory_total: int = 0
+    total_count: int = 0
+    has_next_page: bool = False
+    sort_key: str = "name"
+    sort_desc: bool = False
+    _page_cursors: list = [None]
+    _page_buffer: dict[int, dict] = {}
+    _page_version: int = 0
     delete_confirm_id: str = ""
     delete_confirm_name: str = ""
     show_delete_modal: bool = False
@@ -176,7 +192,7 @@ class InstitutionsState(rx.State):
                     "SELECT setval(pg_get_serial_sequence('institutions', 'id'), COALESCE((SELECT MAX(id) FROM institutions), 0) + 1, false);"
                 )
             )
-            await session.execute(
+            result = await session.execute(
                 text("""
                     INSERT INTO institutions (
                         institution_name, 
@@ -198,6 +214,7 @@ class InstitutionsState(rx.State):
                         :zip, 
                         'QS'
                     )
+                    RETURNING id
                 """),
                 {
                     "name": name,
@@ -209,90 +226,191 @@ class InstitutionsState(rx.State):
                     "zip": zip_code,
                 },
             )
+            new_id = result.scalar()
             await session.commit()
+        await events.institution_changed(new_id)
         async with self:
             self.is_registering = False
             self.show_register_modal = False
             yield rx.toast("New institution registered successfully!")
-            hei_state = await self.get_state(HEIState)
-            yield HEIState.fetch_institutions
+            yield InstitutionsState.reload_page
 
     @rx.var(cache=True)
-    async def stats(self) -> dict[str, int]:
-        """Calculate statistics based on the HEI database."""
-        hei_state = await self.get_state(HEIState)
-        total = len(hei_state.hei_database)
-        return {"total": total}
+    def stats(self) -> dict[str, int]:
+        """Statistics for the whole directory, independent of the search."""
+        return {"total": self.directory_total}
 
-    @rx.var(cache=True)
-    async def filtered_heis(self) -> list[HEI]:
-        """Filter HEIs based on search query (Name, Address, or ID)."""
-        hei_state = await self.get_state(HEIState)
-        if not self.search_query:
-            return hei_state.hei_database
-        query = self.search_query.lower()
-        return [
-            h
-            for h in hei_state.hei_database
-            if query in h["name"].lower()
-            or query in h["address"].lower()
-            or query in str(h["id"]).lower()
-        ]
+    def _page_params(self) -> tuple[str, str, bool, int]:
+        return (self.search_query, self.sort_key, self.sort_desc, self.page_size)
 
-    @rx.var(cache=True)
-    async def total_pages(self) -> int:
-        total = len(await self.filtered_heis)
-        if total == 0:
-            return 1
-        return (total + self.page_size - 1) // self.page_size
+    async def _fetch_page(
+        self, params: tuple[str, str, bool, int], after: tuple | None
+    ) -> tuple[list[HEI], bool]:
+        query, sort, descending, page_size = params
+        async with rx.asession() as session:
+            return await fetch_institution_page(
+                session, query, sort, descending, after, page_size
+            )
 
-    @rx.var(cache=True)
-    async def paginated_heis(self) -> list[HEI]:
-        start = (self.current_page - 1) * self.page_size
-        end = start + self.page_size
-        return (await self.filtered_heis)[start:end]
+    def _show_page(self, page: int, rows: list[HEI], has_next: bool):
+        """Displays rows as page, keeping only its neighbours in the buffer."""
+        self.paginated_heis = rows
+        self.has_next_page = has_next
+        self.current_page = page
+        self._page_cursors = self._page_cursors[:page] + [
+            keyset.cursor(rows, INSTITUTION_SORTS[self.sort_key][1])
+        ]
+        buffer = {p: v for p, v in self._page_buffer.items() if abs(p - page) <= 1}
+        buffer[page] = {"rows": rows, "has_next": has_next}
+        self._page_buffer = buffer
 
-    @rx.event
-    def set_page_size(self, value: str):
-        self.page_size = int(value)
-        self.current_page = 1
+    async def _prefetch(self, version: int, params: tuple, page: int):
+        """Loads an adjacent page into the buffer so turning to it needs no query."""
+        async with self:
+            if (
+                self._page_version != version
+                or page < 1
+                or page in self._page_buffer
+                or page > len(self._page_cursors)
+                or (page > self.current_page and not self.has_next_page)
+            ):
+                return
+            after = self._page_cursors[page - 1]
+        try:
+            rows, has_next = await self._fetch_page(params, after)
+        except Exception as e:
+            logging.exception(f"Error prefetching institutions page {page}: {e}")
+            return
+        async with self:
+            if self._page_version == version and abs(page - self.current_page) <= 1:
+                self._page_buffer = {
+                    **self._page_buffer,
+                    page: {"rows": rows, "has_next": has_next},
+                }
 
-    @rx.event(background=True)
-    async def next_page(self):
+    async def _load_first_page(self):
+        """Restarts paging for the current search, sort and page size."""
         async with self:
-            if self.current_page < await self.total_pages:
-                self.current_page += 1
-                self.is_loading_page = True
-        await asyncio.sleep(0.2)
+            self._page_version += 1
+            version = self._page_version
+            params = self._page_params()
+            self._page_cursors = [None]
+            self._page_buffer = {}
+            self.is_loading_page = True
+        searching = len(normalize_query(params[0])) >= MIN_QUERY_LENGTH
+        try:
+            async with rx.asession() as session:
+                rows, has_next = await fetch_institution_page(
+                    session, params[0], params[1], params[2], None, params[3]
+                )
+                total = await count_institutions(session, params[0])
+                directory_total = (
+                    await count_institutions(session) if searching else total
+                )
+        except Exception as e:
+            logging.exception(f"Error fetching institutions: {e}")
+            async with self:
+                self.is_loading_page = False
+            return
         async with self:
+            if self._page_version != version:
+                return
+            self._show_page(1, rows, has_next)
+            self.total_count = total
+            self.directory_total = directory_total
             self.is_loading_page = False
+        await self._prefetch(version, params, 2)
+
+    def _turn_page(self, step: int):
+        """Shows the adjacent page from the buffer, or starts fetching it.
+
+        A buffered page is swapped in by this event's own delta; the loading
+        indicator is only shown when the page has to be queried.
+        """
+        page = self.current_page + step
+        if page < 1 or (step > 0 and not self.has_next_page) or self.is_loading_page:
+            return
+        buffered = self._page_buffer.get(page)
+        if buffered:
+            self._show_page(page, buffered["rows"], buffered["has_next"])
+            return InstitutionsState.prefetch_page(page + step)
+        self.is_loading_page = True
+        return InstitutionsState.fetch_page(page)
 
     @rx.event(background=True)
-    async def prev_page(self):
+    async def fetch_page(self, page: int):
         async with self:
-            if self.current_page > 1:
-                self.current_page -= 1
-                self.is_loading_page = True
-        await asyncio.sleep(0.2)
+            version = self._page_version
+            params = self._page_params()
+            after = self._page_cursors[page - 1]
+        try:
+            rows, has_next = await self._fetch_page(params, after)
+        except Exception as e:
+            logging.exception(f"Error fetching institutions page {page}: {e}")
+            async with self:
+                self.is_loading_page = False
+            return
         async with self:
+            if self._page_version != version:
+                return
+            step = page - self.current_page
+            self._show_page(page, rows, has_next)
             self.is_loading_page = False
+        await self._prefetch(version, params, page + step)
+
+    @rx.event(background=True)
+    async def prefetch_page(self, page: int):
+        async with self:
+            version = self._page_version
+            params = self._page_params()
+        await self._prefetch(version, params, page)
+
+    @rx.event(background=True)
+    async def reload_page(self):
+        await self._load_first_page()
+
+    @rx.var(cache=True)
+    def total_pages(self) -> int:
+        return keyset.total_pages(
+            self.total_count, self.page_size, self.current_page, self.has_next_page
+        )
+
+    @rx.event
+    def set_page_size(self, value: str):
+        self.page_size = int(value)
+        return InstitutionsState.reload_page
+
+    @rx.event
+    def toggle_sort_direction(self):
+        self.sort_desc = not self.sort_desc
+        return InstitutionsState.reload_page
+
+    @rx.event
+    def next_page(self):
+        return self._turn_page(1)
+
+    @rx.event
+    def prev_page(self):
+        return self._turn_page(-1)
 
     @rx.event
     def set_search_query(self, query: str):
-        self.search_query = query
+        self.search_query = normalize_query(query)
+        return InstitutionsState.reload_page
+
+    def _find_hei(self, hei_id: str) -> HEI | None:
+        return next((h for h in self.paginated_heis if h["id"] == hei_id), None)
 
     @rx.event
-    async def view_details(self, hei_id: str):
-        hei_state = await self.get_state(HEIState)
-        hei = next((h for h in hei_state.hei_database if h["id"] == hei_id), None)
+    def view_details(self, hei_id: str):
+        hei = self._find_hei(hei_id)
         if hei:
             self.selected_hei_data = hei
             self.show_view_modal = True
 
     @rx.event
-    async def edit_institution(self, hei_id: str):
-        hei_state = await self.get_state(HEIState)
-        hei = next((h for h in hei_state.hei_database if h["id"] == hei_id), None)
+    def edit_institution(self, hei_id: str):
+        hei = self._find_hei(hei_id)
         if hei:
             self.selected_hei_data = hei
             self.edit_name = hei["name"]
@@ -302,12 +420,9 @@ class InstitutionsState(rx.State):
             self.show_edit_modal = True
 
     @rx.event
-    async def on_load(self):
-        """Triggers data fetching when the institutions management page is visited."""
-        from app.states.hei_state import HEIState
-
-        hei_state = await self.get_state(HEIState)
-        yield HEIState.fetch_institutions
+    def on_load(self):
+        """Loads the first page when the institutions management page is visited."""
+        return InstitutionsState.reload_page
 
     @rx.event
     def close_modals(self):
@@ -344,12 +459,12 @@ class InstitutionsState(rx.State):
                 },
             )
             await session.commit()
+        await events.institution_changed(int(hei_id))
         async with self:
             self.is_saving_edit = False
             self.show_edit_modal = False
             yield rx.toast("Institution updated successfully.")
-            hei_state = await self.get_state(HEIState)
-            yield HEIState.fetch_institutions
+            yield InstitutionsState.reload_page
 
     @rx.event
     def confirm_delete(self, hei_id: str, hei_name: str):
@@ -384,6 +499,7 @@ class InstitutionsState(rx.State):
                 text("DELETE FROM institutions WHERE id = :id"), {"id": int(hei_id)}
             )
             await session.commit()
+        await events.institution_changed(int(hei_id))
         async with self:
             hei_state = await self.get_state(HEIState)
             hei_state.hei_database = [
@@ -407,4 +523,5 @@ class InstitutionsState(rx.State):
                 f"Institution '{hei_name}' has been deleted from the database.",
                 duration=3000,
                 position="top-center",
-            )
\ No newline at end of file
+            )
+            yield InstitutionsState.reload_page
\ No newline at end of file
@@ -134,11 +134,10 @@ class PostAssessmentState(rx.State):
 
     @rx.event(background=True)
     async def on_load(self):
-        """Initialize tables and verify institution context."""
+        """Load or create the QS Stars assessment for the selected institution."""
         async with self:
             self.is_loading = True
         async with rx.asession() as session:
-            await self._ensure_tables(session)
             async with self:
                 hei_state = await self.get_state(HEIState)
             if not hei_state.selected_hei:
@@ -171,55 +170,6 @@ class PostAssessmentState(rx.State):
         async with self:
             self.is_loading = False
 
-    async def _ensure_tables(self, session):
-        await session.execute(
-            text("""
-            CREATE TABLE IF NOT EXISTS qs_stars_assessments (
-                id SERIAL PRIMARY KEY,
-                institution_id INTEGER NOT NULL,
-                methodology_version VARCHAR(50),
-                overall_stars INTEGER DEFAULT 0,
-                teaching_stars INTEGER DEFAULT 0,
-                employability_stars INTEGER DEFAULT 0,
-                academic_development_stars INTEGER DEFAULT 0,
-                inclusiveness_stars INTEGER DEFAULT 0,
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(institution_id)
-            );
-        """)
-        )
-        await session.execute(
-            text("""
-            CREATE TABLE IF NOT EXISTS qs_indicator_scores (
-                id SERIAL PRIMARY KEY,
-                assessment_id INTEGER REFERENCES qs_stars_assessments(id),
-                indicator_name VARCHAR(255),
-                category VARCHAR(100),
-                points_achieved DECIMAL(10, 2),
-                max_score DECIMAL(10, 2),
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(assessment_id, indicator_name)
-            );
-        """)
-        )
-        await session.execute(
-            text("""
-            CREATE TABLE IF NOT EXISTS qs_action_plans (
-                id SERIAL PRIMARY KEY,
-                assessment_id INTEGER REFERENCES qs_stars_assessments(id),
-                indicator_name VARCHAR(255),
-                current_score DECIMAL(10, 2),
-                target_score DECIMAL(10, 2),
-                notes TEXT,
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(assessment_id, indicator_name)
-            );
-        """)
-        )
-        await session.commit()
-
     async def _seed_default_indicators(self, session, assessment_id):
         """This method is now a no-op as we pull directly from lens configuration."""
         pass
@@ -287,7 +237,7 @@ class PostAssessmentState(rx.State):
                 SELECT 
                     i.indicator_name, 
                     l.lens_name as category, 
-                    COALESCE(CAST(s.value AS DECIMAL), 0) as achieved,
+                    COALESCE(s.value_numeric, CAST(s.value AS DECIMAL), 0) as achieved,
                     i.indicator_weight_pct as max_s
                 FROM ranking_indicators i
                 JOIN ranking_lenses l ON i.lens_id = l.id
@@ -3,28 +3,22 @@ from typing import TypedDict
 import datetime
 import io
 import csv
-import json
 import logging
-import os
-import re
-import asyncio
-import time
 from sqlalchemy import text
-
-REPORT_AI_CACHE = {}
-REPORT_CACHE_TTL = 3600
-try:
-    from google import genai
-    from google.genai import types
-
-    GOOGLE_AI_API_KEY = os.getenv("GOOGLE_API_KEY")
-    GOOGLE_AI_AVAILABLE = bool(GOOGLE_AI_API_KEY)
-except ImportError as e:
-    logging.exception(f"google-genai package not installed: {e}")
-    GOOGLE_AI_AVAILABLE = False
-except Exception as e:
-    logging.exception(f"Error configuring Google AI: {e}")
-    GOOGLE_AI_AVAILABLE = False
+from app.utils import ai_gateway
+from app.utils import recommendations as recommendations_store
+from app.utils.computed_scores import (
+    REPORT_SORTS,
+    count_reports,
+    fetch_report_page,
+    fetch_report_rows,
+    fetch_status_counts,
+    refresh_computed_scores,
+)
+from app.utils import events, keyset
+from app.utils.db_utils import load_report_counts
+
+REPORT_AI_MODEL = recommendations_store.REPORT_MODEL
 
 
 class ReportItem(TypedDict):
@@ -48,6 +42,14 @@ class ReportsState(rx.State):
     show_reset_modal: bool = False
     is_resetting: bool = False
     reports: list[ReportItem] = []
+    status_counts: dict[str, int] = {}
+    total_count: int = 0
+    has_next_page: bool = False
+    sort_key: str = "name"
+    sort_desc: bool = False
+    _page_cursors: list = [None]
+    _page_buffer: dict[int, dict] = {}
+    _page_version: int = 0
     search_query: str = ""
     selected_report_id: str = ""
     is_loading: bool = False
@@ -73,257 +75,197 @@ class ReportsState(rx.State):
     review_comments: str = ""
     is_saving_review: bool = False
 
-    def _clean_json_response(self, text: str) -> str:
-        """Sanitizes AI response text to ensure it is valid parseable JSON.
-        Handles markdown blocks, control characters in strings, and single-quoted keys.
-        """
-        if not text:
-            return ""
-        text = re.sub("[a-zA-Z]*\\n?", "", text)
-        text = re.sub("", "", text)
-        text = text.strip()
-        start = text.find("{")
-        end = text.rfind("}")
-        if start != -1 and end != -1:
-            text = text[start : end + 1]
-        text = re.sub(",(\\s*[}\\]])", "\\1", text)
-        text = re.sub("'([^']+)'\\s*:", '"\\1":', text)
-
-        @rx.event
-        def escape_string_content(match):
-            content = match.group(1)
-            content = (
-                content.replace(
-                    """
-""",
-                    "\\n",
-                )
-                .replace("\r", "\\r")
-                .replace("\t", "\\t")
-            )
-            return f'"{content}"'
-
-        text = re.sub('"([^"\\\\]*(?:\\\\.[^"\\\\]*)*)"', escape_string_content, text)
-        return text
-
-    def _parse_float(self, value) -> float:
-        """Parse a value to float, handling strings, ints, floats, and None."""
-        try:
-            if value is None:
-                return 0.0
-            if isinstance(value, (int, float)):
-                return float(value)
-            value_str = str(value)
-            clean = "".join((c for c in value_str if c.isdigit() or c == "."))
-            return float(clean) if clean else 0.0
-        except (ValueError, TypeError) as e:
-            logging.exception(f"Error parsing float value '{value}': {e}")
-            return 0.0
+    async def _query_status_counts(self) -> dict[str, int]:
+        async with rx.asession() as session:
+            return await fetch_status_counts(session)
 
     @rx.event(background=True)
     async def on_load(self):
-        """Optimized report fetching with 2-minute caching and simplified logic."""
-        from app.utils.db_utils import get_cached_reports, set_cached_reports
+        """Loads the summary counts (cached across sessions) and the first page."""
+        async with self:
+            self.is_loading = True
+        try:
+            counts = await load_report_counts(self._query_status_counts)
+            async with self:
+                self.status_counts = counts
+        except Exception as e:
+            logging.exception(f"Error fetching report counts: {e}")
+        await self._load_first_page()
+        async with self:
+            self.is_loading = False
 
+    def _page_params(self) -> tuple[str, str, bool, int]:
+        return (self.search_query, self.sort_key, self.sort_desc, self.page_size)
+
+    async def _fetch_page(
+        self, params: tuple[str, str, bool, int], after: tuple | None
+    ) -> tuple[list[ReportItem], bool]:
+        query, sort, descending, page_size = params
+        async with rx.asession() as session:
+            return await fetch_report_page(
+                session, query, sort, descending, after, page_size
+            )
+
+    def _show_page(self, page: int, rows: list[ReportItem], has_next: bool):
+        """Displays rows as page, keeping only its neighbours in the buffer."""
+        self.reports = rows
+        self.has_next_page = has_next
+        self.current_page = page
+        self._page_cursors = self._page_cursors[:page] + [
+            keyset.cursor(rows, REPORT_SORTS[self.sort_key][1])
+        ]
+        buffer = {p: v for p, v in self._page_buffer.items() if abs(p - page) <= 1}
+        buffer[page] = {"rows": rows, "has_next": has_next}
+        self._page_buffer = buffer
+
+    async def _prefetch(self, version: int, params: tuple, page: int):
+        """Loads an adjacent page into the buffer so turning to it needs no query."""
         async with self:
-            cached = get_cached_reports()
-            if cached:
-                self.reports = cached
-                self.is_loading = False
+            if (
+                self._page_version != version
+                or page < 1
+                or page in self._page_buffer
+                or page > len(self._page_cursors)
+                or (page > self.current_page and not self.has_next_page)
+            ):
                 return
-            self.is_loading = True
+            after = self._page_cursors[page - 1]
+        try:
+            rows, has_next = await self._fetch_page(params, after)
+        except Exception as e:
+            logging.exception(f"Error prefetching reports page {page}: {e}")
+            return
+        async with self:
+            if self._page_version == version and abs(page - self.current_page) <= 1:
+                self._page_buffer = {
+                    **self._page_buffer,
+                    page: {"rows": rows, "has_next": has_next},
+                }
+
+    async def _load_first_page(self):
+        """Restarts paging for the current search, sort and page size."""
+        async with self:
+            self._page_version += 1
+            version = self._page_version
+            params = self._page_params()
+            self._page_cursors = [None]
+            self._page_buffer = {}
+            self.is_loading_page = True
         try:
             async with rx.asession() as session:
-                await session.execute(
-                    text("""
-                    CREATE TABLE IF NOT EXISTS institution_reviews (
-                        id SERIAL PRIMARY KEY, institution_id INTEGER NOT NULL, 
-                        status VARCHAR(50) NOT NULL, reviewer_name VARCHAR(255), comments TEXT
-                    )
-                """)
+                rows, has_next = await fetch_report_page(
+                    session, params[0], params[1], params[2], None, params[3]
                 )
-                await session.commit()
-                result = await session.execute(
-                    text("""
-                    SELECT 
-                        i.id as inst_id, i.institution_name, MAX(s.updated_at) as last_update,
-                        MAX(s.review_status) as status,
-                        COALESCE(
-                            json_object_agg(ri.code, s.value) FILTER (WHERE ri.code IS NOT NULL),
-                            '{}'::json
-                        ) as scores_map,
-                        COALESCE(
-                            json_agg(s.evidence_files) FILTER (WHERE s.evidence_files IS NOT NULL),
-                            '[]'::json
-                        ) as evidence_list
-                    FROM institutions i
-                    LEFT JOIN institution_scores s ON i.id = s.institution_id AND s.ranking_year = 2025
-                    LEFT JOIN ranking_indicators ri ON s.indicator_id = ri.id
-                    GROUP BY i.id, i.institution_name
-                    ORDER BY i.institution_name ASC LIMIT 100
-                """)
-                )
-                processed_reports = []
-                for (
-                    inst_id,
-                    name,
-                    last_update,
-                    db_status,
-                    scores,
-                    evidence,
-                ) in result.all():
-                    scores = scores or {}
-                    evidence_list = []
-                    if evidence:
-                        for ev in evidence:
-                            if ev:
-                                try:
-                                    evidence_list.extend(json.loads(ev))
-                                except:
-                                    logging.exception("Unexpected error")
-                    b_map = {
-                        "academic_reputation": 90.0,
-                        "citations_per_faculty": 20.0,
-                        "employer_reputation": 90.0,
-                        "employment_outcomes": 95.0,
-                        "international_research_network": 80.0,
-                        "international_faculty_ratio": 15.0,
-                        "international_student_ratio": 10.0,
-                        "faculty_student_ratio": 12.0,
-                        "sustainability_metrics": 85.0,
-                    }
-                    c = {
-                        k: min(100, self._parse_float(scores.get(k, 0)) / b * 100)
-                        if b
-                        else 0
-                        for k, b in b_map.items()
-                    }
-                    res = int(
-                        c["academic_reputation"] * 0.6
-                        + c["citations_per_faculty"] * 0.4
-                    )
-                    emp = int(
-                        c["employer_reputation"] * 0.75
-                        + c["employment_outcomes"] * 0.25
-                    )
-                    gl_eng = int(
-                        (
-                            c["international_research_network"]
-                            + c["international_faculty_ratio"]
-                            + c["international_student_ratio"]
-                        )
-                        / 3
-                    )
-                    over = int(
-                        res * 0.5
-                        + emp * 0.2
-                        + gl_eng * 0.15
-                        + int(c["faculty_student_ratio"]) * 0.1
-                        + int(c["sustainability_metrics"]) * 0.05
-                    )
-                    final_status = (
-                        db_status
-                        if db_status in ["Reviewed", "Declined", "For Review"]
-                        else "Pending"
-                    )
-                    if final_status == "Pending" and over > 0:
-                        final_status = (
-                            "For Review" if len(scores) >= 9 else "In Progress"
-                        )
-                    processed_reports.append(
-                        {
-                            "id": str(inst_id),
-                            "name": name,
-                            "overall_score": over,
-                            "research_score": res,
-                            "employability_score": emp,
-                            "global_engagement_score": gl_eng,
-                            "learning_experience_score": int(
-                                c["faculty_student_ratio"]
-                            ),
-                            "sustainability_score": int(c["sustainability_metrics"]),
-                            "status": final_status,
-                            "last_generated": last_update.strftime("%Y-%m-%d")
-                            if last_update
-                            else "-",
-                            "evidence_files": list(set(evidence_list)),
-                        }
-                    )
-                set_cached_reports(processed_reports)
-                async with self:
-                    self.reports = processed_reports
+                total = await count_reports(session, params[0])
         except Exception as e:
             logging.exception(f"Error fetching reports: {e}")
-        finally:
+            rows, has_next, total = ([], False, 0)
+        async with self:
+            if self._page_version != version:
+                return
+            self._show_page(1, rows, has_next)
+            self.total_count = total
+            self.is_loading_page = False
+        await self._prefetch(version, params, 2)
+
+    def _turn_page(self, step: int):
+        """Shows the adjacent page from the buffer, or starts fetching it.
+
+        A buffered page is swapped in by this event's own delta; the loading
+        indicator is only shown when the page has to be queried.
+        """
+        page = self.current_page + step
+        if page < 1 or (step > 0 and not self.has_next_page) or self.is_loading_page:
+            return
+        buffered = self._page_buffer.get(page)
+        if buffered:
+            self._show_page(page, buffered["rows"], buffered["has_next"])
+            return ReportsState.prefetch_page(page + step)
+        self.is_loading_page = True
+        return ReportsState.fetch_page(page)
+
+    @rx.event(background=True)
+    async def fetch_page(self, page: int):
+        async with self:
+            version = self._page_version
+            params = self._page_params()
+            after = self._page_cursors[page - 1]
+        try:
+            rows, has_next = await self._fetch_page(params, after)
+        except Exception as e:
+            logging.exception(f"Error fetching reports page {page}: {e}")
             async with self:
-                self.is_loading = False
+                self.is_loading_page = False
+            return
+        async with self:
+            if self._page_version != version:
+                return
+            step = page - self.current_page
+            self._show_page(page, rows, has_next)
+            self.is_loading_page = False
+        await self._prefetch(version, params, page + step)
 
-    @rx.var(cache=True)
-    def filtered_reports(self) -> list[ReportItem]:
-        if not self.search_query:
-            return self.reports
-        query = self.search_query.lower()
-        return [r for r in self.reports if query in r["name"].lower()]
+    @rx.event(background=True)
+    async def prefetch_page(self, page: int):
+        async with self:
+            version = self._page_version
+            params = self._page_params()
+        await self._prefetch(version, params, page)
 
-    @rx.var(cache=True)
-    def total_pages(self) -> int:
-        total = len(self.filtered_reports)
-        if total == 0:
-            return 1
-        return (total + self.page_size - 1) // self.page_size
+    @rx.event(background=True)
+    async def reload_page(self):
+        await self._load_first_page()
 
     @rx.var(cache=True)
-    def paginated_reports(self) -> list[ReportItem]:
-        start = (self.current_page - 1) * self.page_size
-        end = start + self.page_size
-        return self.filtered_reports[start:end]
+    def total_pages(self) -> int:
+        return keyset.total_pages(
+            self.total_count, self.page_size, self.current_page, self.has_next_page
+        )
 
     @rx.event
     def set_page_size(self, value: str):
         self.page_size = int(value)
-        self.current_page = 1
+        return ReportsState.reload_page
 
-    @rx.event(background=True)
-    async def next_page(self):
-        async with self:
-            if self.current_page < self.total_pages:
-                self.current_page += 1
-                self.is_loading_page = True
-        await asyncio.sleep(0.2)
-        async with self:
-            self.is_loading_page = False
+    @rx.event
+    def toggle_sort(self, key: str):
+        """Sorts by key, flipping the direction when it is already the sort."""
+        if self.sort_key == key:
+            self.sort_desc = not self.sort_desc
+        else:
+            self.sort_key = key
+            self.sort_desc = key == "overall_score"
+        return ReportsState.reload_page
 
-    @rx.event(background=True)
-    async def prev_page(self):
-        async with self:
-            if self.current_page > 1:
-                self.current_page -= 1
-                self.is_loading_page = True
-        await asyncio.sleep(0.2)
-        async with self:
-            self.is_loading_page = False
+    @rx.event
+    def next_page(self):
+        return self._turn_page(1)
+
+    @rx.event
+    def prev_page(self):
+        return self._turn_page(-1)
 
     @rx.var(cache=True)
     def total_reports(self) -> int:
-        return len(self.reports)
+        return sum(self.status_counts.values())
 
     @rx.var(cache=True)
     def for_review_count(self) -> int:
-        return len([r for r in self.reports if r["status"] == "For Review"])
+        return self.status_counts.get("For Review", 0)
 
     @rx.var(cache=True)
     def reviewed_count(self) -> int:
-        return len([r for r in self.reports if r["status"] == "Reviewed"])
+        return self.status_counts.get("Reviewed", 0)
 
     @rx.var(cache=True)
     def in_progress_count(self) -> int:
         """Returns count of reports that are In Progress (Not Reviewed, Declined, or Completed)."""
-        return len([r for r in self.reports if r["status"] == "In Progress"])
+        return self.status_counts.get("In Progress", 0)
 
     @rx.var(cache=True)
     def pending_count(self) -> int:
         """Returns count of reports that are Pending (No data entered or all zeros)."""
-        return len([r for r in self.reports if r["status"] == "Pending"])
+        return self.status_counts.get("Pending", 0)
 
     @rx.var(cache=True)
     def status_distribution_data(self) -> list[dict[str, str | int]]:
@@ -343,7 +285,7 @@ class ReportsState(rx.State):
         return [
             {"name": status, "value": count, "fill": colors.get(status, "#cbd5e1")}
             for status, count in counts.items()
-            if count > 0 or len(self.reports) == 0
+            if count > 0 or self.total_reports == 0
         ]
 
     @rx.var(cache=True)
@@ -381,6 +323,7 @@ class ReportsState(rx.State):
     @rx.event
     def set_search_query(self, query: str):
         self.search_query = query
+        return ReportsState.reload_page
 
     @rx.event
     def set_review_comments(self, value: str):
@@ -450,7 +393,9 @@ class ReportsState(rx.State):
                     "comments": comments,
                 },
             )
+            await refresh_computed_scores(session, [int(report_id)])
             await session.commit()
+        await events.scores_changed(int(report_id))
         async with self:
             self.is_saving_review = False
             self.show_review_modal = False
@@ -525,22 +470,22 @@ class ReportsState(rx.State):
                 )
             )
             hist_counts = {str(row[0]): row[1] for row in hist_res.all()}
-        async with self:
-            for report in self.reports:
-                writer.writerow(
-                    [
-                        report["name"],
-                        report["overall_score"],
-                        report["research_score"],
-                        report["employability_score"],
-                        report["global_engagement_score"],
-                        report["learning_experience_score"],
-                        report["sustainability_score"],
-                        hist_counts.get(report["id"], 0),
-                        report["status"],
-                        report["last_generated"],
-                    ]
-                )
+            all_reports = await fetch_report_rows(session)
+        for report in all_reports:
+            writer.writerow(
+                [
+                    report["name"],
+                    report["overall_score"],
+                    report["research_score"],
+                    report["employability_score"],
+                    report["global_engagement_score"],
+                    report["learning_experience_score"],
+                    report["sustainability_score"],
+                    hist_counts.get(report["id"], 0),
+                    report["status"],
+                    report["last_generated"],
+                ]
+            )
         return rx.download(
             data=output.getvalue(),
             filename=f"all_institutions_report_{datetime.date.today()}.csv",
@@ -602,7 +547,9 @@ class ReportsState(rx.State):
                         item.unlink()
             async with rx.asession() as session:
                 await session.execute(text("DELETE FROM institution_scores"))
+                await session.execute(text("DELETE FROM institution_computed_scores"))
                 await session.commit()
+            await events.scores_changed(None)
             yield ReportsState.on_load
             async with self:
                 self.show_reset_modal = False
@@ -639,25 +586,20 @@ class ReportsState(rx.State):
         async with self:
             self.is_generating_report_recommendations = True
         report_id = report["id"]
-        now = time.time()
-        if report_id in REPORT_AI_CACHE:
-            cache_entry = REPORT_AI_CACHE[report_id]
-            if now - cache_entry["timestamp"] < REPORT_CACHE_TTL:
-                logging.info(f"Using cached report AI analysis for {report_id}")
-                async with self:
-                    self.selected_report_recommendations = cache_entry[
-                        "recommendations"
-                    ]
-                    self.is_generating_report_recommendations = False
-                return
+        fingerprint = recommendations_store.report_fingerprint(report["name"], report)
+        cached_recommendations = await recommendations_store.get_stored(fingerprint)
+        if cached_recommendations is not None:
+            logging.info(f"Using cached report AI analysis for {report_id}")
+            async with self:
+                self.selected_report_recommendations = cached_recommendations
+                self.is_generating_report_recommendations = False
+            return
         research_score = report["research_score"]
         employability_score = report["employability_score"]
         global_engagement_score = report["global_engagement_score"]
         learning_experience_score = report["learning_experience_score"]
         sustainability_score = report["sustainability_score"]
-        overall_score = report["overall_score"]
-        institution_name = report["name"]
-        if not GOOGLE_AI_AVAILABLE:
+        if not ai_gateway.AI_AVAILABLE:
             async with self:
                 self.selected_report_recommendations = (
                     self._get_fallback_recommendations(
@@ -671,121 +613,38 @@ class ReportsState(rx.State):
                 self.is_generating_report_recommendations = False
             return
         try:
-            performance_summary = f"\nAnalysis for {institution_name}:\n- Overall Readiness Score: {overall_score}/100\n- Research & Discovery: {research_score}/100\n- Employability: {employability_score}/100\n- Global Engagement: {global_engagement_score}/100\n- Learning Experience: {learning_experience_score}/100\n- Sustainability: {sustainability_score}/100\n"
-            weak_areas = []
-            if research_score < 70:
-                weak_areas.append("Research")
-            if employability_score < 70:
-                weak_areas.append("Employability")
-            if global_engagement_score < 70:
-                weak_areas.append("Global Engagement")
-            if learning_experience_score < 70:
-                weak_areas.append("Learning Experience")
-            if sustainability_score < 70:
-                weak_areas.append("Sustainability")
-            prompt = f"""You are an expert higher education consultant. Analyze the following performance data for {institution_name} and provide 3 strategic, actionable recommendations to improve their overall readiness.\n\n{performance_summary}\n\nFocus areas: {(", ".join(weak_areas) if weak_areas else "General Excellence")}\n\nProvide recommendations in JSON format with this structure:\n{{\n  "recommendations": [\n    {{\n      "title": "Short, actionable title (max 8 words)",\n      "description": "Detailed recommendation explaining specific improvements for the institution.",\n      "category": "Research & Discovery|Employability|Global Engagement|Learning Experience|Sustainability|Overall",\n      "priority": "High|Medium|Low"\n    }}\n  ]\n}}\n\nReturn ONLY valid JSON."""
-            client = genai.Client(api_key=GOOGLE_AI_API_KEY)
-            max_retries = 5
-            response_text = ""
-            for attempt in range(max_retries):
-                try:
-                    response = await client.aio.models.generate_content(
-                        model="gemini-2.5-flash",
-                        contents=prompt,
-                        config=types.GenerateContentConfig(
-                            response_mime_type="application/json"
-                        ),
-                    )
-                    if response and response.text:
-                        response_text = response.text
-                        break
-                    else:
-                        logging.warning(
-                            f"Attempt {attempt + 1}: Empty response from Google AI"
+            prompt = recommendations_store.report_prompt(report["name"], report)
+            async with self:
+                self.selected_report_recommendations = []
+            recommendations = []
+            try:
+                async for rec in ai_gateway.stream_json_items(
+                    prompt,
+                    recommendations_store.RECOMMENDATIONS_SCHEMA,
+                    model=REPORT_AI_MODEL,
+                ):
+                    recommendations.append(
+                        recommendations_store.decorate_recommendation(
+                            rec, "Strategic Insight"
                         )
-                except Exception as e:
-                    error_str = str(e)
-                    is_retriable = (
-                        "429" in error_str
-                        or "RESOURCE_EXHAUSTED" in error_str
-                        or "503" in error_str
-                        or ("UNAVAILABLE" in error_str)
                     )
-                    if is_retriable:
-                        if attempt == max_retries - 1:
-                            logging.info(
-                                "Google AI quota exhausted after all retries. Using report fallback logic."
-                            )
-                            break
-                        wait_time = 2.0 * 2**attempt
-                        retry_match = re.search("retry in (\\d+(\\.\\d+)?)s", error_str)
-                        if retry_match:
-                            wait_time = float(retry_match.group(1)) + 1.0
-                        wait_time = min(wait_time, 60.0)
-                        logging.warning(
-                            f"Google AI error (Rate limit or Unavailable). Retrying in {wait_time:.2f}s (Attempt {attempt + 1}/{max_retries})"
-                        )
-                        await asyncio.sleep(wait_time)
-                    else:
-                        logging.exception(f"Non-retriable AI error: {e}")
-                        break
-            if not response_text:
-                raise Exception("Failed to generate AI content after retries")
-            response_text = self._clean_json_response(response_text)
-            if not response_text:
-                raise Exception("Cleaned AI response is empty")
-            try:
-                recommendations_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                logging.exception(
-                    f"Failed to parse Report AI JSON: {e}. Cleaned text: {response_text[:200]}..."
-                )
-                raise e
-            recommendations = []
-            for rec in recommendations_data.get("recommendations", []):
-                category = rec.get("category", "Overall")
-                if "Research" in category:
-                    icon = "microscope"
-                    color_class = "text-purple-600"
-                    bg_class = "bg-purple-50 border-purple-100"
-                elif "Employability" in category:
-                    icon = "briefcase"
-                    color_class = "text-emerald-600"
-                    bg_class = "bg-emerald-50 border-emerald-100"
-                elif "Global" in category:
-                    icon = "globe"
-                    color_class = "text-blue-600"
-                    bg_class = "bg-blue-50 border-blue-100"
-                elif "Learning" in category:
-                    icon = "graduation-cap"
-                    color_class = "text-indigo-600"
-                    bg_class = "bg-indigo-50 border-indigo-100"
-                elif "Sustainability" in category:
-                    icon = "leaf"
-                    color_class = "text-green-600"
-                    bg_class = "bg-green-50 border-green-100"
-                else:
-                    icon = "lightbulb"
-                    color_class = "text-amber-600"
-                    bg_class = "bg-amber-50 border-amber-100"
-                recommendations.append(
-                    {
-                        "title": rec.get("title", "Strategic Insight"),
-                        "description": rec.get("description", ""),
-                        "category": category,
-                        "priority": rec.get("priority", "Medium"),
-                        "icon": icon,
-                        "color_class": color_class,
-                        "bg_class": bg_class,
-                    }
-                )
-            REPORT_AI_CACHE[report_id] = {
-                "timestamp": time.time(),
-                "recommendations": recommendations,
-            }
+                    async with self:
+                        self.selected_report_recommendations = list(recommendations)
+            except ai_gateway.AIGenerationError as e:
+                if not recommendations:
+                    raise
+                logging.warning(f"Report recommendations stream cut short: {e}")
+                async with self:
+                    self.is_generating_report_recommendations = False
+                return
             async with self:
-                self.selected_report_recommendations = recommendations
                 self.is_generating_report_recommendations = False
+            await recommendations_store.store(
+                fingerprint,
+                recommendations_store.REPORT_KIND,
+                REPORT_AI_MODEL,
+                recommendations,
+            )
         except Exception as e:
             logging.exception(f"Error generating report recommendations: {e}")
             async with self:
@@ -0,0 +1,407 @@
+import asyncio
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, AsyncIterator
+from app.utils import json_stream
+from app.utils.cache import LRUCache, SingleFlight
+
+try:
+    from google import genai
+    from google.genai import types
+
+    GOOGLE_AI_API_KEY = os.getenv("GOOGLE_API_KEY")
+    GOOGLE_AI_BASE_URL = os.getenv("GOOGLE_AI_BASE_URL")
+    AI_AVAILABLE = bool(GOOGLE_AI_API_KEY or GOOGLE_AI_BASE_URL)
+except ImportError as e:
+    logging.exception(f"google-genai package not installed: {e}")
+    AI_AVAILABLE = False
+except Exception as e:
+    logging.exception(f"Error configuring Google AI: {e}")
+    AI_AVAILABLE = False
+DEFAULT_MODEL = "gemini-2.0-flash"
+REQUESTS_PER_MINUTE = float(os.getenv("GOOGLE_AI_REQUESTS_PER_MINUTE", "15"))
+BURST = int(os.getenv("GOOGLE_AI_BURST", "3"))
+MAX_RETRIES = 5
+MAX_RETRY_WAIT = 60.0
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("GOOGLE_AI_BREAKER_THRESHOLD", "3"))
+BREAKER_COOLDOWN = float(os.getenv("GOOGLE_AI_BREAKER_COOLDOWN", "60"))
+NEGATIVE_CACHE_TTL = 120
+_client = None
+_limiter = None
+_flights = SingleFlight()
+_recent_failures = LRUCache(max_entries=1024, default_ttl=NEGATIVE_CACHE_TTL)
+_streams: dict[str, "_ItemBroadcast"] = {}
+
+
+class AIGenerationError(Exception):
+    """Raised when the model produced no usable JSON after all retries."""
+
+
+class AICircuitOpenError(AIGenerationError):
+    """Raised without calling Gemini while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stops calling Gemini after consecutive quota/availability errors.
+
+    After failure_threshold consecutive 429/503 responses the breaker opens for
+    the cool-down (or the server's retry delay, if longer) and every call fails
+    fast. After that one probe per cool-down window is let through; success
+    closes the breaker, another failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._failures >= self.failure_threshold
+
+    def allow(self) -> bool:
+        if not self.is_open:
+            return True
+        now = time.monotonic()
+        if now < self._open_until:
+            return False
+        self._open_until = now + self.cooldown
+        return True
+
+    def record_success(self):
+        self._failures = 0
+
+    def record_failure(self, retry_after: float = 0.0):
+        self._failures += 1
+        if self.is_open:
+            self._open_until = time.monotonic() + max(self.cooldown, retry_after)
+            logging.warning(
+                f"Google AI circuit open for {max(self.cooldown, retry_after):.0f}s after {self._failures} consecutive failures"
+            )
+
+
+class RateLimiter:
+    """Token bucket shared by every Gemini call in this process.
+
+    Waiters are served strictly by (priority, arrival), so interactive page
+    requests overtake queued background work. Set the rate to the project quota
+    divided by the number of backend workers.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: asyncio.Task | None = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE):
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+
+    async def _dispatch(self):
+        while self._waiters:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+
+def get_client():
+    """Returns the process-wide client so HTTP connections are reused.
+
+    GOOGLE_AI_BASE_URL points the client at another server, such as
+    benchmarks/ai_stand_in.py, in which case no API key is needed.
+    """
+    global _client
+    if _client is None:
+        http_options = (
+            types.HttpOptions(base_url=GOOGLE_AI_BASE_URL)
+            if GOOGLE_AI_BASE_URL
+            else None
+        )
+        _client = genai.Client(
+            api_key=GOOGLE_AI_API_KEY or "local-stand-in", http_options=http_options
+        )
+    return _client
+
+
+_breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN)
+
+
+def get_limiter() -> RateLimiter:
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter(REQUESTS_PER_MINUTE, BURST)
+    return _limiter
+
+
+def _is_retriable(error_str: str) -> bool:
+    return (
+        "429" in error_str
+        or "RESOURCE_EXHAUSTED" in error_str
+        or "503" in error_str
+        or "UNAVAILABLE" in error_str
+    )
+
+
+def _retry_after(error_str: str) -> float:
+    retry_match = re.search("retry in (\\d+(\\.\\d+)?)s", error_str)
+    return float(retry_match.group(1)) + 1.0 if retry_match else 0.0
+
+
+def _retry_wait(error_str: str, attempt: int) -> float:
+    wait_time = _retry_after(error_str) or 2.0 * 2**attempt
+    return min(wait_time, MAX_RETRY_WAIT)
+
+
+async def _backoff_or_raise(
+    error: Exception, attempt: int, retries: int = MAX_RETRIES
+):
+    """Sleeps before the next attempt, or raises AIGenerationError if there is none."""
+    error_str = str(error)
+    if not _is_retriable(error_str):
+        raise AIGenerationError(f"Non-retriable AI error: {error}") from error
+    _breaker.record_failure(_retry_after(error_str))
+    if _breaker.is_open:
+        raise AICircuitOpenError(
+            "Google AI circuit breaker opened; skipping retries"
+        ) from error
+    if attempt >= retries - 1:
+        raise AIGenerationError("Google AI quota exhausted after all retries") from error
+    wait_time = _retry_wait(error_str, attempt)
+    logging.warning(
+        f"Google AI error (Rate limit or Unavailable). Retrying in {wait_time:.2f}s (Attempt {attempt + 1}/{retries})"
+    )
+    await asyncio.sleep(wait_time)
+
+
+def _json_config(schema: dict | None):
+    return types.GenerateContentConfig(
+        response_mime_type="application/json", response_schema=schema
+    )
+
+
+async def generate_text(
+    prompt: str,
+    schema: dict | None = None,
+    model: str = DEFAULT_MODEL,
+    priority: int = PRIORITY_INTERACTIVE,
+    retries: int = MAX_RETRIES,
+) -> str:
+    """Runs one JSON-mode generation through the limiter with centralized retries.
+
+    retries=1 fails fast: a rate limit raises instead of waiting to retry.
+    """
+    if not AI_AVAILABLE:
+        raise AIGenerationError("Google AI is not configured")
+    config = _json_config(schema)
+    for attempt in range(retries):
+        if not _breaker.allow():
+            raise AICircuitOpenError("Google AI circuit breaker is open")
+        await get_limiter().acquire(priority)
+        try:
+            response = await get_client().aio.models.generate_content(
+                model=model, contents=prompt, config=config
+            )
+            _breaker.record_success()
+            if response and response.text:
+                return response.text
+            logging.warning(f"Attempt {attempt + 1}: Google AI returned empty response")
+        except Exception as e:
+            await _backoff_or_raise(e, attempt, retries)
+    raise AIGenerationError("Google AI returned no text after all retries")
+
+
+def prompt_fingerprint(prompt: str, schema: dict | None, model: str) -> str:
+    """Identifies generations that would send byte-identical requests."""
+    key = json.dumps([model, schema, prompt], sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+async def generate_json(
+    prompt: str,
+    schema: dict | None = None,
+    model: str = DEFAULT_MODEL,
+    priority: int = PRIORITY_INTERACTIVE,
+    retries: int = MAX_RETRIES,
+) -> Any:
+    """Generates, repairs and schema-validates a JSON response.
+
+    Raises AIGenerationError on failure. Concurrent calls with the same prompt,
+    schema and model share one request and its result, and a prompt that
+    failed recently fails again immediately for NEGATIVE_CACHE_TTL seconds
+    (an open circuit breaker is not the prompt's failure and is not cached).
+    Pass retries=1 from pages that would rather show a fallback than wait out
+    a rate limit.
+    """
+    fingerprint = prompt_fingerprint(prompt, schema, model)
+    recent_failure = _recent_failures.get(fingerprint)
+    if recent_failure is not None:
+        raise AIGenerationError(f"Recently failed, not retrying yet: {recent_failure}")
+    try:
+        return await _flights.do(
+            fingerprint,
+            lambda: _generate_json(prompt, schema, model, priority, retries),
+        )
+    except AICircuitOpenError:
+        raise
+    except AIGenerationError as e:
+        _recent_failures.set(fingerprint, str(e))
+        raise
+
+
+async def _generate_json(
+    prompt: str, schema: dict | None, model: str, priority: int, retries: int
+) -> Any:
+    response_text = await generate_text(prompt, schema, model, priority, retries)
+    try:
+        return json_stream.parse(response_text, schema)
+    except json_stream.JSONStreamError as e:
+        raise AIGenerationError(
+            f"Unusable JSON from Google AI: {e}. Text: {response_text[:200]}..."
+        ) from e
+
+
+class _ItemBroadcast:
+    """Replays one streamed generation's items to every concurrent subscriber."""
+
+    def __init__(self):
+        self.items: list[Any] = []
+        self.error: Exception | None = None
+        self.done = False
+        self.task: asyncio.Task | None = None
+        self._changed = asyncio.Event()
+
+    def _notify(self):
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def publish(self, item: Any):
+        self.items.append(item)
+        self._notify()
+
+    def close(self, error: Exception | None = None):
+        self.error = error
+        self.done = True
+        self._notify()
+
+    async def subscribe(self) -> AsyncIterator[Any]:
+        index = 0
+        while True:
+            while index < len(self.items):
+                yield self.items[index]
+                index += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._changed.wait()
+
+
+async def _stream_items(
+    prompt: str, schema: dict | None, model: str, priority: int
+) -> AsyncIterator[Any]:
+    if not AI_AVAILABLE:
+        raise AIGenerationError("Google AI is not configured")
+    config = _json_config(schema)
+    for attempt in range(MAX_RETRIES):
+        if not _breaker.allow():
+            raise AICircuitOpenError("Google AI circuit breaker is open")
+        await get_limiter().acquire(priority)
+        parser = json_stream.JSONStreamParser(schema)
+        emitted = 0
+        try:
+            stream = await get_client().aio.models.generate_content_stream(
+                model=model, contents=prompt, config=config
+            )
+            async for chunk in stream:
+                if chunk.text:
+                    for item in parser.feed(chunk.text):
+                        emitted += 1
+                        yield item
+            _breaker.record_success()
+        except Exception as e:
+            if emitted:
+                raise AIGenerationError(f"Google AI stream interrupted: {e}") from e
+            await _backoff_or_raise(e, attempt)
+            continue
+        parser.finish()
+        if not emitted:
+            raise AIGenerationError("Google AI stream contained no valid items")
+        return
+    raise AIGenerationError("Google AI returned no items after all retries")
+
+
+async def _produce(
+    fingerprint: str,
+    broadcast: _ItemBroadcast,
+    prompt: str,
+    schema: dict | None,
+    model: str,
+    priority: int,
+):
+    try:
+        async for item in _stream_items(prompt, schema, model, priority):
+            broadcast.publish(item)
+        broadcast.close()
+    except Exception as e:
+        error = e if isinstance(e, AIGenerationError) else AIGenerationError(str(e))
+        if not isinstance(error, AICircuitOpenError):
+            _recent_failures.set(fingerprint, str(error))
+        broadcast.close(error)
+    finally:
+        _streams.pop(fingerprint, None)
+
+
+async def stream_json_items(
+    prompt: str,
+    schema: dict | None = None,
+    model: str = DEFAULT_MODEL,
+    priority: int = PRIORITY_INTERACTIVE,
+) -> AsyncIterator[Any]:
+    """Yields each item of the schema's item array as soon as its object closes.
+
+    Concurrent callers with the same prompt share one streamed request; late
+    joiners first receive the items already produced. Raises AIGenerationError,
+    possibly after some items were yielded if the stream broke mid-way.
+    """
+    fingerprint = prompt_fingerprint(prompt, schema, model)
+    recent_failure = _recent_failures.get(fingerprint)
+    if recent_failure is not None:
+        raise AIGenerationError(f"Recently failed, not retrying yet: {recent_failure}")
+    broadcast = _streams.get(fingerprint)
+    if broadcast is None:
+        broadcast = _ItemBroadcast()
+        _streams[fingerprint] = broadcast
+        broadcast.task = asyncio.create_task(
+            _produce(fingerprint, broadcast, prompt, schema, model, priority)
+        )
+    async for item in broadcast.subscribe():
+        yield item
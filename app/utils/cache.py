@@ -0,0 +1,152 @@
+import asyncio
+import pickle
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+_MISSING = object()
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate in-memory cost of a cached value in bytes."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution.
+
+    Every caller awaits the first caller's result. Failures are propagated to
+    every waiter and are not remembered; if the executing caller is cancelled,
+    a waiter takes over.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        while (pending := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+
+class LRUCache:
+    """Bounded LRU cache with per-key TTL and single-flight loading.
+
+    Entries are evicted least-recently-used first once either the entry budget
+    or the byte budget is exceeded. Concurrent misses on the same key through
+    get_or_load share one loader call (see SingleFlight) instead of each
+    hitting the database.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 32 * 1024 * 1024,
+        default_ttl: float = 300,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[Hashable, tuple[Any, int, float]] = OrderedDict()
+        self._bytes = 0
+        self._flights = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        value, _, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self.delete(key)
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        size = estimate_size(value)
+        self.delete(key)
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        self._entries[key] = (value, size, expires_at)
+        self._bytes += size
+        self._evict()
+
+    def delete(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def clear(self, prefix: str | None = None):
+        if prefix is None:
+            self._entries.clear()
+            self._bytes = 0
+            return
+        for key in [k for k in self._entries if str(k).startswith(prefix)]:
+            self.delete(key)
+
+    def _evict(self):
+        now = time.monotonic()
+        for key in [k for k, (_, _, exp) in self._entries.items() if exp <= now]:
+            self.delete(key)
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """Returns the cached value or runs loader once for all concurrent callers."""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        async def load():
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                value = await loader()
+                self.set(key, value, ttl)
+            return value
+
+        return await self._flights.do(key, load)
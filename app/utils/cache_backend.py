@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import os
+import pickle
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+from app.utils.cache import LRUCache, SingleFlight
+
+try:
+    import redis.asyncio as aioredis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+CACHE_NAMESPACE = os.getenv("CACHE_NAMESPACE", "ched_ir2d")
+LOCAL_MAX_ENTRIES = 512
+LOCAL_MAX_BYTES = 64 * 1024 * 1024
+LOAD_LOCK_TTL = 30
+LOAD_POLL_INTERVAL = 0.05
+_MISSING = object()
+_backend = None
+
+
+class LocalCacheBackend:
+    """In-process backend for development and single-worker deployments."""
+
+    name = "local"
+
+    def __init__(
+        self, max_entries: int = LOCAL_MAX_ENTRIES, max_bytes: int = LOCAL_MAX_BYTES
+    ):
+        self._cache = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        return self._cache.get(key, default)
+
+    async def set(self, key: str, value: Any, ttl: float):
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key: str):
+        self._cache.delete(key)
+
+    async def clear(self, prefix: str | None = None):
+        self._cache.clear(prefix)
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        return await self._cache.get_or_load(key, loader, ttl)
+
+
+class RedisCacheBackend:
+    """Redis-protocol backend shared by every backend worker.
+
+    Values are pickled under a namespaced key with a server-side expiry. Misses
+    are coalesced per process and, through a short SET NX lock, across workers,
+    so only one worker runs a loader while the others wait for its result. Any
+    Redis error degrades to calling the loader directly.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, namespace: str = CACHE_NAMESPACE):
+        self._client = aioredis.from_url(url)
+        self._namespace = namespace
+        self._flights = SingleFlight()
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}:{key}"
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        try:
+            raw = await self._client.get(self._key(key))
+        except Exception as e:
+            logging.exception(f"Redis cache read failed for {key}: {e}")
+            return default
+        return default if raw is None else pickle.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float):
+        try:
+            await self._client.set(
+                self._key(key),
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                px=max(1, int(ttl * 1000)),
+            )
+        except Exception as e:
+            logging.exception(f"Redis cache write failed for {key}: {e}")
+
+    async def delete(self, key: str):
+        try:
+            await self._client.delete(self._key(key))
+        except Exception as e:
+            logging.exception(f"Redis cache delete failed for {key}: {e}")
+
+    async def clear(self, prefix: str | None = None):
+        pattern = self._key(f"{prefix or ''}*")
+        try:
+            batch = []
+            async for redis_key in self._client.scan_iter(match=pattern, count=500):
+                batch.append(redis_key)
+                if len(batch) >= 500:
+                    await self._client.delete(*batch)
+                    batch = []
+            if batch:
+                await self._client.delete(*batch)
+        except Exception as e:
+            logging.exception(f"Redis cache clear failed for {pattern}: {e}")
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        return await self._flights.do(
+            key, lambda: self._load_shared(key, loader, ttl)
+        )
+
+    async def _load_shared(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any:
+        value = await self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        lock_key = self._key(f"lock:{key}")
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._client.set(lock_key, token, nx=True, ex=LOAD_LOCK_TTL)
+        except Exception as e:
+            logging.exception(f"Redis load lock failed for {key}: {e}")
+            return await loader()
+        if not acquired:
+            deadline = time.monotonic() + LOAD_LOCK_TTL
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOAD_POLL_INTERVAL)
+                value = await self.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+                try:
+                    if not await self._client.exists(lock_key):
+                        break
+                except Exception:
+                    break
+            value = await loader()
+            await self.set(key, value, ttl)
+            return value
+        try:
+            value = await loader()
+            await self.set(key, value, ttl)
+            return value
+        finally:
+            try:
+                if await self._client.get(lock_key) == token.encode():
+                    await self._client.delete(lock_key)
+            except Exception as e:
+                logging.exception(f"Redis load lock release failed for {key}: {e}")
+
+
+def get_cache_backend():
+    """Returns the process-wide cache backend, selected from REDIS_URL.
+
+    Without REDIS_URL (or without the redis package) an in-process backend is
+    used, which is what local development runs against. Point REDIS_URL at a
+    local redis-server, e.g. redis://localhost:6379/0, to exercise the shared
+    backend.
+    """
+    global _backend
+    if _backend is None:
+        url = os.getenv("REDIS_URL")
+        if url and REDIS_AVAILABLE:
+            _backend = RedisCacheBackend(url)
+        else:
+            if url:
+                logging.warning("REDIS_URL is set but redis is not installed")
+            _backend = LocalCacheBackend()
+        logging.info(f"Using {_backend.name} cache backend")
+    return _backend
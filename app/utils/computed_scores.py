@@ -0,0 +1,269 @@
+import json
+import logging
+from sqlalchemy import text
+from app.utils import institution_search, keyset, scoring
+
+RANKING_YEAR = 2025
+REVIEW_STATUSES = ["Reviewed", "Declined", "For Review"]
+
+
+def _report_status(db_status: str | None, overall: int, indicator_count: int) -> str:
+    """Derives the review status shown on the reports page."""
+    if db_status in REVIEW_STATUSES:
+        return db_status
+    if overall > 0:
+        return "For Review" if indicator_count >= 9 else "In Progress"
+    return "Pending"
+
+
+async def refresh_computed_scores(
+    session, institution_ids: list[int] | None = None, ranking_year: int = RANKING_YEAR
+):
+    """Recomputes the materialized scores for the given institutions (all when None).
+
+    Runs on the caller's session so the refresh commits together with the write
+    that made it necessary.
+    """
+    id_filter = "" if institution_ids is None else "WHERE i.id = ANY(:ids)"
+    params = {"year": ranking_year}
+    if institution_ids is not None:
+        if not institution_ids:
+            return
+        params["ids"] = list(institution_ids)
+    result = await session.execute(
+        text(f"""
+        SELECT
+            i.id, MAX(s.updated_at) as last_update,
+            MAX(s.review_status) as status,
+            COALESCE(
+                json_object_agg(
+                    ri.code, COALESCE(to_json(s.value_numeric), to_json(s.value))
+                ) FILTER (WHERE ri.code IS NOT NULL),
+                '{{}}'::json
+            ) as scores_map,
+            COALESCE(
+                json_agg(s.evidence_files) FILTER (WHERE s.evidence_files IS NOT NULL),
+                '[]'::json
+            ) as evidence_list
+        FROM institutions i
+        LEFT JOIN institution_scores s ON i.id = s.institution_id AND s.ranking_year = :year
+        LEFT JOIN ranking_indicators ri ON s.indicator_id = ri.id
+        {id_filter}
+        GROUP BY i.id
+        """),
+        params,
+    )
+    rows = result.all()
+    if not rows:
+        return
+    scores = scoring.score_matrix(scoring.build_matrix([row[3] or {} for row in rows]))
+    records = []
+    for i, (inst_id, last_update, db_status, score_values, evidence) in enumerate(
+        rows
+    ):
+        evidence_list = []
+        for ev in evidence or []:
+            if ev:
+                try:
+                    evidence_list.extend(json.loads(ev))
+                except (ValueError, TypeError) as e:
+                    logging.exception(f"Invalid evidence list for {inst_id}: {e}")
+        overall = int(scores["overall_score"][i])
+        indicator_count = len(score_values or {})
+        records.append(
+            {
+                "iid": inst_id,
+                "year": ranking_year,
+                "rs": int(scores["research_score"][i]),
+                "es": int(scores["employability_score"][i]),
+                "gs": int(scores["global_engagement_score"][i]),
+                "ls": int(scores["learning_experience_score"][i]),
+                "ss": int(scores["sustainability_score"][i]),
+                "ov": overall,
+                "cnt": indicator_count,
+                "status": _report_status(db_status, overall, indicator_count),
+                "files": json.dumps(sorted(set(evidence_list))),
+                "last_update": last_update,
+            }
+        )
+    await session.execute(
+        text("""
+        INSERT INTO institution_computed_scores (
+            institution_id, ranking_year,
+            research_score, employability_score, global_engagement_score,
+            learning_experience_score, sustainability_score, overall_score,
+            indicator_count, status, evidence_files, last_update, refreshed_at
+        ) VALUES (
+            :iid, :year, :rs, :es, :gs, :ls, :ss, :ov,
+            :cnt, :status, :files, :last_update, CURRENT_TIMESTAMP
+        )
+        ON CONFLICT (institution_id, ranking_year)
+        DO UPDATE SET
+            research_score = EXCLUDED.research_score,
+            employability_score = EXCLUDED.employability_score,
+            global_engagement_score = EXCLUDED.global_engagement_score,
+            learning_experience_score = EXCLUDED.learning_experience_score,
+            sustainability_score = EXCLUDED.sustainability_score,
+            overall_score = EXCLUDED.overall_score,
+            indicator_count = EXCLUDED.indicator_count,
+            status = EXCLUDED.status,
+            evidence_files = EXCLUDED.evidence_files,
+            last_update = EXCLUDED.last_update,
+            refreshed_at = CURRENT_TIMESTAMP
+        """),
+        records,
+    )
+
+
+async def fetch_computed_scores(
+    session, institution_id: int, ranking_year: int = RANKING_YEAR
+) -> dict | None:
+    """Single indexed lookup of one institution's materialized scores."""
+    result = await session.execute(
+        text("""
+        SELECT research_score, employability_score, global_engagement_score,
+               learning_experience_score, sustainability_score, overall_score, status
+        FROM institution_computed_scores
+        WHERE institution_id = :iid AND ranking_year = :year
+        """),
+        {"iid": institution_id, "year": ranking_year},
+    )
+    row = result.first()
+    if not row:
+        return None
+    return dict(zip(scoring.LENS_KEYS + ("overall_score", "status"), row))
+
+
+REPORT_COLUMNS = """
+    i.id, i.institution_name,
+    c.overall_score, c.research_score, c.employability_score,
+    c.global_engagement_score, c.learning_experience_score,
+    c.sustainability_score, c.status, c.last_update, c.evidence_files
+"""
+REPORT_FROM = """
+    FROM institutions i
+    LEFT JOIN institution_computed_scores c
+        ON c.institution_id = i.id AND c.ranking_year = :year
+"""
+REPORT_SORTS = {
+    "name": ("i.institution_name", "name"),
+    "overall_score": ("COALESCE(c.overall_score, 0)", "overall_score"),
+}
+
+
+def _report_row(row) -> dict:
+    return {
+        "id": str(row[0]),
+        "name": row[1],
+        "overall_score": row[2] or 0,
+        "research_score": row[3] or 0,
+        "employability_score": row[4] or 0,
+        "global_engagement_score": row[5] or 0,
+        "learning_experience_score": row[6] or 0,
+        "sustainability_score": row[7] or 0,
+        "status": row[8] or "Pending",
+        "last_generated": row[9].strftime("%Y-%m-%d") if row[9] else "-",
+        "evidence_files": json.loads(row[10]) if row[10] else [],
+    }
+
+
+async def fetch_report_rows(
+    session,
+    institution_ids: list[int] | None = None,
+    ranking_year: int = RANKING_YEAR,
+    limit: int | None = None,
+) -> list[dict]:
+    """Report rows (institution plus materialized scores) ordered by name.
+
+    Without institution_ids and limit this is every institution, for exports.
+    """
+    id_filter = "" if institution_ids is None else "WHERE i.id = ANY(:ids)"
+    params = {"year": ranking_year, "limit": limit}
+    if institution_ids is not None:
+        params["ids"] = list(institution_ids)
+    result = await session.execute(
+        text(f"""
+        SELECT {REPORT_COLUMNS}
+        {REPORT_FROM}
+        {id_filter}
+        ORDER BY i.institution_name ASC, i.id ASC LIMIT :limit
+        """),
+        params,
+    )
+    return [_report_row(row) for row in result.all()]
+
+
+def _report_filter(query: str) -> tuple[str, dict]:
+    query = institution_search.normalize_query(query)
+    if len(query) < institution_search.MIN_QUERY_LENGTH:
+        return ("TRUE", {})
+    return (
+        institution_search.search_filter("i"),
+        institution_search.search_params(query),
+    )
+
+
+def report_page_query(
+    query: str,
+    sort: str,
+    descending: bool,
+    after: tuple | None,
+    page_size: int,
+    ranking_year: int = RANKING_YEAR,
+) -> tuple[str, dict]:
+    """SQL and parameters for one page of the reports table."""
+    where, params = _report_filter(query)
+    seek, order_by, seek_params = keyset.seek(
+        REPORT_SORTS[sort][0], "i.id", descending, after
+    )
+    sql = f"""
+        SELECT {REPORT_COLUMNS}
+        {REPORT_FROM}
+        WHERE {where} AND {seek}
+        ORDER BY {order_by}
+        LIMIT :limit
+    """
+    return (
+        sql,
+        {**params, **seek_params, "year": ranking_year, "limit": page_size + 1},
+    )
+
+
+async def fetch_report_page(
+    session,
+    query: str,
+    sort: str,
+    descending: bool,
+    after: tuple | None,
+    page_size: int,
+    ranking_year: int = RANKING_YEAR,
+) -> tuple[list[dict], bool]:
+    """One page of report rows and whether another page follows."""
+    sql, params = report_page_query(
+        query, sort, descending, after, page_size, ranking_year
+    )
+    result = await session.execute(text(sql), params)
+    return keyset.split_page([_report_row(row) for row in result.all()], page_size)
+
+
+async def count_reports(
+    session, query: str = "", ranking_year: int = RANKING_YEAR
+) -> int:
+    """Exact or estimated number of report rows the search matches."""
+    where, params = _report_filter(query)
+    return await keyset.estimate_count(
+        session, f"{REPORT_FROM} WHERE {where}", {**params, "year": ranking_year}
+    )
+
+
+async def fetch_status_counts(session, ranking_year: int = RANKING_YEAR) -> dict:
+    """Number of institutions per report status, for the summary cards."""
+    result = await session.execute(
+        text(f"""
+        SELECT COALESCE(c.status, 'Pending'), COUNT(*)
+        {REPORT_FROM}
+        GROUP BY 1
+        """),
+        {"year": ranking_year},
+    )
+    return {row[0]: row[1] for row in result.all()}
@@ -1,65 +1,80 @@
-import functools
-import time
-import logging
+import bisect
+from typing import Any, Awaitable, Callable
+from app.utils import events
+from app.utils.cache_backend import get_cache_backend
+from app.utils.institution_search import fetch_institution
 
-_cache = {}
-_cache_ttl = {}
 DEFAULT_TTL = 300
-_institutions_cache = None
-_institutions_cache_time = 0
 INSTITUTIONS_CACHE_TTL = 300
-_reports_cache = None
-_reports_cache_time = 0
 REPORTS_CACHE_TTL = 120
+SHARED_CACHE_TTL = 6 * 3600
+INSTITUTIONS_KEY = "institutions"
+REPORT_COUNTS_KEY = "report_status_counts"
 
 
-def cached_query(key: str, ttl: int = DEFAULT_TTL):
-    """Helper for caching query results."""
+async def load_cached(
+    key: str, loader: Callable[[], Awaitable[Any]], ttl: int = DEFAULT_TTL
+) -> Any:
+    """Returns the cached value for key, running loader once across concurrent misses."""
+    return await get_cache_backend().get_or_load(key, loader, ttl)
 
-    def get_cached():
-        if key in _cache and time.time() < _cache_ttl.get(key, 0):
-            return _cache[key]
-        return None
 
-    def set_cached(value):
-        _cache[key] = value
-        _cache_ttl[key] = time.time() + ttl
+def _list_ttl(local_ttl: int) -> int:
+    """Event eviction only reaches every worker through a shared backend.
 
-    return (get_cached, set_cached)
+    With the in-process backend, other workers never see an eviction, so the
+    short TTL bounds how long they serve a stale list.
+    """
+    if get_cache_backend().name == "local":
+        return local_ttl
+    return SHARED_CACHE_TTL
 
 
-def clear_cache(key: str = None):
-    """Clear specific key or entire cache."""
-    global _cache, _cache_ttl
-    if key:
-        _cache.pop(key, None)
-        _cache_ttl.pop(key, None)
-    else:
-        _cache = {}
-        _cache_ttl = {}
+async def get_cached_institutions():
+    return await get_cache_backend().get(INSTITUTIONS_KEY)
 
 
-def get_cached_institutions():
-    global _institutions_cache, _institutions_cache_time
-    if _institutions_cache and time.time() < _institutions_cache_time:
-        return _institutions_cache
-    return None
+async def load_institutions(loader: Callable[[], Awaitable[list]]) -> list:
+    return await load_cached(
+        INSTITUTIONS_KEY, loader, _list_ttl(INSTITUTIONS_CACHE_TTL)
+    )
 
 
-def set_cached_institutions(data):
-    global _institutions_cache, _institutions_cache_time
-    _institutions_cache = data
-    _institutions_cache_time = time.time() + INSTITUTIONS_CACHE_TTL
+async def load_report_counts(loader: Callable[[], Awaitable[dict]]) -> dict:
+    return await load_cached(REPORT_COUNTS_KEY, loader, _list_ttl(REPORTS_CACHE_TTL))
 
 
-def get_cached_reports():
-    global _reports_cache, _reports_cache_time
-    if _reports_cache and time.time() < _reports_cache_time:
-        return _reports_cache
-    return None
+@events.subscribe(events.SCORES_CHANGED)
+async def _evict_report_counts(institution_id: int | None):
+    """A status change moves an institution between the report summary counts.
 
+    The event does not carry the previous status, so the counts are re-run
+    (one GROUP BY) rather than adjusted.
+    """
+    await get_cache_backend().delete(REPORT_COUNTS_KEY)
 
-def set_cached_reports(data):
-    global _reports_cache, _reports_cache_time
-    _reports_cache = data
-    _reports_cache_time = time.time() + REPORTS_CACHE_TTL
\ No newline at end of file
+
+@events.subscribe(events.INSTITUTION_CHANGED)
+async def _patch_institution_list(institution_id: int | None):
+    """Replaces the changed institution's entry in the cached directory.
+
+    The entry is re-inserted at its place in the name order, or dropped when
+    the institution was deleted. Without an id the directory is reloaded.
+    """
+    backend = get_cache_backend()
+    cached = await backend.get(INSTITUTIONS_KEY)
+    if institution_id is None or cached is None:
+        await backend.delete(INSTITUTIONS_KEY)
+        return
+    hei = await fetch_institution(institution_id)
+    entries = [entry for entry in cached if entry["id"] != str(institution_id)]
+    if hei is not None:
+        names = [entry["name"] for entry in entries]
+        entries.insert(bisect.bisect_right(names, hei["name"]), hei)
+    await backend.set(INSTITUTIONS_KEY, entries, _list_ttl(INSTITUTIONS_CACHE_TTL))
+
+
+@events.subscribe(events.INSTITUTION_CHANGED)
+async def _evict_institution_counts(institution_id: int | None):
+    """A registration or deletion changes the report summary counts."""
+    await get_cache_backend().delete(REPORT_COUNTS_KEY)
@@ -0,0 +1,41 @@
+import logging
+from collections import defaultdict
+from typing import Awaitable, Callable
+
+SCORES_CHANGED = "scores_changed"
+INSTITUTION_CHANGED = "institution_changed"
+_subscribers: dict[str, list[Callable[..., Awaitable[None]]]] = defaultdict(list)
+
+
+def subscribe(event: str):
+    """Registers the decorated coroutine function as a handler for event."""
+
+    def register(handler: Callable[..., Awaitable[None]]):
+        if handler not in _subscribers[event]:
+            _subscribers[event].append(handler)
+        return handler
+
+    return register
+
+
+async def publish(event: str, *args):
+    """Runs every handler for event in registration order.
+
+    Publish after the triggering write has committed. A failing handler is
+    logged and does not stop the others or the caller.
+    """
+    for handler in list(_subscribers[event]):
+        try:
+            await handler(*args)
+        except Exception as e:
+            logging.exception(f"Error handling {event} in {handler.__name__}: {e}")
+
+
+async def scores_changed(institution_id: int | None = None):
+    """Announces new scores for one institution, or for all when None."""
+    await publish(SCORES_CHANGED, institution_id)
+
+
+async def institution_changed(institution_id: int | None = None):
+    """Announces that an institution was created, edited or deleted."""
+    await publish(INSTITUTION_CHANGED, institution_id)
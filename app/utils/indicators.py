@@ -0,0 +1,34 @@
+import logging
+import reflex as rx
+from sqlalchemy import text
+
+_code_to_id: dict[str, int] = {}
+
+
+async def load_indicator_registry(session) -> dict[str, int]:
+    """Reads the ranking_indicators code -> id map into the process registry."""
+    result = await session.execute(text("SELECT code, id FROM ranking_indicators"))
+    rows = result.all()
+    _code_to_id.clear()
+    _code_to_id.update({row[0]: row[1] for row in rows})
+    return _code_to_id
+
+
+async def get_indicator_ids(session) -> dict[str, int]:
+    """Returns the registry, loading it on first use if startup has not yet.
+
+    Codes without a ranking_indicators row stay absent; the seed migration
+    runs before startup loads the registry.
+    """
+    if not _code_to_id:
+        await load_indicator_registry(session)
+    return _code_to_id
+
+
+async def load_on_startup():
+    """Fills the registry before the first save needs it (after migrations)."""
+    try:
+        async with rx.asession() as session:
+            await load_indicator_registry(session)
+    except Exception as e:
+        logging.exception(f"Error loading the indicator registry: {e}")
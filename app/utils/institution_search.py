@@ -0,0 +1,177 @@
+"""Institution search for the HEI picker and the paged admin tables.
+
+Matching runs in Postgres against the pg_trgm indexes from
+migrations/0010_institution_search_trgm.sql: a substring of the name or
+address, a word-similar name (so a misspelt "Univ of the Philipines" still
+finds its row), or an exact id. Results are ranked by how closely the name
+matches and cached in the shared cache backend until an institution changes.
+"""
+
+from sqlalchemy import text
+import reflex as rx
+from app.utils import events, keyset
+from app.utils.cache_backend import get_cache_backend
+
+MIN_QUERY_LENGTH = 2
+SEARCH_CACHE_PREFIX = "institution_search:"
+SEARCH_CACHE_TTL = 300
+HEI_COLUMNS = (
+    "id, institution_name, street_address, city_municipality, 'Private', admin_name"
+)
+INSTITUTION_SORTS = {"name": ("institution_name", "name")}
+
+
+def address_expr(alias: str = "") -> str:
+    """Must match the expression indexed by institutions_address_trgm_idx."""
+    prefix = f"{alias}." if alias else ""
+    return (
+        f"(COALESCE({prefix}street_address, '') || ', ' || "
+        f"COALESCE({prefix}city_municipality, ''))"
+    )
+
+
+def search_filter(alias: str = "") -> str:
+    """Name or address substring, word-similar name, or exact id."""
+    prefix = f"{alias}." if alias else ""
+    return f"""(
+        {prefix}institution_name ILIKE :pattern
+        OR :query <% {prefix}institution_name
+        OR {address_expr(alias)} ILIKE :pattern
+        OR {prefix}id = :id
+    )"""
+
+
+SEARCH_SQL = f"""
+    SELECT {HEI_COLUMNS}
+    FROM institutions
+    WHERE {search_filter()}
+    ORDER BY
+        institution_name ILIKE :prefix DESC,
+        word_similarity(:query, institution_name) DESC,
+        institution_name ASC
+    LIMIT :limit
+"""
+
+
+def hei_from_row(row) -> dict[str, str]:
+    """Maps an (id, name, street, city, type, admin) row to the HEI dict."""
+    return {
+        "id": str(row[0]),
+        "name": row[1],
+        "address": f"{row[2]}, {row[3]}",
+        "type": row[4],
+        "street": row[2],
+        "city": row[3],
+        "admin_name": row[5] if row[5] else "Not Assigned",
+    }
+
+
+async def fetch_institution(institution_id: int) -> dict[str, str] | None:
+    """The HEI dict of one institution, or None when it no longer exists."""
+    async with rx.asession() as session:
+        result = await session.execute(
+            text(f"SELECT {HEI_COLUMNS} FROM institutions WHERE id = :id"),
+            {"id": institution_id},
+        )
+        row = result.first()
+    return hei_from_row(row) if row else None
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split())
+
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_params(query: str) -> dict:
+    """Bind parameters for search_filter and SEARCH_SQL."""
+    escaped = _like_escape(query)
+    return {
+        "query": query,
+        "pattern": f"%{escaped}%",
+        "prefix": f"{escaped}%",
+        "id": int(query) if query.isdigit() else None,
+    }
+
+
+async def _query(query: str, limit: int | None) -> list[dict[str, str]]:
+    async with rx.asession() as session:
+        result = await session.execute(
+            text(SEARCH_SQL), {**search_params(query), "limit": limit}
+        )
+        return [hei_from_row(row) for row in result.all()]
+
+
+async def search_institutions(
+    query: str, limit: int | None = None
+) -> list[dict[str, str]]:
+    """Institutions matching query, best match first; all of them unless limit is set.
+
+    Queries shorter than MIN_QUERY_LENGTH return no rows.
+    """
+    query = normalize_query(query)
+    if len(query) < MIN_QUERY_LENGTH:
+        return []
+    key = f"{SEARCH_CACHE_PREFIX}{limit}:{query.lower()}"
+    return await get_cache_backend().get_or_load(
+        key, lambda: _query(query, limit), SEARCH_CACHE_TTL
+    )
+
+
+def _table_filter(query: str) -> tuple[str, dict]:
+    query = normalize_query(query)
+    if len(query) < MIN_QUERY_LENGTH:
+        return ("TRUE", {})
+    return (search_filter(), search_params(query))
+
+
+def institution_page_query(
+    query: str, sort: str, descending: bool, after: tuple | None, page_size: int
+) -> tuple[str, dict]:
+    """SQL and parameters for one page of the institutions admin table."""
+    where, params = _table_filter(query)
+    seek, order_by, seek_params = keyset.seek(
+        INSTITUTION_SORTS[sort][0], "id", descending, after
+    )
+    sql = f"""
+        SELECT {HEI_COLUMNS}
+        FROM institutions
+        WHERE {where} AND {seek}
+        ORDER BY {order_by}
+        LIMIT :limit
+    """
+    return (sql, {**params, **seek_params, "limit": page_size + 1})
+
+
+async def fetch_institution_page(
+    session,
+    query: str,
+    sort: str,
+    descending: bool,
+    after: tuple | None,
+    page_size: int,
+) -> tuple[list[dict[str, str]], bool]:
+    """One page of matching institutions and whether another page follows."""
+    sql, params = institution_page_query(query, sort, descending, after, page_size)
+    result = await session.execute(text(sql), params)
+    return keyset.split_page([hei_from_row(row) for row in result.all()], page_size)
+
+
+async def count_institutions(session, query: str = "") -> int:
+    """Exact or estimated number of institutions the table search matches."""
+    where, params = _table_filter(query)
+    return await keyset.estimate_count(
+        session, f"FROM institutions WHERE {where}", params
+    )
+
+
+@events.subscribe(events.INSTITUTION_CHANGED)
+async def _evict_search_results(institution_id: int | None):
+    """Any rename, registration or deletion can change what a query matches.
+
+    Results are keyed by query text, and which queries match an institution's
+    old or new name is only known by re-running them, so all are dropped.
+    """
+    await get_cache_backend().clear(SEARCH_CACHE_PREFIX)
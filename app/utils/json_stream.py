@@ -0,0 +1,322 @@
+import json
+import re
+from typing import Any
+
+_NOT_STARTED = object()
+_NO_KEY = object()
+_INCOMPLETE = object()
+_SEPARATORS = re.compile("[\\s,:]*")
+_ROOT_START = re.compile("[{\\[]")
+_BARE_TOKEN = re.compile("[^\\s,:\\[\\]{}\"']+")
+_NUMBER = re.compile("-?(\\d+\\.?\\d*|\\.\\d+)([eE][+-]?\\d+)?")
+_STRING_SPECIAL = {'"': re.compile('["\\\\]'), "'": re.compile("['\\\\]")}
+_STRING_END = ",:}]"
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+_LITERALS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "True": True,
+    "False": False,
+    "None": None,
+}
+
+
+class JSONStreamError(ValueError):
+    """Raised when no JSON value can be recovered from model output."""
+
+
+class SchemaError(ValueError):
+    """Raised when a value cannot be conformed to its response schema."""
+
+
+def item_schema_for(schema: dict | None) -> tuple[tuple[str, ...] | None, dict | None]:
+    """Locates the array of objects that streaming callers consume item by item.
+
+    Returns (path, item schema): () for a top-level array, ("recommendations",)
+    for an object wrapping one, or (None, None) when the schema has no such array.
+    """
+    if not schema:
+        return (None, None)
+    if schema.get("type", "").upper() == "ARRAY":
+        return ((), schema.get("items"))
+    for name, prop in schema.get("properties", {}).items():
+        if prop.get("type", "").upper() == "ARRAY":
+            return ((name,), prop.get("items"))
+    return (None, None)
+
+
+class JSONStreamParser:
+    """Incremental, repairing parser for LLM JSON output.
+
+    Text is consumed in one forward pass as chunks arrive. Text around the
+    root value (markdown fences, prose) is skipped, and trailing or missing
+    commas are tolerated. Single-quoted strings, Python literals, bare words,
+    raw control characters and unescaped inner quotes are accepted. Whatever is
+    still open at finish() is closed, so a truncated response keeps every
+    complete field. Objects inside the schema's item array are returned from
+    feed() as soon as they close and validate.
+    """
+
+    def __init__(self, schema: dict | None = None):
+        self._items_path, self._item_schema = item_schema_for(schema)
+        self._buf = ""
+        self._pos = 0
+        self._final = False
+        self._stack: list[list] = []
+        self._root: Any = _NOT_STARTED
+        self._ready: list[Any] = []
+        self._string: tuple[str, list[str]] | None = None
+
+    @property
+    def done(self) -> bool:
+        return self._root is not _NOT_STARTED
+
+    def feed(self, chunk: str) -> list[Any]:
+        """Consumes a chunk and returns the items completed by it."""
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        self._consume()
+        ready, self._ready = self._ready, []
+        return ready
+
+    def finish(self) -> Any:
+        """Consumes the remaining text, closes open containers, returns the root."""
+        self._final = True
+        self._consume()
+        while self._stack:
+            self._close(emit=False)
+        return None if self._root is _NOT_STARTED else self._root
+
+    def _consume(self):
+        buf = self._buf
+        pos = self._pos
+        end = len(buf)
+        while not self.done:
+            if self._string is not None:
+                quote, parts = self._string
+                value, pos = self._scan_string(buf, pos, quote, parts)
+                if value is _INCOMPLETE:
+                    break
+                self._string = None
+                self._attach(value)
+                continue
+            pos = _SEPARATORS.match(buf, pos).end()
+            if pos >= end:
+                break
+            if not self._stack:
+                start = _ROOT_START.search(buf, pos)
+                if start is None:
+                    pos = end
+                    break
+                pos = start.start()
+            c = buf[pos]
+            if c == "{" or c == "[":
+                self._open({} if c == "{" else [])
+                pos += 1
+            elif c == "}" or c == "]":
+                self._close(emit=True)
+                pos += 1
+            elif c == '"' or c == "'":
+                self._string = (c, [])
+                pos += 1
+            else:
+                match = _BARE_TOKEN.match(buf, pos)
+                if match is None:
+                    pos += 1
+                    continue
+                if match.end() >= end and not self._final:
+                    break
+                self._attach(_bare_value(match.group()))
+                pos = match.end()
+        self._pos = pos
+
+    def _scan_string(
+        self, buf: str, i: int, quote: str, parts: list[str]
+    ) -> tuple[Any, int]:
+        """Scans string content from i, collecting decoded text into parts.
+
+        When the chunk ends inside the string, returns (_INCOMPLETE, resume
+        index). parts keeps what was decoded, so the next chunk continues from
+        there instead of rescanning the string from its opening quote.
+        """
+        special = _STRING_SPECIAL[quote]
+        end = len(buf)
+        while True:
+            match = special.search(buf, i)
+            if match is None:
+                parts.append(buf[i:])
+                if not self._final:
+                    return (_INCOMPLETE, end)
+                return ("".join(parts), end)
+            j = match.start()
+            parts.append(buf[i:j])
+            if buf[j] == "\\":
+                if j + 1 >= end:
+                    if not self._final:
+                        return (_INCOMPLETE, j)
+                    return ("".join(parts), end)
+                escape = buf[j + 1]
+                if escape == "u":
+                    if j + 6 > end and not self._final:
+                        return (_INCOMPLETE, j)
+                    try:
+                        parts.append(chr(int(buf[j + 2 : j + 6], 16)))
+                        i = j + 6
+                    except ValueError:
+                        parts.append(escape)
+                        i = j + 2
+                else:
+                    parts.append(_ESCAPES.get(escape, escape))
+                    i = j + 2
+                continue
+            k = j + 1
+            while k < end and buf[k].isspace():
+                k += 1
+            if k >= end:
+                if not self._final:
+                    return (_INCOMPLETE, j)
+                return ("".join(parts), j + 1)
+            if buf[k] in _STRING_END or "\n" in buf[j + 1 : k]:
+                return ("".join(parts), j + 1)
+            parts.append(quote)
+            i = j + 1
+
+    def _open(self, container: dict | list):
+        if self._stack:
+            parent = self._stack[-1]
+            if isinstance(parent[0], list):
+                path = parent[2] + ("*",)
+            elif parent[1] is _NO_KEY:
+                path = parent[2] + ("?",)
+            else:
+                path = parent[2] + (parent[1],)
+        else:
+            path = ()
+        self._stack.append([container, _NO_KEY, path])
+
+    def _close(self, emit: bool):
+        container, _, _ = self._stack.pop()
+        if (
+            emit
+            and isinstance(container, dict)
+            and self._stack
+            and isinstance(self._stack[-1][0], list)
+            and self._stack[-1][2] == self._items_path
+        ):
+            try:
+                self._ready.append(
+                    validate(container, self._item_schema)
+                    if self._item_schema
+                    else container
+                )
+            except SchemaError:
+                pass
+        self._attach(container)
+
+    def _attach(self, value: Any):
+        if not self._stack:
+            if isinstance(value, (dict, list)):
+                self._root = value
+            return
+        frame = self._stack[-1]
+        container = frame[0]
+        if isinstance(container, list):
+            container.append(value)
+        elif frame[1] is _NO_KEY:
+            if not isinstance(value, (dict, list)):
+                frame[1] = value if isinstance(value, str) else json.dumps(value)
+        else:
+            container[frame[1]] = value
+            frame[1] = _NO_KEY
+
+
+def _bare_value(token: str) -> Any:
+    if token in _LITERALS:
+        return _LITERALS[token]
+    if _NUMBER.fullmatch(token):
+        try:
+            return int(token)
+        except ValueError:
+            return float(token)
+    return token
+
+
+def validate(value: Any, schema: dict | None) -> Any:
+    """Conforms value to a Gemini response schema (OBJECT/ARRAY/STRING/...).
+
+    Scalars are coerced where unambiguous, enum values are matched
+    case-insensitively and array items that do not conform are dropped.
+    Raises SchemaError when value itself cannot conform.
+    """
+    if not schema:
+        return value
+    kind = schema.get("type", "").upper()
+    if kind == "OBJECT":
+        if not isinstance(value, dict):
+            raise SchemaError(f"expected object, got {type(value).__name__}")
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        result = {}
+        for key, item in value.items():
+            if key not in properties:
+                result[key] = item
+                continue
+            try:
+                result[key] = validate(item, properties[key])
+            except SchemaError:
+                if key in required:
+                    raise
+        missing = [key for key in required if key not in result]
+        if missing:
+            raise SchemaError(f"missing required keys: {', '.join(missing)}")
+        return result
+    if kind == "ARRAY":
+        if not isinstance(value, list):
+            raise SchemaError(f"expected array, got {type(value).__name__}")
+        items = schema.get("items")
+        result = []
+        for item in value:
+            try:
+                result.append(validate(item, items))
+            except SchemaError:
+                continue
+        return result
+    if kind == "STRING":
+        if isinstance(value, (dict, list)) or value is None:
+            raise SchemaError("expected string")
+        text = value if isinstance(value, str) else str(value)
+        enum = schema.get("enum")
+        if enum and text not in enum:
+            folded = {option.lower(): option for option in enum}
+            if text.strip().lower() not in folded:
+                raise SchemaError(f"{text!r} not in {enum}")
+            text = folded[text.strip().lower()]
+        return text
+    if kind in ("NUMBER", "INTEGER"):
+        if isinstance(value, str) and _NUMBER.fullmatch(value.strip()):
+            value = float(value)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise SchemaError("expected number")
+        return int(value) if kind == "INTEGER" else value
+    if kind == "BOOLEAN":
+        if not isinstance(value, bool):
+            raise SchemaError("expected boolean")
+        return value
+    return value
+
+
+def parse(text: str, schema: dict | None = None) -> Any:
+    """Parses complete model output, repairing it only when strict JSON fails."""
+    try:
+        value = json.loads(text)
+    except (ValueError, TypeError):
+        parser = JSONStreamParser()
+        parser.feed(text or "")
+        value = parser.finish()
+    if value is None:
+        raise JSONStreamError("No JSON object or array found in response")
+    try:
+        return validate(value, schema)
+    except SchemaError as e:
+        raise JSONStreamError(f"Response does not match schema: {e}") from e
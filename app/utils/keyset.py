@@ -0,0 +1,78 @@
+"""Keyset pagination for the paged admin tables (reports and institutions).
+
+A page is the rows that sort after the last row of the previous page,
+`(sort_key, id) > (:after_key, :after_id)`, so a deep page is the same
+index range scan as the first one, where OFFSET would read and discard
+every row before it. Pages are fetched with one extra row to learn whether
+another page follows.
+"""
+
+import json
+from sqlalchemy import text
+
+EXACT_COUNT_LIMIT = 1000
+
+
+def seek(
+    sort_expr: str, id_expr: str, descending: bool, after: tuple | None
+) -> tuple[str, str, dict]:
+    """(WHERE condition, ORDER BY clause, params) for the page following `after`."""
+    direction = "DESC" if descending else "ASC"
+    order_by = f"{sort_expr} {direction}, {id_expr} {direction}"
+    if after is None:
+        return ("TRUE", order_by, {})
+    op = "<" if descending else ">"
+    return (
+        f"({sort_expr}, {id_expr}) {op} (:after_key, :after_id)",
+        order_by,
+        {"after_key": after[0], "after_id": after[1]},
+    )
+
+
+def split_page(rows: list, page_size: int) -> tuple[list, bool]:
+    """A page fetched with LIMIT page_size + 1, and whether another page follows."""
+    return (rows[:page_size], len(rows) > page_size)
+
+
+def cursor(rows: list[dict], sort_field: str) -> tuple | None:
+    """The (sort_key, id) the page after rows starts after."""
+    if not rows:
+        return None
+    last = rows[-1]
+    return (last[sort_field], int(last["id"]))
+
+
+async def estimate_count(session, from_where: str, params: dict) -> int:
+    """Rows matched by `FROM ... WHERE ...`.
+
+    Exact up to EXACT_COUNT_LIMIT; above that the planner's estimate is used,
+    so a broad search does not count tens of thousands of rows on each
+    keystroke.
+    """
+    result = await session.execute(
+        text(
+            f"SELECT COUNT(*) FROM (SELECT 1 {from_where} "
+            f"LIMIT {EXACT_COUNT_LIMIT + 1}) matched"
+        ),
+        params,
+    )
+    count = result.scalar() or 0
+    if count <= EXACT_COUNT_LIMIT:
+        return count
+    result = await session.execute(
+        text(f"EXPLAIN (FORMAT JSON) SELECT 1 {from_where}"), params
+    )
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return max(count, int(plan[0]["Plan"]["Plan Rows"]))
+
+
+def total_pages(
+    total_count: int, page_size: int, current_page: int, has_next: bool
+) -> int:
+    """Page count from the count estimate, corrected by what paging has seen."""
+    if not has_next:
+        return current_page
+    estimated = (total_count + page_size - 1) // page_size
+    return max(estimated, current_page + 1)
@@ -0,0 +1,177 @@
+"""Applies schema.sql and the numbered files in migrations/ once per database.
+
+Runs at startup (see app.py) before the app serves requests, and can be run
+manually from the repository root:
+
+    python -m app.utils.migrations [--list]
+
+schema.sql is the baseline: it is executed on an empty database and only
+recorded on one that already has its tables. Each migrations/NNNN_name.sql
+(or NNNN_name.py defining `async def upgrade(session)`) then runs once, in
+file order, in its own transaction, and is recorded in schema_migrations.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import logging
+from pathlib import Path
+import reflex as rx
+from sqlalchemy import text
+from app.utils import indicators
+from app.utils.numeric_scores import backfill_numeric_values
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SCHEMA_PATH = ROOT_DIR / "schema.sql"
+MIGRATIONS_DIR = ROOT_DIR / "migrations"
+BASELINE_VERSION = "0000_baseline"
+ADVISORY_LOCK_KEY = 7_140_021
+
+_ready = asyncio.Event()
+
+
+def migration_files() -> list[tuple[str, Path]]:
+    """(version, path) of every numbered migration, in the order they apply."""
+    files = sorted(
+        path
+        for path in MIGRATIONS_DIR.glob("[0-9]*")
+        if path.suffix in (".sql", ".py")
+    )
+    return [(path.stem, path) for path in files]
+
+
+async def _execute_script(session, sql: str):
+    """Runs a multi-statement script; without parameters the driver sends it as is."""
+    connection = await session.connection()
+    await connection.exec_driver_sql(sql)
+
+
+async def _run_python(session, path: Path):
+    spec = importlib.util.spec_from_file_location(f"migrations.{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    await module.upgrade(session)
+
+
+async def _record(session, version: str):
+    await session.execute(
+        text("INSERT INTO schema_migrations (version) VALUES (:version)"),
+        {"version": version},
+    )
+
+
+async def _apply_baseline(session) -> bool:
+    """Runs schema.sql on an empty database; returns whether it ran."""
+    existing = await session.execute(text("SELECT to_regclass('public.institutions')"))
+    has_tables = existing.scalar() is not None
+    if not has_tables:
+        await _execute_script(session, SCHEMA_PATH.read_text())
+    await _record(session, BASELINE_VERSION)
+    await session.commit()
+    return not has_tables
+
+
+async def migrate() -> list[str]:
+    """Applies every pending migration and returns the versions applied.
+
+    A session-level advisory lock serializes concurrent workers: the first
+    migrates, the rest wait and then find nothing pending.
+    """
+    async with rx.asession() as lock_session:
+        await lock_session.execute(
+            text("SELECT pg_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY}
+        )
+        try:
+            async with rx.asession() as session:
+                await session.execute(
+                    text("""
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        version VARCHAR(255) PRIMARY KEY,
+                        applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+                    )
+                    """)
+                )
+                await session.commit()
+                result = await session.execute(
+                    text("SELECT version FROM schema_migrations")
+                )
+                done = {row[0] for row in result.all()}
+                applied = []
+                if BASELINE_VERSION not in done:
+                    if await _apply_baseline(session):
+                        applied.append(BASELINE_VERSION)
+                for version, path in migration_files():
+                    if version in done:
+                        continue
+                    if path.suffix == ".py":
+                        await _run_python(session, path)
+                    else:
+                        await _execute_script(session, path.read_text())
+                    await _record(session, version)
+                    await session.commit()
+                    applied.append(version)
+                    logging.info(f"Applied migration {version}")
+                return applied
+        finally:
+            await lock_session.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY}
+            )
+
+
+@contextlib.asynccontextmanager
+async def run_on_startup():
+    """Lifespan context: migrates and loads the indicator registry before serving.
+
+    Reflex enters lifespan contexts before the server accepts requests, so no
+    request reaches the database ahead of the schema, and a failed migration
+    stops startup. The numeric backfill then runs in the background.
+    """
+    try:
+        await migrate()
+    except Exception as e:
+        logging.exception(f"Error applying database migrations: {e}")
+        raise
+    await indicators.load_on_startup()
+    _ready.set()
+    backfill = asyncio.create_task(backfill_numeric_values())
+    try:
+        yield
+    finally:
+        backfill.cancel()
+
+
+async def wait_ready():
+    """Returns once run_on_startup has applied the migrations."""
+    await _ready.wait()
+
+
+async def _pending() -> list[str]:
+    async with rx.asession() as session:
+        exists = await session.execute(
+            text("SELECT to_regclass('public.schema_migrations')")
+        )
+        done = set()
+        if exists.scalar() is not None:
+            result = await session.execute(text("SELECT version FROM schema_migrations"))
+            done = {row[0] for row in result.all()}
+    versions = [BASELINE_VERSION] + [version for version, _ in migration_files()]
+    return [version for version in versions if version not in done]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--list", action="store_true", help="Only list migrations not yet applied."
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.list:
+        print("\n".join(asyncio.run(_pending())) or "Up to date.")
+        return
+    applied = asyncio.run(migrate())
+    print(f"Applied: {', '.join(applied)}" if applied else "Up to date.")
+
+
+if __name__ == "__main__":
+    main()
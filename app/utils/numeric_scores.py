@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import re
+import reflex as rx
+from sqlalchemy import text
+
+BACKFILL_BATCH_SIZE = 500
+BACKFILL_PAUSE_SECONDS = 0.05
+TEXT_INDICATOR_CODES = ("international_student_diversity",)
+# Shared by numeric_value and the backfill so both convert the same strings.
+NUMERIC_PATTERN = r"^[-+]?([0-9]+([.][0-9]*)?|[.][0-9]+)([eE][-+]?[0-9]+)?$"
+_numeric_re = re.compile(NUMERIC_PATTERN)
+
+
+def numeric_value(code: str, value) -> float | None:
+    """Returns the value to store in value_numeric.
+
+    None for text indicators and for values that are not a plain decimal number.
+    """
+    if code in TEXT_INDICATOR_CODES or value is None:
+        return None
+    stripped = str(value).strip()
+    if not _numeric_re.match(stripped):
+        return None
+    return float(stripped)
+
+
+async def backfill_numeric_values(
+    batch_size: int = BACKFILL_BATCH_SIZE, pause: float = BACKFILL_PAUSE_SECONDS
+) -> int:
+    """Fills value_numeric from the legacy text column in small committed batches.
+
+    Each batch locks only the rows it updates (SKIP LOCKED leaves rows that are
+    being saved to a later batch), so the table stays writable throughout. It
+    loops until a batch updates nothing. Values numeric_value() would reject
+    are left NULL, as a live save stores them.
+    """
+    total = 0
+    try:
+        while True:
+            async with rx.asession() as session:
+                result = await session.execute(
+                    text("""
+                    WITH batch AS (
+                        SELECT s.ctid AS row_ref, btrim(s.value) AS stripped
+                        FROM institution_scores s
+                        JOIN ranking_indicators i ON i.id = s.indicator_id
+                        WHERE s.value_numeric IS NULL
+                          AND btrim(s.value) ~ :pattern
+                          AND i.code <> ALL(:text_codes)
+                        LIMIT :batch_size
+                        FOR UPDATE OF s SKIP LOCKED
+                    )
+                    UPDATE institution_scores s
+                    SET value_numeric = CAST(batch.stripped AS DOUBLE PRECISION)
+                    FROM batch
+                    WHERE s.ctid = batch.row_ref
+                    """),
+                    {
+                        "pattern": NUMERIC_PATTERN,
+                        "text_codes": list(TEXT_INDICATOR_CODES),
+                        "batch_size": batch_size,
+                    },
+                )
+                await session.commit()
+            updated = result.rowcount or 0
+            total += updated
+            if updated == 0:
+                break
+            await asyncio.sleep(pause)
+    except Exception as e:
+        logging.exception(f"Error backfilling numeric score values: {e}")
+    if total:
+        logging.info(f"Backfilled value_numeric for {total} institution_scores rows")
+    return total
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_numeric_values())
@@ -0,0 +1,206 @@
+"""Precomputes AI recommendations for every institution with changed scores.
+
+Runs nightly inside the app (see app.py) and can be run manually from the
+repository root:
+
+    python -m app.utils.precompute [--concurrency N] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import datetime
+import logging
+import os
+import reflex as rx
+from sqlalchemy import text
+from app.utils import ai_gateway, migrations
+from app.utils import recommendations as recommendations_store
+from app.utils.computed_scores import RANKING_YEAR
+
+PRECOMPUTE_CONCURRENCY = int(os.getenv("AI_PRECOMPUTE_CONCURRENCY", "3"))
+PRECOMPUTE_HOUR = int(os.getenv("AI_PRECOMPUTE_HOUR", "2"))
+ADVISORY_LOCK_KEY = 7_140_014
+
+
+async def _fetch_institution_scores(ranking_year: int) -> list[dict]:
+    async with rx.asession() as session:
+        result = await session.execute(
+            text("""
+            SELECT i.institution_name, c.overall_score, c.research_score,
+                   c.employability_score, c.global_engagement_score,
+                   c.learning_experience_score, c.sustainability_score
+            FROM institution_computed_scores c
+            JOIN institutions i ON i.id = c.institution_id
+            WHERE c.ranking_year = :year AND c.indicator_count > 0
+            ORDER BY i.id
+            """),
+            {"year": ranking_year},
+        )
+        return [
+            dict(zip(("name",) + recommendations_store.SCORE_KEYS, row))
+            for row in result.all()
+        ]
+
+
+def _jobs(institutions: list[dict]) -> dict[str, tuple[str, str, str]]:
+    """Maps fingerprint -> (kind, model, prompt) for every page an institution has.
+
+    Institutions with identical scores share one analytics fingerprint, so
+    each distinct prompt is generated once.
+    """
+    jobs = {}
+    for inst in institutions:
+        jobs[recommendations_store.analytics_fingerprint(inst)] = (
+            recommendations_store.ANALYTICS_KIND,
+            recommendations_store.ANALYTICS_MODEL,
+            recommendations_store.analytics_prompt(inst),
+        )
+        jobs[recommendations_store.report_fingerprint(inst["name"], inst)] = (
+            recommendations_store.REPORT_KIND,
+            recommendations_store.REPORT_MODEL,
+            recommendations_store.report_prompt(inst["name"], inst),
+        )
+    return jobs
+
+
+async def _generate(
+    fp: str,
+    kind: str,
+    model: str,
+    prompt: str,
+    semaphore: asyncio.Semaphore,
+    breaker_open: asyncio.Event,
+) -> bool:
+    async with semaphore:
+        if breaker_open.is_set():
+            return False
+        try:
+            data = await ai_gateway.generate_json(
+                prompt,
+                recommendations_store.RECOMMENDATIONS_SCHEMA,
+                model=model,
+                priority=ai_gateway.PRIORITY_BACKGROUND,
+            )
+        except ai_gateway.AICircuitOpenError as e:
+            logging.warning(f"Stopping recommendation precompute: {e}")
+            breaker_open.set()
+            return False
+        except ai_gateway.AIGenerationError as e:
+            logging.warning(f"Precompute failed for {kind} {fp[:12]}: {e}")
+            return False
+    default_title = (
+        "Strategic Insight"
+        if kind == recommendations_store.REPORT_KIND
+        else "Strategic Recommendation"
+    )
+    recommendations = [
+        recommendations_store.decorate_recommendation(rec, default_title)
+        for rec in data.get("recommendations", [])
+    ]
+    if not recommendations:
+        return False
+    await recommendations_store.store(fp, kind, model, recommendations)
+    return True
+
+
+async def precompute_recommendations(
+    concurrency: int = PRECOMPUTE_CONCURRENCY,
+    ranking_year: int = RANKING_YEAR,
+    dry_run: bool = False,
+) -> dict[str, int] | None:
+    """Generates and stores recommendations whose fingerprint is not stored yet.
+
+    A fingerprint changes whenever an institution's rounded scores change, so
+    only changed institutions reach the model. Requests go through the
+    gateway at background priority, at most `concurrency` at a time, and the
+    run stops early once the circuit breaker opens. Returns counts, or None
+    when another process holds the run lock.
+    """
+    async with rx.asession() as lock_session:
+        # The session-level lock is held for the whole run; in autocommit mode
+        # its pooled connection is not left idle in an open transaction.
+        lock_connection = await lock_session.connection(
+            execution_options={"isolation_level": "AUTOCOMMIT"}
+        )
+        locked = await lock_connection.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY}
+        )
+        if not locked.scalar():
+            logging.info("Recommendation precompute already running elsewhere.")
+            return None
+        try:
+            institutions = await _fetch_institution_scores(ranking_year)
+            jobs = _jobs(institutions)
+            stored = await recommendations_store.stored_fingerprints(list(jobs))
+            pending = {fp: job for fp, job in jobs.items() if fp not in stored}
+            summary = {
+                "institutions": len(institutions),
+                "up_to_date": len(jobs) - len(pending),
+                "pending": len(pending),
+                "generated": 0,
+                "failed": 0,
+            }
+            if dry_run or not pending:
+                return summary
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+            breaker_open = asyncio.Event()
+            results = await asyncio.gather(
+                *(
+                    _generate(fp, kind, model, prompt, semaphore, breaker_open)
+                    for fp, (kind, model, prompt) in pending.items()
+                )
+            )
+            summary["generated"] = sum(results)
+            summary["failed"] = len(results) - summary["generated"]
+            return summary
+        finally:
+            await lock_connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY}
+            )
+
+
+def _seconds_until(hour: int) -> float:
+    now = datetime.datetime.now()
+    run_at = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if run_at <= now:
+        run_at += datetime.timedelta(days=1)
+    return (run_at - now).total_seconds()
+
+
+async def run_nightly():
+    """Lifespan task: precomputes recommendations every day at PRECOMPUTE_HOUR."""
+    if not ai_gateway.AI_AVAILABLE:
+        logging.info("Google AI not configured; nightly precompute disabled.")
+        return
+    await migrations.wait_ready()
+    while True:
+        await asyncio.sleep(_seconds_until(PRECOMPUTE_HOUR))
+        try:
+            summary = await precompute_recommendations()
+            if summary is not None:
+                logging.info(f"Nightly recommendation precompute: {summary}")
+        except Exception as e:
+            logging.exception(f"Error in nightly recommendation precompute: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=PRECOMPUTE_CONCURRENCY)
+    parser.add_argument("--year", type=int, default=RANKING_YEAR)
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report how many recommendations are missing.",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if not ai_gateway.AI_AVAILABLE and not args.dry_run:
+        parser.error("Google AI is not configured (GOOGLE_API_KEY / google-genai).")
+    summary = asyncio.run(
+        precompute_recommendations(args.concurrency, args.year, args.dry_run)
+    )
+    print(summary if summary is not None else "Another precompute run holds the lock.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+import hashlib
+import json
+import logging
+from typing import Any
+import reflex as rx
+from sqlalchemy import text
+from app.utils.cache_backend import get_cache_backend
+from app.utils.scoring import LENS_KEYS
+
+ANALYTICS_KIND = "analytics"
+REPORT_KIND = "report"
+HISTORICAL_KIND = "historical_insights"
+TEMPLATE_VERSIONS = {ANALYTICS_KIND: "1", REPORT_KIND: "1", HISTORICAL_KIND: "1"}
+ANALYTICS_MODEL = "gemini-2.0-flash"
+REPORT_MODEL = "gemini-2.5-flash"
+SCORE_KEYS = ("overall_score",) + LENS_KEYS
+_ITEM_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "title": {"type": "STRING"},
+        "description": {"type": "STRING"},
+        "category": {"type": "STRING"},
+        "priority": {"type": "STRING", "enum": ["High", "Medium", "Low"]},
+    },
+    "required": ["title", "description", "category", "priority"],
+}
+RECOMMENDATIONS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {"recommendations": {"type": "ARRAY", "items": _ITEM_SCHEMA}},
+    "required": ["recommendations"],
+}
+INSIGHTS_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "title": {"type": "STRING"},
+            "description": {"type": "STRING"},
+        },
+        "required": ["title", "description"],
+    },
+}
+CATEGORY_STYLES = (
+    ("Research", "microscope", "text-purple-600", "bg-purple-50 border-purple-100"),
+    ("Employability", "briefcase", "text-emerald-600", "bg-emerald-50 border-emerald-100"),
+    ("Global", "globe", "text-blue-600", "bg-blue-50 border-blue-100"),
+    ("Learning", "graduation-cap", "text-indigo-600", "bg-indigo-50 border-indigo-100"),
+    ("Sustainability", "leaf", "text-green-600", "bg-green-50 border-green-100"),
+)
+DEFAULT_STYLE = ("lightbulb", "text-amber-600", "bg-amber-50 border-amber-100")
+CACHE_PREFIX = "ai_store:"
+CACHE_TTL = 24 * 3600
+
+
+def decorate_recommendation(
+    rec: dict, default_title: str = "Strategic Recommendation"
+) -> dict[str, str]:
+    """Maps a model recommendation to the card fields (icon and colours by category)."""
+    category = rec.get("category", "Overall")
+    icon, color_class, bg_class = next(
+        (style[1:] for style in CATEGORY_STYLES if style[0] in category),
+        DEFAULT_STYLE,
+    )
+    return {
+        "title": rec.get("title", default_title),
+        "description": rec.get("description", ""),
+        "category": category,
+        "priority": rec.get("priority", "Medium"),
+        "icon": icon,
+        "color_class": color_class,
+        "bg_class": bg_class,
+    }
+
+
+def _score_list(scores: dict) -> list:
+    return [scores[key] for key in SCORE_KEYS]
+
+
+def analytics_fingerprint(scores: dict) -> str:
+    """Fingerprint of the /analytics prompt for a dict holding SCORE_KEYS."""
+    return fingerprint(ANALYTICS_KIND, ANALYTICS_MODEL, _score_list(scores))
+
+
+def report_fingerprint(institution_name: str, scores: dict) -> str:
+    """Fingerprint of the /reports prompt, which also names the institution."""
+    return fingerprint(
+        REPORT_KIND, REPORT_MODEL, _score_list(scores), context=institution_name
+    )
+
+
+def analytics_prompt(scores: dict) -> str:
+    """Builds the /analytics recommendations prompt from the lens scores."""
+    research_score = scores["research_score"]
+    employability_score = scores["employability_score"]
+    global_engagement_score = scores["global_engagement_score"]
+    learning_experience_score = scores["learning_experience_score"]
+    sustainability_score = scores["sustainability_score"]
+    overall_score = scores["overall_score"]
+    performance_summary = f"\nPerformance Summary:\n- Overall Readiness Score: {overall_score}/100\n- Research & Discovery: {research_score}/100\n- Employability & Outcomes: {employability_score}/100\n- Global Engagement: {global_engagement_score}/100\n- Learning Experience: {learning_experience_score}/100\n- Sustainability: {sustainability_score}/100\n"
+    weak_areas = []
+    if research_score < 70:
+        weak_areas.append("Research & Discovery")
+    if employability_score < 70:
+        weak_areas.append("Employability & Outcomes")
+    if global_engagement_score < 70:
+        weak_areas.append("Global Engagement")
+    if learning_experience_score < 70:
+        weak_areas.append("Learning Experience")
+    if sustainability_score < 70:
+        weak_areas.append("Sustainability")
+    return f"""You are an expert higher education consultant. \n\nAnalyze the following performance data for a Higher Education Institution and provide 3-4 strategic, actionable recommendations to improve their institutional readiness.\n\n{performance_summary}\n\nAreas needing improvement: {(", ".join(weak_areas) if weak_areas else "All areas are performing well")}\n\nProvide recommendations in JSON format with this structure:\n{{\n  "recommendations": [\n    {{\n      "title": "Short, actionable title (max 8 words)",\n      "description": "Detailed recommendation explaining specific actions to improve performance in this area.",\n      "category": "Research & Discovery|Employability|Global Engagement|Learning Experience|Sustainability|Overall",\n      "priority": "High|Medium|Low"\n    }}\n  ]\n}}\n\nReturn ONLY valid JSON, no additional text."""
+
+
+def report_prompt(institution_name: str, scores: dict) -> str:
+    """Builds the /reports recommendations prompt for one institution."""
+    research_score = scores["research_score"]
+    employability_score = scores["employability_score"]
+    global_engagement_score = scores["global_engagement_score"]
+    learning_experience_score = scores["learning_experience_score"]
+    sustainability_score = scores["sustainability_score"]
+    overall_score = scores["overall_score"]
+    performance_summary = f"\nAnalysis for {institution_name}:\n- Overall Readiness Score: {overall_score}/100\n- Research & Discovery: {research_score}/100\n- Employability: {employability_score}/100\n- Global Engagement: {global_engagement_score}/100\n- Learning Experience: {learning_experience_score}/100\n- Sustainability: {sustainability_score}/100\n"
+    weak_areas = []
+    if research_score < 70:
+        weak_areas.append("Research")
+    if employability_score < 70:
+        weak_areas.append("Employability")
+    if global_engagement_score < 70:
+        weak_areas.append("Global Engagement")
+    if learning_experience_score < 70:
+        weak_areas.append("Learning Experience")
+    if sustainability_score < 70:
+        weak_areas.append("Sustainability")
+    return f"""You are an expert higher education consultant. Analyze the following performance data for {institution_name} and provide 3 strategic, actionable recommendations to improve their overall readiness.\n\n{performance_summary}\n\nFocus areas: {(", ".join(weak_areas) if weak_areas else "General Excellence")}\n\nProvide recommendations in JSON format with this structure:\n{{\n  "recommendations": [\n    {{\n      "title": "Short, actionable title (max 8 words)",\n      "description": "Detailed recommendation explaining specific improvements for the institution.",\n      "category": "Research & Discovery|Employability|Global Engagement|Learning Experience|Sustainability|Overall",\n      "priority": "High|Medium|Low"\n    }}\n  ]\n}}\n\nReturn ONLY valid JSON."""
+
+
+def _rounded(value: Any) -> Any:
+    """Rounds every number in a score structure to whole points."""
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return int(round(value))
+    if isinstance(value, dict):
+        return {str(k): _rounded(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_rounded(v) for v in value]
+    return value
+
+
+def fingerprint(kind: str, model: str, scores: Any, context: str = "") -> str:
+    """Hash of (prompt template version, model, rounded scores[, prompt context]).
+
+    context carries any other prompt input, such as the institution name that
+    the report prompt mentions; analytics prompts contain only scores, so
+    institutions with identical scores share one stored answer.
+    """
+    key = json.dumps(
+        {
+            "kind": kind,
+            "template": TEMPLATE_VERSIONS[kind],
+            "model": model,
+            "scores": _rounded(scores),
+            "context": context,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+async def get_stored(fp: str) -> Any | None:
+    """Returns the stored payload for a fingerprint from the cache or Postgres."""
+    backend = get_cache_backend()
+    cached = await backend.get(f"{CACHE_PREFIX}{fp}")
+    if cached is not None:
+        return cached
+    try:
+        async with rx.asession() as session:
+            result = await session.execute(
+                text("SELECT payload FROM ai_recommendations WHERE fingerprint = :fp"),
+                {"fp": fp},
+            )
+            row = result.first()
+    except Exception as e:
+        logging.exception(f"Error reading stored AI recommendations: {e}")
+        return None
+    if not row:
+        return None
+    payload = json.loads(row[0])
+    await backend.set(f"{CACHE_PREFIX}{fp}", payload, CACHE_TTL)
+    return payload
+
+
+async def stored_fingerprints(fps: list[str]) -> set[str]:
+    """Returns which of the given fingerprints already have a stored payload."""
+    if not fps:
+        return set()
+    async with rx.asession() as session:
+        result = await session.execute(
+            text(
+                "SELECT fingerprint FROM ai_recommendations WHERE fingerprint = ANY(:fps)"
+            ),
+            {"fps": list(fps)},
+        )
+        return {row[0] for row in result.all()}
+
+
+async def store(fp: str, kind: str, model: str, payload: Any):
+    """Persists a generated payload so restarts and other workers reuse it."""
+    await get_cache_backend().set(f"{CACHE_PREFIX}{fp}", payload, CACHE_TTL)
+    try:
+        async with rx.asession() as session:
+            await session.execute(
+                text("""
+                INSERT INTO ai_recommendations (fingerprint, kind, template_version, model, payload)
+                VALUES (:fp, :kind, :version, :model, :payload)
+                ON CONFLICT (fingerprint) DO UPDATE SET
+                    payload = EXCLUDED.payload,
+                    created_at = CURRENT_TIMESTAMP
+                """),
+                {
+                    "fp": fp,
+                    "kind": kind,
+                    "version": TEMPLATE_VERSIONS[kind],
+                    "model": model,
+                    "payload": json.dumps(payload),
+                },
+            )
+            await session.commit()
+    except Exception as e:
+        logging.exception(f"Error storing AI recommendations: {e}")
+
+
+async def clear_stored(kind: str):
+    """Drops every stored payload of one kind, forcing regeneration."""
+    async with rx.asession() as session:
+        await session.execute(
+            text("DELETE FROM ai_recommendations WHERE kind = :kind"), {"kind": kind}
+        )
+        await session.commit()
+    await get_cache_backend().clear(CACHE_PREFIX)
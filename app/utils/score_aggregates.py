@@ -0,0 +1,18 @@
+from sqlalchemy import text
+
+
+async def fetch_indicator_averages(session, ranking_year: int) -> dict[str, float]:
+    """Reads exact per-indicator averages in O(indicators) from the running totals."""
+    result = await session.execute(
+        text("""
+        SELECT i.code, a.value_sum / NULLIF(a.value_count, 0)
+        FROM indicator_score_aggregates a
+        JOIN ranking_indicators i ON i.id = a.indicator_id
+        WHERE a.ranking_year = :year
+        """),
+        {"year": ranking_year},
+    )
+    return {
+        row[0]: round(float(row[1]), 2) if row[1] is not None else 0.0
+        for row in result.all()
+    }
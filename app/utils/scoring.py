@@ -0,0 +1,123 @@
+import logging
+from typing import Iterable, Mapping
+import numpy as np
+
+COMPONENT_CODES = (
+    "academic_reputation",
+    "citations_per_faculty",
+    "employer_reputation",
+    "employment_outcomes",
+    "international_research_network",
+    "international_faculty_ratio",
+    "international_student_ratio",
+    "faculty_student_ratio",
+    "sustainability_metrics",
+)
+NOMINATION_SPLITS = {
+    "academic_reputation": {
+        "international_nominations": 0.85,
+        "domestic_nominations": 0.15,
+    },
+    "employer_reputation": {
+        "employer_domestic_nominations": 0.5,
+        "employer_international_nominations": 0.5,
+    },
+}
+NOMINATION_CODES = tuple(
+    (code for split in NOMINATION_SPLITS.values() for code in split)
+)
+INPUT_CODES = COMPONENT_CODES + NOMINATION_CODES
+LENS_KEYS = (
+    "research_score",
+    "employability_score",
+    "global_engagement_score",
+    "learning_experience_score",
+    "sustainability_score",
+)
+LENS_WEIGHTS = np.array([0.5, 0.2, 0.15, 0.1, 0.05])
+BENCHMARKS = np.array([100.0, 100.0, 100.0, 100.0, 100.0, 25.0, 25.0, 100.0, 100.0])
+INDICATOR_WEIGHTS = np.array([0.3, 0.2, 0.15, 0.05, 0.05, 0.05, 0.05, 0.1, 0.05])
+_LENS_OF_COMPONENT = np.array([0, 0, 1, 1, 2, 2, 2, 3, 4])
+_MEMBERSHIP = np.zeros((len(COMPONENT_CODES), len(LENS_KEYS)))
+_MEMBERSHIP[np.arange(len(COMPONENT_CODES)), _LENS_OF_COMPONENT] = 1.0
+LENS_MATRIX = _MEMBERSHIP * (INDICATOR_WEIGHTS / LENS_WEIGHTS[_LENS_OF_COMPONENT])[
+    :, None
+]
+COMPONENT_LENSES = {
+    code: LENS_KEYS[lens] for code, lens in zip(COMPONENT_CODES, _LENS_OF_COMPONENT)
+}
+_EPSILON = 1e-09
+_COMPONENT_INDEX = {code: i for i, code in enumerate(COMPONENT_CODES)}
+_INPUT_INDEX = {code: i for i, code in enumerate(INPUT_CODES)}
+
+
+def to_float(value) -> float:
+    """Parse a stored score value (number, numeric string or None) to float."""
+    if value is None:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        clean = "".join((c for c in str(value) if c.isdigit() or c == "."))
+        return float(clean) if clean else 0.0
+    except ValueError as e:
+        logging.exception(f"Error parsing score value '{value}': {e}")
+        return 0.0
+
+
+def build_matrix(score_maps: Iterable[Mapping[str, object]]) -> np.ndarray:
+    """Builds the (institutions x components) raw score matrix from code->value maps.
+
+    Composite reputation components are derived from their nomination inputs when
+    any nomination is present, otherwise the stored composite value is used.
+    """
+    rows = [[to_float(m.get(code)) for code in INPUT_CODES] for m in score_maps]
+    raw = np.array(rows, dtype=float).reshape(-1, len(INPUT_CODES))
+    matrix = raw[:, : len(COMPONENT_CODES)].copy()
+    for component, split in NOMINATION_SPLITS.items():
+        cols = [_INPUT_INDEX[code] for code in split]
+        weights = np.array(list(split.values()))
+        has_nominations = raw[:, cols].any(axis=1)
+        derived = raw[:, cols] @ weights
+        idx = _COMPONENT_INDEX[component]
+        matrix[:, idx] = np.where(has_nominations, derived, matrix[:, idx])
+    return matrix
+
+
+def composite_value(component: str, values: Mapping[str, object]) -> float:
+    """Combines nomination inputs into their composite reputation component."""
+    return sum(
+        (to_float(values.get(code)) * w for code, w in NOMINATION_SPLITS[component].items())
+    )
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """Scales raw component values against their benchmarks to a 0-100 range."""
+    return np.clip(matrix / BENCHMARKS * 100.0, 0.0, 100.0)
+
+
+def score_matrix(matrix: np.ndarray) -> dict[str, np.ndarray]:
+    """Computes all lens scores and the overall score in a single vectorized pass.
+
+    Lens scores are truncated to whole points before weighting, matching the
+    integer scores shown across the analytics, reports and historical pages.
+    """
+    lenses = np.floor(normalize(matrix) @ LENS_MATRIX + _EPSILON)
+    overall = np.floor(lenses @ LENS_WEIGHTS + _EPSILON)
+    scores = {key: lenses[:, i].astype(int) for i, key in enumerate(LENS_KEYS)}
+    scores["overall_score"] = overall.astype(int)
+    return scores
+
+
+def score_one(score_map: Mapping[str, object]) -> dict[str, int]:
+    """Scores a single institution's code->value map.
+
+    >>> scores = score_one(
+    ...     {code: 50 for code in COMPONENT_CODES}
+    ...     | {"international_faculty_ratio": 10, "international_student_ratio": 20}
+    ... )
+    >>> scores["global_engagement_score"], scores["overall_score"]
+    (56, 50)
+    """
+    scores = score_matrix(build_matrix([score_map]))
+    return {key: int(values[0]) for key, values in scores.items()}
@@ -0,0 +1,110 @@
+import json
+from app.utils import scoring
+
+_SCRIPT = """
+if (!window.__assessmentScoring) {
+  window.__assessmentScoring = true;
+  const CONFIG = __CONFIG__;
+  const FORM_ID = "__FORM_ID__";
+  const clampInput = (raw) =>
+    Math.max(0, Math.min(100, Math.trunc(parseFloat(raw) || 0)));
+  const round1 = (x) => Math.round(x * 10) / 10;
+  const componentPoints = (code, value) =>
+    Math.min(100, Math.max(0, (value / CONFIG.benchmarks[code]) * 100)) *
+    CONFIG.weights[code];
+  const readValues = (form) => {
+    const values = JSON.parse(form.dataset.values || "{}");
+    for (const el of form.elements) {
+      if (el.name && el.type === "number") values[el.name] = clampInput(el.value);
+    }
+    return values;
+  };
+  const compute = (values) => {
+    const results = {};
+    const componentValues = {};
+    for (const code of CONFIG.components) {
+      componentValues[code] = Number(values[code]) || 0;
+    }
+    for (const [component, split] of Object.entries(CONFIG.splits)) {
+      let composite = 0;
+      for (const [code, share] of Object.entries(split)) {
+        const value = Number(values[code]) || 0;
+        composite += value * share;
+        results[code] = round1(componentPoints(component, value) * share);
+      }
+      componentValues[component] = composite;
+    }
+    for (const code of CONFIG.components) {
+      results[code] = round1(componentPoints(code, componentValues[code]));
+    }
+    for (const [lens, codes] of Object.entries(CONFIG.lenses)) {
+      results[lens] = round1(codes.reduce((total, code) => total + results[code], 0));
+    }
+    const filled = CONFIG.components.filter((code) => componentValues[code] > 0);
+    results.progress = Math.trunc((filled.length / CONFIG.components.length) * 100);
+    return results;
+  };
+  const render = () => {
+    const form = document.getElementById(FORM_ID);
+    if (!form) return;
+    const results = compute(readValues(form));
+    for (const el of document.querySelectorAll("[data-score]")) {
+      const value = results[el.dataset.score];
+      if (value === undefined) continue;
+      const text = el.dataset.score === "progress" ? String(value) : value.toFixed(1);
+      if (el.textContent !== text) el.textContent = text;
+    }
+    for (const el of document.querySelectorAll("[data-score-bar]")) {
+      const ratio = results[el.dataset.scoreBar] / Number(el.dataset.scoreMax);
+      const width = `${Math.min(100, ratio * 100)}%`;
+      if (el.style.width !== width) el.style.width = width;
+    }
+  };
+  let scheduled = false;
+  const schedule = () => {
+    if (scheduled) return;
+    scheduled = true;
+    requestAnimationFrame(() => {
+      scheduled = false;
+      render();
+    });
+  };
+  document.addEventListener("input", schedule);
+  new MutationObserver(schedule).observe(document.body, {
+    childList: true,
+    subtree: true,
+    attributes: true,
+    attributeFilter: ["data-values"],
+  });
+  schedule();
+}
+"""
+
+
+def client_config() -> dict:
+    """The scoring registry in the shape the browser module consumes."""
+    lenses = {key: [] for key in scoring.LENS_KEYS}
+    for code, lens in scoring.COMPONENT_LENSES.items():
+        lenses[lens].append(code)
+    return {
+        "components": list(scoring.COMPONENT_CODES),
+        "benchmarks": dict(zip(scoring.COMPONENT_CODES, scoring.BENCHMARKS.tolist())),
+        "weights": dict(
+            zip(scoring.COMPONENT_CODES, scoring.INDICATOR_WEIGHTS.tolist())
+        ),
+        "splits": scoring.NOMINATION_SPLITS,
+        "lenses": lenses,
+    }
+
+
+def build_scoring_script(form_id: str) -> str:
+    """Generates the dashboard's client-side scoring module from app.utils.scoring.
+
+    Elements with data-score="<code|lens key|progress>" get their text, and
+    elements with data-score-bar/data-score-max get their width, recomputed
+    from the form's inputs on every keystroke without a server round trip.
+    Values not entered in the form come from the form's data-values JSON.
+    """
+    return _SCRIPT.replace("__CONFIG__", json.dumps(client_config())).replace(
+        "__FORM_ID__", form_id
+    )
@@ -0,0 +1,117 @@
+"""Load test of app.utils.ai_gateway against the local Gemini stand-in.
+
+Start the stand-in, then run from the repository root (needs google-genai):
+
+    python -m benchmarks.ai_stand_in --rate-429 0.1 --truncate-rate 0.05 &
+    python -m benchmarks.ai_gateway_bench --requests 60 --distinct 20 [--stream]
+
+Each request asks for recommendations for one of --distinct score profiles,
+so coalescing and the negative cache are exercised along with retries and
+the circuit breaker. Raise GOOGLE_AI_REQUESTS_PER_MINUTE to take the rate
+limiter out of the measurement.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+import urllib.request
+
+os.environ.setdefault("GOOGLE_AI_BASE_URL", "http://127.0.0.1:8765")
+
+from app.utils import ai_gateway  # noqa: E402
+from app.utils.recommendations import RECOMMENDATIONS_SCHEMA  # noqa: E402
+
+
+def _prompt(profile: int) -> str:
+    return f"Provide 3 recommendations for an institution scoring {profile}/100."
+
+
+async def _one(profile: int, stream: bool) -> tuple[str, float, float]:
+    """Returns (outcome, seconds to first item, seconds to completion)."""
+    start = time.perf_counter()
+    first = None
+    try:
+        if stream:
+            count = 0
+            async for _ in ai_gateway.stream_json_items(
+                _prompt(profile), RECOMMENDATIONS_SCHEMA
+            ):
+                count += 1
+                if first is None:
+                    first = time.perf_counter() - start
+        else:
+            data = await ai_gateway.generate_json(
+                _prompt(profile), RECOMMENDATIONS_SCHEMA
+            )
+            count = len(data["recommendations"])
+            first = time.perf_counter() - start
+        outcome = "ok" if count else "empty"
+    except ai_gateway.AICircuitOpenError:
+        outcome = "breaker_open"
+    except ai_gateway.AIGenerationError:
+        outcome = "fallback"
+    total = time.perf_counter() - start
+    return (outcome, total if first is None else first, total)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def _stand_in_stats(base_url: str) -> dict:
+    try:
+        with urllib.request.urlopen(f"{base_url}/stats", timeout=2) as response:
+            return json.loads(response.read())
+    except OSError:
+        return {}
+
+
+async def run(requests: int, distinct: int, stream: bool, spacing: float):
+    tasks = []
+    for i in range(requests):
+        tasks.append(asyncio.create_task(_one(i % distinct, stream)))
+        await asyncio.sleep(spacing)
+    return await asyncio.gather(*tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=60)
+    parser.add_argument("--distinct", type=int, default=20)
+    parser.add_argument("--stream", action="store_true")
+    parser.add_argument(
+        "--spacing-ms", type=float, default=0.0, help="Delay between launches."
+    )
+    args = parser.parse_args()
+    if not ai_gateway.AI_AVAILABLE:
+        parser.error("google-genai is not installed")
+    start = time.perf_counter()
+    results = asyncio.run(
+        run(args.requests, args.distinct, args.stream, args.spacing_ms / 1000)
+    )
+    elapsed = time.perf_counter() - start
+    outcomes = {}
+    for outcome, _, _ in results:
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    ok = [r for r in results if r[0] == "ok"]
+    first = [r[1] for r in ok]
+    total = [r[2] for r in ok]
+    print(f"{args.requests} requests in {elapsed:.2f}s: {outcomes}")
+    if ok:
+        print(
+            f"first item  p50 {statistics.median(first):.3f}s  p95 {_percentile(first, 0.95):.3f}s"
+        )
+        print(
+            f"completion  p50 {statistics.median(total):.3f}s  p95 {_percentile(total, 0.95):.3f}s"
+        )
+    print(f"stand-in: {_stand_in_stats(os.environ['GOOGLE_AI_BASE_URL'])}")
+
+
+if __name__ == "__main__":
+    main()
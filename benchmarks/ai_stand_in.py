@@ -0,0 +1,248 @@
+"""Local stand-in for the Gemini generateContent API, for offline load tests.
+
+Run from the repository root and point the app (or a benchmark) at it:
+
+    python -m benchmarks.ai_stand_in --port 8765 --latency-ms 800 --rate-429 0.1
+    GOOGLE_AI_BASE_URL=http://127.0.0.1:8765 reflex run
+
+It serves POST /<version>/models/<model>:generateContent and
+:streamGenerateContent (server-sent events, as the genai client requests
+with ?alt=sse). Responses are generated from the request's responseSchema,
+so the app's parsers see well-formed recommendations unless --truncate-rate
+cuts them short. Output depends only on --seed, the prompt and the order of
+requests, so runs are repeatable. GET /stats returns request counters and
+POST /stats/reset clears them.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_ROUTE = re.compile("^/[^/]+/models/([^/:]+):(generateContent|streamGenerateContent)$")
+_WORDS = (
+    "strengthen faculty research output through targeted grants partnerships "
+    "international collaboration employer engagement graduate outcomes mobility "
+    "programs sustainability reporting curriculum review student support metrics"
+).split()
+_ERRORS = {
+    HTTPStatus.TOO_MANY_REQUESTS: (
+        "RESOURCE_EXHAUSTED",
+        "Resource has been exhausted (e.g. check quota).",
+    ),
+    HTTPStatus.SERVICE_UNAVAILABLE: (
+        "UNAVAILABLE",
+        "The model is overloaded. Please try again later.",
+    ),
+}
+
+
+class StandInConfig:
+    """Fault and latency settings shared by all request handlers."""
+
+    def __init__(self, args: argparse.Namespace):
+        self.latency = args.latency_ms / 1000
+        self.jitter = args.jitter_ms / 1000
+        self.rate_429 = args.rate_429
+        self.rate_503 = args.rate_503
+        self.retry_after = args.retry_after
+        self.truncate_rate = args.truncate_rate
+        self.chunk_chars = max(1, args.chunk_chars)
+        self.chunk_delay = args.chunk_delay_ms / 1000
+        self.items = args.items
+        self.seed = args.seed
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self.stats: dict[str, int] = {}
+
+    def next_rng(self) -> random.Random:
+        """One generator per request, seeded by --seed and arrival order."""
+        with self._lock:
+            self._sequence += 1
+            return random.Random(f"{self.seed}:{self._sequence}")
+
+    def count(self, key: str):
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._sequence = 0
+            self.stats = {}
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[:1].upper() + text[1:] + "."
+
+
+def fake_value(schema: dict | None, rng: random.Random, items: int) -> object:
+    """Builds a value conforming to a Gemini response schema."""
+    if not schema:
+        return _sentence(rng, 12)
+    kind = str(schema.get("type", "STRING")).upper()
+    if kind == "OBJECT":
+        return {
+            name: fake_value(prop, rng, items)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "ARRAY":
+        return [fake_value(schema.get("items"), rng, items) for _ in range(items)]
+    if kind in ("NUMBER", "INTEGER"):
+        return rng.randint(0, 100)
+    if kind == "BOOLEAN":
+        return rng.random() < 0.5
+    if schema.get("enum"):
+        return rng.choice(schema["enum"])
+    return _sentence(rng, rng.randint(4, 30))
+
+
+def _candidate(text: str, finish_reason: str | None) -> dict:
+    candidate = {"content": {"role": "model", "parts": [{"text": text}]}, "index": 0}
+    if finish_reason:
+        candidate["finishReason"] = finish_reason
+    return candidate
+
+
+def _response(text: str, model: str, finish_reason: str | None = "STOP") -> dict:
+    return {"candidates": [_candidate(text, finish_reason)], "modelVersion": model}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config: StandInConfig
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, body: dict):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status: HTTPStatus):
+        api_status, message = _ERRORS[status]
+        if self.config.retry_after:
+            message += f" Please retry in {self.config.retry_after}s."
+        self._send_json(
+            status,
+            {"error": {"code": int(status), "message": message, "status": api_status}},
+        )
+
+    def do_GET(self):
+        if self.path.split("?")[0] == "/stats":
+            self._send_json(HTTPStatus.OK, dict(self.config.stats))
+            return
+        self._send_json(HTTPStatus.NOT_FOUND, {"error": {"message": "Not found"}})
+
+    def do_POST(self):
+        path = self.path.split("?")[0]
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if path == "/stats/reset":
+            self.config.reset()
+            self._send_json(HTTPStatus.OK, {})
+            return
+        route = _ROUTE.match(path)
+        if not route:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": {"message": "Not found"}})
+            return
+        model, method = route.groups()
+        config = self.config
+        rng = config.next_rng()
+        config.count("requests")
+        time.sleep(max(0.0, config.latency + rng.uniform(-1, 1) * config.jitter))
+        roll = rng.random()
+        if roll < config.rate_429:
+            config.count("429")
+            self._send_error(HTTPStatus.TOO_MANY_REQUESTS)
+            return
+        if roll < config.rate_429 + config.rate_503:
+            config.count("503")
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE)
+            return
+        generation = body.get("generationConfig") or {}
+        prompt = json.dumps(body.get("contents"), sort_keys=True)
+        content_rng = random.Random(
+            f"{config.seed}:{hashlib.sha256(prompt.encode()).hexdigest()}"
+        )
+        schema = generation.get("responseSchema")
+        if schema is not None or generation.get("responseMimeType") == (
+            "application/json"
+        ):
+            text = json.dumps(fake_value(schema, content_rng, config.items), indent=2)
+        else:
+            text = _sentence(content_rng, 40)
+        finish_reason = "STOP"
+        if rng.random() < config.truncate_rate:
+            config.count("truncated")
+            text = text[: int(len(text) * rng.uniform(0.3, 0.9))]
+            finish_reason = "MAX_TOKENS"
+        if method == "generateContent":
+            config.count("ok")
+            self._send_json(HTTPStatus.OK, _response(text, model, finish_reason))
+            return
+        self._stream(text, model, finish_reason)
+
+    def _stream(self, text: str, model: str, finish_reason: str):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        size = self.config.chunk_chars
+        chunks = [text[i : i + size] for i in range(0, len(text), size)] or [""]
+        try:
+            for index, chunk in enumerate(chunks):
+                last = index == len(chunks) - 1
+                event = _response(chunk, model, finish_reason if last else None)
+                self.wfile.write(f"data: {json.dumps(event)}\r\n\r\n".encode())
+                self.wfile.flush()
+                if not last:
+                    time.sleep(self.config.chunk_delay)
+            self.config.count("ok")
+        except (BrokenPipeError, ConnectionResetError):
+            self.config.count("client_disconnected")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=800.0)
+    parser.add_argument("--jitter-ms", type=float, default=200.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-503", type=float, default=0.0)
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=0.0,
+        help='Adds "Please retry in Ns." to error messages, as Google does.',
+    )
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--chunk-chars", type=int, default=40)
+    parser.add_argument("--chunk-delay-ms", type=float, default=30.0)
+    parser.add_argument("--items", type=int, default=3, help="Items per array.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    handler = type("Handler", (StandInHandler,), {"config": StandInConfig(args)})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"Gemini stand-in listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
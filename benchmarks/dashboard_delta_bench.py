@@ -0,0 +1,154 @@
+"""Websocket delta and stored-state sizes for the assessment dashboard.
+
+Run from the repository root (needs reflex):
+
+    python -m benchmarks.dashboard_delta_bench [--files 10]
+
+"split" is the current layout: DashboardState as coordinator plus one
+substate per lens. "monolithic" puts the same vars on one state, as
+DashboardState was before the split, so both layouts hold identical data.
+Each scenario is applied to a populated dashboard. The benchmark reports the
+JSON size of the delta sent to the browser and the pickled size of the
+states the event touched, which is what a Redis state manager rewrites.
+"""
+
+import argparse
+import json
+import pickle
+
+import reflex as rx
+
+from app.states import dashboard_state
+from app.states.dashboard_state import (
+    FIELD_STATES,
+    DashboardState,
+    FormalAssessmentState,
+)
+
+SPLIT_STATES = (DashboardState, *dashboard_state.LENS_STATES, FormalAssessmentState)
+
+
+def _plain(value):
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def has_validation_errors(self) -> bool:
+    return any(self.validation_errors.values())
+
+
+def _build_monolith(root: rx.State) -> type[rx.State]:
+    """A single state class with every var of the split layout and its defaults."""
+    annotations = {}
+    defaults = {}
+    for cls in SPLIT_STATES:
+        instance = root.get_substate(cls.get_full_name().split("."))
+        for name, annotation in cls.__annotations__.items():
+            annotations[name] = annotation
+            defaults[name] = _plain(getattr(instance, name))
+    namespace = {
+        "__annotations__": annotations,
+        "__module__": __name__,
+        "has_validation_errors": rx.var(cache=True)(has_validation_errors),
+        **defaults,
+    }
+    return type("MonolithicDashboardState", (rx.State,), namespace)
+
+
+def _serialize(state: rx.State) -> bytes:
+    serialize = getattr(state, "_serialize", None)
+    return serialize() if serialize else pickle.dumps(state)
+
+
+def _populate(targets: dict[str, rx.State], files: int):
+    """Fills every indicator and evidence list, as on_load does for a real institution."""
+    for field in FIELD_STATES:
+        state = targets[field]
+        if field.startswith("uploaded_"):
+            lens = field.removeprefix("uploaded_").removesuffix("_files")
+            value = [
+                f"institution_1/{lens}/ab12cd_evidence_{i}.pdf" for i in range(files)
+            ]
+        elif field == "international_student_diversity":
+            value = "Students from 42 countries across five regions."
+        else:
+            value = 55
+        setattr(state, field, value)
+
+
+def _measure(root: rx.State, states: list[rx.State], apply) -> tuple[int, int]:
+    root.get_delta()
+    root._clean()
+    apply()
+    touched = [state for state in states if state.dirty_vars]
+    delta = root.get_delta()
+    root._clean()
+    return (
+        len(json.dumps(delta, default=str)),
+        sum(len(_serialize(state)) for state in touched),
+    )
+
+
+def run(files: int) -> list[tuple[str, str, int, int]]:
+    root = rx.State(_reflex_internal_init=True)
+    monolith_cls = _build_monolith(root)
+    root = rx.State(_reflex_internal_init=True)
+
+    def substate(cls):
+        return root.get_substate(cls.get_full_name().split("."))
+
+    coordinator = substate(DashboardState)
+    split = [substate(cls) for cls in SPLIT_STATES]
+    monolith = substate(monolith_cls)
+    split_targets = {field: substate(cls) for field, cls in FIELD_STATES.items()}
+    _populate(split_targets, files)
+    _populate({field: monolith for field in FIELD_STATES}, files)
+    research = split_targets["international_nominations"]
+
+    def split_edit():
+        value = coordinator._validate_and_clamp("international_nominations", "72")
+        research.international_nominations = value
+
+    def monolith_edit():
+        monolith.validation_errors["international_nominations"] = ""
+        monolith.international_nominations = 72
+
+    def split_progress():
+        research.upload_progress_research = 60
+
+    def monolith_progress():
+        monolith.upload_progress_research = 60
+
+    def split_formal():
+        substate(FormalAssessmentState).formal_research_score = 80
+
+    def monolith_formal():
+        monolith.formal_research_score = 80
+
+    results = []
+    for scenario, split_apply, monolith_apply in (
+        ("edit one indicator", split_edit, monolith_edit),
+        ("upload progress tick", split_progress, monolith_progress),
+        ("formal score edit", split_formal, monolith_formal),
+    ):
+        results.append(
+            (scenario, "monolithic", *_measure(root, [monolith], monolith_apply))
+        )
+        results.append((scenario, "split", *_measure(root, split, split_apply)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=10, help="Evidence files per lens.")
+    args = parser.parse_args()
+    print(f"{'scenario':<22} {'layout':<11} {'delta bytes':>12} {'stored bytes':>13}")
+    for scenario, layout, delta, stored in run(args.files):
+        print(f"{scenario:<22} {layout:<11} {delta:>12} {stored:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""EXPLAIN check that every registered hot query is served by an index.
+
+Run from the repository root against a local Postgres (the app's db_url):
+
+    python -m benchmarks.index_advisor [--rows 2000] [--max-seq-rows 1000]
+
+It applies pending migrations, then seeds --rows synthetic institutions with
+scores, reviews, historical records and reset tokens, ANALYZEs, and runs
+EXPLAIN on each query in HOT_QUERIES. Seeding and planning share one
+transaction that is rolled back, so nothing is left behind. The check fails
+(exit status 1) when a plan sequentially scans a table estimated at more than
+--max-seq-rows rows. Register new hot queries here together with the
+migration that indexes them.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import reflex as rx
+from sqlalchemy import text
+from app.utils import migrations
+from app.utils.computed_scores import report_page_query
+from app.utils.institution_search import SEARCH_SQL, institution_page_query
+
+HOT_QUERIES = {
+    "dashboard scores": (
+        """
+        SELECT i.code, s.value, s.value_numeric, s.evidence_files, s.review_status
+        FROM institution_scores s
+        JOIN ranking_indicators i ON s.indicator_id = i.id
+        WHERE s.institution_id = :inst_id AND s.ranking_year = 2025
+        """
+    ),
+    "analytics scores": (
+        """
+        SELECT i.code, s.value_numeric, s.value, s.review_status
+        FROM institution_scores s
+        JOIN ranking_indicators i ON s.indicator_id = i.id
+        WHERE s.institution_id = :inst_id AND s.ranking_year = 2025
+        """
+    ),
+    "indicator totals for a year": (
+        """
+        SELECT SUM(value_numeric::numeric), COUNT(value_numeric)
+        FROM institution_scores
+        WHERE ranking_year = 2025 AND indicator_id = :indicator_id
+        """
+    ),
+    "latest reviews": (
+        """
+        SELECT id, status, reviewer_name, comments
+        FROM institution_reviews
+        WHERE institution_id = :inst_id
+        ORDER BY id DESC
+        LIMIT 10
+        """
+    ),
+    "historical trend": (
+        """
+        SELECT ranking_year, overall_score, academic_reputation
+        FROM historical_performance
+        WHERE institution_id = :inst_id
+        ORDER BY ranking_year ASC
+        """
+    ),
+    "historical year": (
+        """
+        SELECT overall_score FROM historical_performance
+        WHERE institution_id = :inst_id AND ranking_year = 2024
+        """
+    ),
+    "reset token": (
+        "SELECT id, expires_at, used FROM password_reset_tokens WHERE token = :token"
+    ),
+    "computed scores": (
+        """
+        SELECT overall_score FROM institution_computed_scores
+        WHERE institution_id = :inst_id AND ranking_year = 2025
+        """
+    ),
+    "login": (
+        """
+        SELECT id, password_hash, first_name FROM users
+        WHERE email = :email AND auth_provider = 'email'
+        """
+    ),
+    "institution search": SEARCH_SQL,
+    "institutions page": institution_page_query(
+        "", "name", False, ("Index Check University 1000", 0), 10
+    )[0],
+    "reports page": report_page_query(
+        "", "name", False, ("Index Check University 1000", 0), 10
+    )[0],
+}
+SEED_STATEMENTS = (
+    """
+    INSERT INTO users (first_name, last_name, position, institution_name, email)
+    SELECT 'Index', 'Check', 'Staff', 'Index Check', 'index-check-' || g || '@example.invalid'
+    FROM generate_series(1, :rows) g
+    """,
+    """
+    INSERT INTO institutions (institution_name, street_address, city_municipality)
+    SELECT 'Index Check University ' || g, 'Street', 'City'
+    FROM generate_series(1, :rows) g
+    """,
+    """
+    INSERT INTO institution_scores
+        (institution_id, indicator_id, value, value_numeric, ranking_year, review_status)
+    SELECT i.id, ri.id, '50', 50, y, 'In Progress'
+    FROM institutions i
+    CROSS JOIN ranking_indicators ri
+    CROSS JOIN generate_series(2023, 2025) y
+    WHERE i.institution_name LIKE 'Index Check University %'
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO institution_reviews (institution_id, status, reviewer_name, comments)
+    SELECT i.id, 'Reviewed', 'Index Check', 'Seeded review'
+    FROM institutions i CROSS JOIN generate_series(1, 3)
+    WHERE i.institution_name LIKE 'Index Check University %'
+    """,
+    """
+    INSERT INTO historical_performance (institution_id, ranking_year, overall_score)
+    SELECT i.id, y, 50
+    FROM institutions i CROSS JOIN generate_series(2020, 2024) y
+    WHERE i.institution_name LIKE 'Index Check University %'
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO institution_computed_scores (institution_id, ranking_year, overall_score)
+    SELECT i.id, 2025, 50
+    FROM institutions i
+    WHERE i.institution_name LIKE 'Index Check University %'
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO password_reset_tokens (user_id, token, expires_at)
+    SELECT u.id, md5(random()::text || u.id), CURRENT_TIMESTAMP + INTERVAL '1 hour'
+    FROM users u
+    WHERE u.email LIKE 'index-check-%'
+    """,
+)
+ANALYZED_TABLES = (
+    "users",
+    "institutions",
+    "institution_scores",
+    "institution_reviews",
+    "historical_performance",
+    "institution_computed_scores",
+    "password_reset_tokens",
+)
+
+
+async def _sample_params(session) -> dict:
+    """Values for the query parameters, taken from the seeded rows."""
+    row = (
+        await session.execute(
+            text("""
+            SELECT
+                (SELECT MAX(id) FROM institutions),
+                (SELECT MIN(id) FROM ranking_indicators),
+                (SELECT token FROM password_reset_tokens ORDER BY id DESC LIMIT 1),
+                (SELECT email FROM users ORDER BY id DESC LIMIT 1)
+            """)
+        )
+    ).first()
+    return {
+        "inst_id": row[0] or 0,
+        "indicator_id": row[1] or 0,
+        "token": row[2] or "",
+        "email": row[3] or "",
+        "query": "Check Univrsity 42",
+        "pattern": "%Check Univrsity 42%",
+        "prefix": "Check Univrsity 42%",
+        "id": None,
+        "limit": 8,
+        "after_key": "Index Check University 1000",
+        "after_id": 0,
+        "year": 2025,
+    }
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    """Relation names of every Seq Scan node in an EXPLAIN (FORMAT JSON) plan."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+async def check(rows: int, max_seq_rows: float) -> list[tuple[str, str, float]]:
+    """Returns (query, table, estimated rows) for every offending sequential scan."""
+    await migrations.migrate()
+    failures = []
+    async with rx.asession() as session:
+        try:
+            for statement in SEED_STATEMENTS:
+                await session.execute(text(statement), {"rows": rows})
+            await session.execute(text(f"ANALYZE {', '.join(ANALYZED_TABLES)}"))
+            params = await _sample_params(session)
+            for name, sql in HOT_QUERIES.items():
+                result = await session.execute(
+                    text(f"EXPLAIN (FORMAT JSON) {sql}"), params
+                )
+                plan = result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                for table in _seq_scans(plan[0]["Plan"]):
+                    size = await session.execute(
+                        text(
+                            "SELECT reltuples FROM pg_class WHERE oid = to_regclass(:t)"
+                        ),
+                        {"t": table},
+                    )
+                    estimated = float(size.scalar() or 0)
+                    if estimated > max_seq_rows:
+                        failures.append((name, table, estimated))
+        finally:
+            await session.rollback()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, default=2000, help="Synthetic institutions to seed."
+    )
+    parser.add_argument(
+        "--max-seq-rows",
+        type=float,
+        default=1000,
+        help="Largest table a hot query may scan sequentially.",
+    )
+    args = parser.parse_args()
+    failures = asyncio.run(check(args.rows, args.max_seq_rows))
+    for name, table, estimated in failures:
+        print(f"FAIL {name}: sequential scan of {table} (~{estimated:.0f} rows)")
+    if failures:
+        sys.exit(1)
+    print(f"All {len(HOT_QUERIES)} hot queries use indexes.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Microbenchmarks: app.utils.json_stream against the former regex repair.
+
+Run from the repository root:
+
+    python -m benchmarks.json_parser_bench [--repeat N]
+
+For each sample response, the script reports:
+- the mean parse time per call
+- whether each approach produced a schema-valid result
+- for streaming, how far into the text the first recommendation became available
+"""
+
+import argparse
+import json
+import re
+import timeit
+from app.utils.json_stream import JSONStreamParser, JSONStreamError, parse
+from app.utils.recommendations import RECOMMENDATIONS_SCHEMA
+
+
+def legacy_clean_json_response(text: str) -> str:
+    """The regex repair previously in AnalyticsState._clean_json_response."""
+    if not text:
+        return ""
+    text = re.sub("(?:json)?\\n?", "", text)
+    text = re.sub("", "", text).strip()
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1:
+        if end == -1 or end < start:
+            text = text[start:]
+            open_brackets = text.count("[") - text.count("]")
+            open_braces = text.count("{") - text.count("}")
+            text += "]" * max(0, open_brackets) + "}" * max(0, open_braces)
+        else:
+            text = text[start : end + 1]
+    text = re.sub("'([^']+)'\\s*:", '"\\1":', text)
+    text = re.sub(":\\s*'([^']*)'(\\s*[,}\\]])", ': "\\1"\\2', text)
+    text = re.sub(",\\s*([}\\]])", "\\1", text)
+    text = re.sub('(")\\s*\\n\\s*(")', "\\1,\\n\\2", text)
+    text = re.sub('(\\d|true|false|null)\\s*\\n\\s*"', '\\1,\\n"', text)
+    text = re.sub("[\\x00-\\x1f\\x7f-\\x9f]", " ", text)
+    text = text.strip()
+    if not text.startswith("{"):
+        text = "{" + text
+    if not text.endswith("}"):
+        text = text + "}"
+    return text
+
+
+def legacy_parse(text: str):
+    data = json.loads(legacy_clean_json_response(text))
+    recs = data.get("recommendations") or []
+    if not all(
+        isinstance(r, dict)
+        and all(k in r for k in ("title", "description", "category", "priority"))
+        for r in recs
+    ):
+        raise ValueError("schema")
+    return data
+
+
+def _recommendation(i: int) -> dict:
+    return {
+        "title": f"Strengthen research output area {i}",
+        "description": "Increase Scopus-indexed publications through faculty grants, "
+        "writing workshops and co-authorship with partner universities. " * 3,
+        "category": "Research & Discovery",
+        "priority": "High",
+    }
+
+
+def samples() -> dict[str, str]:
+    valid = json.dumps({"recommendations": [_recommendation(i) for i in range(4)]})
+    pretty = json.dumps(
+        {"recommendations": [_recommendation(i) for i in range(4)]}, indent=2
+    )
+    return {
+        "valid": valid,
+        "markdown_fenced": f"```json\n{pretty}\n```",
+        "truncated": pretty[: int(len(pretty) * 0.8)],
+        "trailing_commas": pretty.replace('"High"\n', '"High",\n'),
+        "single_quoted": valid.replace('"', "'"),
+        "raw_newlines": valid.replace("workshops and", "workshops\nand"),
+        "inner_quotes": valid.replace("writing workshops", 'writing "workshops"'),
+    }
+
+
+def _mean_us(fn, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def _succeeds(fn) -> str:
+    try:
+        result = fn()
+    except (ValueError, JSONStreamError):
+        return "fail"
+    return f"ok({len(result['recommendations'])})"
+
+
+def _first_item_offset(text: str, chunk: int = 16) -> str:
+    parser = JSONStreamParser(RECOMMENDATIONS_SCHEMA)
+    for offset in range(0, len(text), chunk):
+        if parser.feed(text[offset : offset + chunk]):
+            return f"{min(offset + chunk, len(text)) / len(text):.0%}"
+    return "-"
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=2000)
+    args = arg_parser.parse_args()
+    header = f"{'sample':<16} {'regex us':>9} {'regex':>8} {'stream us':>10} {'stream':>8} {'1st item':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, text in samples().items():
+        legacy = _succeeds(lambda: legacy_parse(text))
+        legacy_us = (
+            _mean_us(lambda: legacy_parse(text), args.repeat)
+            if legacy != "fail"
+            else _mean_us(lambda: _succeeds(lambda: legacy_parse(text)), args.repeat)
+        )
+        current = _succeeds(lambda: parse(text, RECOMMENDATIONS_SCHEMA))
+        current_us = _mean_us(
+            lambda: _succeeds(lambda: parse(text, RECOMMENDATIONS_SCHEMA)), args.repeat
+        )
+        print(
+            f"{name:<16} {legacy_us:>9.1f} {legacy:>8} {current_us:>10.1f} {current:>8} {_first_item_offset(text):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+-- Numeric copy of institution_scores.value. Nullable without a default, so
+-- adding it is catalog-only; existing rows are filled by
+-- app.utils.numeric_scores.backfill_numeric_values after startup.
+ALTER TABLE institution_scores ADD COLUMN IF NOT EXISTS value_numeric DOUBLE PRECISION;
@@ -0,0 +1,17 @@
+-- Materialized per-institution lens scores read by /reports and /analytics.
+CREATE TABLE IF NOT EXISTS institution_computed_scores (
+    institution_id INTEGER NOT NULL REFERENCES institutions(id) ON DELETE CASCADE,
+    ranking_year INTEGER NOT NULL,
+    research_score INTEGER NOT NULL DEFAULT 0,
+    employability_score INTEGER NOT NULL DEFAULT 0,
+    global_engagement_score INTEGER NOT NULL DEFAULT 0,
+    learning_experience_score INTEGER NOT NULL DEFAULT 0,
+    sustainability_score INTEGER NOT NULL DEFAULT 0,
+    overall_score INTEGER NOT NULL DEFAULT 0,
+    indicator_count INTEGER NOT NULL DEFAULT 0,
+    status VARCHAR(50) NOT NULL DEFAULT 'Pending',
+    evidence_files TEXT NOT NULL DEFAULT '[]',
+    last_update TIMESTAMP WITH TIME ZONE,
+    refreshed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (institution_id, ranking_year)
+);
@@ -0,0 +1,12 @@
+"""Fills institution_computed_scores from institution_scores when it is empty."""
+
+from sqlalchemy import text
+from app.utils.computed_scores import refresh_computed_scores
+
+
+async def upgrade(session):
+    result = await session.execute(
+        text("SELECT COUNT(*) FROM institution_computed_scores")
+    )
+    if result.scalar() == 0:
+        await refresh_computed_scores(session)
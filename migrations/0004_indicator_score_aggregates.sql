@@ -0,0 +1,50 @@
+-- Running (indicator, ranking_year) totals behind the NCR averages. The
+-- trigger and the initial totals are installed in one transaction while
+-- institution_scores is locked against writes, so no change can slip in
+-- between the snapshot and the trigger taking over.
+CREATE TABLE IF NOT EXISTS indicator_score_aggregates (
+    indicator_id INTEGER NOT NULL,
+    ranking_year INTEGER NOT NULL,
+    value_sum NUMERIC NOT NULL DEFAULT 0,
+    value_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (indicator_id, ranking_year)
+);
+
+LOCK TABLE institution_scores IN SHARE ROW EXCLUSIVE MODE;
+
+CREATE OR REPLACE FUNCTION maintain_indicator_score_aggregates()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.value_numeric IS NOT NULL THEN
+        UPDATE indicator_score_aggregates
+        SET value_sum = value_sum - OLD.value_numeric::numeric,
+            value_count = value_count - 1
+        WHERE indicator_id = OLD.indicator_id
+          AND ranking_year = OLD.ranking_year;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.value_numeric IS NOT NULL THEN
+        INSERT INTO indicator_score_aggregates
+            (indicator_id, ranking_year, value_sum, value_count)
+        VALUES (NEW.indicator_id, NEW.ranking_year, NEW.value_numeric::numeric, 1)
+        ON CONFLICT (indicator_id, ranking_year) DO UPDATE SET
+            value_sum = indicator_score_aggregates.value_sum + EXCLUDED.value_sum,
+            value_count = indicator_score_aggregates.value_count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS institution_scores_running_aggregates ON institution_scores;
+
+CREATE TRIGGER institution_scores_running_aggregates
+AFTER INSERT OR DELETE OR UPDATE OF value_numeric, indicator_id, ranking_year
+ON institution_scores
+FOR EACH ROW EXECUTE FUNCTION maintain_indicator_score_aggregates();
+
+DELETE FROM indicator_score_aggregates;
+
+INSERT INTO indicator_score_aggregates (indicator_id, ranking_year, value_sum, value_count)
+SELECT indicator_id, ranking_year, SUM(value_numeric::numeric), COUNT(value_numeric)
+FROM institution_scores
+WHERE value_numeric IS NOT NULL
+GROUP BY indicator_id, ranking_year;
@@ -0,0 +1,9 @@
+-- Generated AI recommendations keyed by prompt fingerprint.
+CREATE TABLE IF NOT EXISTS ai_recommendations (
+    fingerprint CHAR(64) PRIMARY KEY,
+    kind VARCHAR(50) NOT NULL,
+    template_version VARCHAR(20) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
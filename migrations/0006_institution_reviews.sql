@@ -0,0 +1,8 @@
+-- Reviewer decisions shown on /reports and as notifications.
+CREATE TABLE IF NOT EXISTS institution_reviews (
+    id SERIAL PRIMARY KEY,
+    institution_id INTEGER NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    reviewer_name VARCHAR(255),
+    comments TEXT
+);
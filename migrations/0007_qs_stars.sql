@@ -0,0 +1,37 @@
+-- QS Stars post-assessment audit, indicator scores and action plans.
+CREATE TABLE IF NOT EXISTS qs_stars_assessments (
+    id SERIAL PRIMARY KEY,
+    institution_id INTEGER NOT NULL,
+    methodology_version VARCHAR(50),
+    overall_stars INTEGER DEFAULT 0,
+    teaching_stars INTEGER DEFAULT 0,
+    employability_stars INTEGER DEFAULT 0,
+    academic_development_stars INTEGER DEFAULT 0,
+    inclusiveness_stars INTEGER DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(institution_id)
+);
+
+CREATE TABLE IF NOT EXISTS qs_indicator_scores (
+    id SERIAL PRIMARY KEY,
+    assessment_id INTEGER REFERENCES qs_stars_assessments(id),
+    indicator_name VARCHAR(255),
+    category VARCHAR(100),
+    points_achieved DECIMAL(10, 2),
+    max_score DECIMAL(10, 2),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(assessment_id, indicator_name)
+);
+
+CREATE TABLE IF NOT EXISTS qs_action_plans (
+    id SERIAL PRIMARY KEY,
+    assessment_id INTEGER REFERENCES qs_stars_assessments(id),
+    indicator_name VARCHAR(255),
+    current_score DECIMAL(10, 2),
+    target_score DECIMAL(10, 2),
+    notes TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(assessment_id, indicator_name)
+);
@@ -0,0 +1,28 @@
+-- Default ranking lenses and indicators, for databases that have none yet.
+INSERT INTO ranking_lenses (lens_name, total_weight_pct)
+SELECT lens_name, total_weight_pct
+FROM (VALUES
+    ('Research & Discovery', 50.0),
+    ('Employability & Outcomes', 20.0),
+    ('Global Engagement', 15.0),
+    ('Learning Experience', 10.0),
+    ('Sustainability', 5.0)
+) AS v(lens_name, total_weight_pct)
+WHERE NOT EXISTS (SELECT 1 FROM ranking_lenses);
+
+INSERT INTO ranking_indicators (lens_id, indicator_name, code, indicator_weight_pct)
+SELECT l.id, v.indicator_name, v.code, v.indicator_weight_pct
+FROM (VALUES
+    ('Research & Discovery', 'Academic Reputation', 'academic_reputation', 30.0),
+    ('Research & Discovery', 'Citations per Faculty', 'citations_per_faculty', 20.0),
+    ('Employability & Outcomes', 'Employer Reputation', 'employer_reputation', 15.0),
+    ('Employability & Outcomes', 'Employment Outcomes', 'employment_outcomes', 5.0),
+    ('Global Engagement', 'International Research Network', 'international_research_network', 5.0),
+    ('Global Engagement', 'International Faculty Ratio', 'international_faculty_ratio', 5.0),
+    ('Global Engagement', 'International Student Ratio', 'international_student_ratio', 5.0),
+    ('Global Engagement', 'International Student Diversity', 'international_student_diversity', 0.0),
+    ('Learning Experience', 'Faculty-Student Ratio', 'faculty_student_ratio', 10.0),
+    ('Sustainability', 'Sustainability Metrics', 'sustainability_metrics', 5.0)
+) AS v(lens_name, indicator_name, code, indicator_weight_pct)
+JOIN ranking_lenses l ON l.lens_name = v.lens_name
+WHERE NOT EXISTS (SELECT 1 FROM ranking_indicators);
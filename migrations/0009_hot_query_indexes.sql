@@ -0,0 +1,18 @@
+-- Indexes for the hot queries registered in benchmarks/index_advisor.py.
+-- historical_performance (institution_id, ranking_year) is already served
+-- by the unique constraint its ON CONFLICT upsert relies on, and reset token
+-- lookups by password_reset_tokens_token_key.
+
+-- Dashboard and analytics load one institution's scores for a year.
+CREATE INDEX IF NOT EXISTS institution_scores_institution_year_idx
+    ON institution_scores (institution_id, ranking_year)
+    INCLUDE (indicator_id, value, value_numeric, review_status);
+
+-- Per-indicator aggregates for a ranking year.
+CREATE INDEX IF NOT EXISTS institution_scores_year_indicator_idx
+    ON institution_scores (ranking_year, indicator_id)
+    INCLUDE (value_numeric);
+
+-- Latest reviews of an institution (notifications).
+CREATE INDEX IF NOT EXISTS institution_reviews_institution_idx
+    ON institution_reviews (institution_id, id DESC);
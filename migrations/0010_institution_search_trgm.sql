@@ -0,0 +1,14 @@
+-- Trigram indexes for institution search (app/utils/institution_search.py).
+-- Both serve ILIKE '%q%' substring matches; the name index also serves the
+-- <% word-similarity operator that tolerates typos in the typeahead.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS institutions_name_trgm_idx
+    ON institutions USING gin (institution_name gin_trgm_ops);
+
+-- Must match address_expr() in institution_search.py for the planner to use it.
+CREATE INDEX IF NOT EXISTS institutions_address_trgm_idx
+    ON institutions USING gin (
+        (COALESCE(street_address, '') || ', ' || COALESCE(city_municipality, ''))
+        gin_trgm_ops
+    );
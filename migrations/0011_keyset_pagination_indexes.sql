@@ -0,0 +1,4 @@
+-- Keyset pagination of the institutions and reports tables walks this index
+-- in name order (see app/utils/keyset.py); id breaks ties between equal names.
+CREATE INDEX IF NOT EXISTS institutions_name_id_idx
+    ON institutions (institution_name, id);
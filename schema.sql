@@ -16,3 +16,114 @@ CREATE TABLE users (
 	CONSTRAINT users_google_id_key UNIQUE NULLS DISTINCT (google_id)
 )
 
+;
+
+CREATE TABLE institutions (
+	id SERIAL NOT NULL, 
+	institution_name VARCHAR(255) NOT NULL, 
+	admin_name VARCHAR(255), 
+	contact_number VARCHAR(50), 
+	street_address VARCHAR(255), 
+	city_municipality VARCHAR(100), 
+	region VARCHAR(100), 
+	zip_code VARCHAR(20), 
+	ranking_framework VARCHAR(50) DEFAULT 'QS'::character varying, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP, 
+	CONSTRAINT institutions_pkey PRIMARY KEY (id)
+)
+
+;
+
+CREATE TABLE ranking_lenses (
+	id SERIAL NOT NULL, 
+	lens_name VARCHAR(255) NOT NULL, 
+	total_weight_pct DOUBLE PRECISION NOT NULL, 
+	CONSTRAINT ranking_lenses_pkey PRIMARY KEY (id)
+)
+
+;
+
+CREATE TABLE ranking_indicators (
+	id SERIAL NOT NULL, 
+	lens_id INTEGER NOT NULL, 
+	indicator_name VARCHAR(255) NOT NULL, 
+	code VARCHAR(100) NOT NULL, 
+	indicator_weight_pct DOUBLE PRECISION DEFAULT 0 NOT NULL, 
+	CONSTRAINT ranking_indicators_pkey PRIMARY KEY (id), 
+	CONSTRAINT ranking_indicators_code_key UNIQUE NULLS DISTINCT (code), 
+	CONSTRAINT ranking_indicators_lens_id_fkey FOREIGN KEY(lens_id) REFERENCES ranking_lenses (id) ON DELETE CASCADE
+)
+
+;
+
+CREATE TABLE institution_scores (
+	id SERIAL NOT NULL, 
+	institution_id INTEGER NOT NULL, 
+	indicator_id INTEGER NOT NULL, 
+	user_id INTEGER, 
+	value TEXT, 
+	evidence_files TEXT DEFAULT '[]'::text, 
+	ranking_year INTEGER NOT NULL, 
+	review_status VARCHAR(50), 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP, 
+	CONSTRAINT institution_scores_pkey PRIMARY KEY (id), 
+	CONSTRAINT institution_scores_institution_id_indicator_id_ranking_year_key UNIQUE NULLS DISTINCT (institution_id, indicator_id, ranking_year), 
+	CONSTRAINT institution_scores_institution_id_fkey FOREIGN KEY(institution_id) REFERENCES institutions (id) ON DELETE CASCADE, 
+	CONSTRAINT institution_scores_indicator_id_fkey FOREIGN KEY(indicator_id) REFERENCES ranking_indicators (id), 
+	CONSTRAINT institution_scores_user_id_fkey FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE SET NULL
+)
+
+;
+
+CREATE TABLE historical_performance (
+	id SERIAL NOT NULL, 
+	institution_id INTEGER NOT NULL, 
+	ranking_year INTEGER NOT NULL, 
+	academic_reputation INTEGER DEFAULT 0, 
+	citations_per_faculty INTEGER DEFAULT 0, 
+	research_score INTEGER DEFAULT 0, 
+	employer_reputation INTEGER DEFAULT 0, 
+	employment_outcomes INTEGER DEFAULT 0, 
+	employability_score INTEGER DEFAULT 0, 
+	international_research_network INTEGER DEFAULT 0, 
+	international_faculty_ratio INTEGER DEFAULT 0, 
+	international_student_ratio INTEGER DEFAULT 0, 
+	global_engagement_score INTEGER DEFAULT 0, 
+	faculty_student_ratio INTEGER DEFAULT 0, 
+	learning_experience_score INTEGER DEFAULT 0, 
+	sustainability_metrics INTEGER DEFAULT 0, 
+	sustainability_score INTEGER DEFAULT 0, 
+	overall_score INTEGER DEFAULT 0, 
+	evidence_files TEXT DEFAULT '[]'::text, 
+	user_id INTEGER, 
+	data_source VARCHAR(50), 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP, 
+	CONSTRAINT historical_performance_pkey PRIMARY KEY (id), 
+	CONSTRAINT historical_performance_institution_id_ranking_year_key UNIQUE NULLS DISTINCT (institution_id, ranking_year), 
+	CONSTRAINT historical_performance_institution_id_fkey FOREIGN KEY(institution_id) REFERENCES institutions (id) ON DELETE CASCADE
+)
+
+;
+
+CREATE TABLE historical_scores (
+	id SERIAL NOT NULL, 
+	institution_id INTEGER NOT NULL, 
+	ranking_year INTEGER NOT NULL, 
+	CONSTRAINT historical_scores_pkey PRIMARY KEY (id), 
+	CONSTRAINT historical_scores_institution_id_fkey FOREIGN KEY(institution_id) REFERENCES institutions (id) ON DELETE CASCADE
+)
+
+;
+
+CREATE TABLE password_reset_tokens (
+	id SERIAL NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	token VARCHAR(255) NOT NULL, 
+	expires_at TIMESTAMP WITH TIME ZONE NOT NULL, 
+	used BOOLEAN DEFAULT false NOT NULL, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP, 
+	CONSTRAINT password_reset_tokens_pkey PRIMARY KEY (id), 
+	CONSTRAINT password_reset_tokens_token_key UNIQUE NULLS DISTINCT (token), 
+	CONSTRAINT password_reset_tokens_user_id_fkey FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE
+)